@@ -225,6 +225,8 @@ class Settings:
     db_pool_timeout_seconds: int
     db_pool_recycle_seconds: int
     db_pool_pre_ping: bool
+    db_query_cache_size: int
+    app_threadpool_size: int
     sqlite_busy_timeout_ms: int
     sqlite_enable_wal: bool
     http_pool_connections: int
@@ -341,6 +343,9 @@ settings = Settings(
     db_pool_timeout_seconds=max(int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")), 1),
     db_pool_recycle_seconds=max(int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800")), 30),
     db_pool_pre_ping=_to_bool(os.getenv("DB_POOL_PRE_PING"), default=True),
+    db_query_cache_size=_to_int(os.getenv("DB_QUERY_CACHE_SIZE"), 5000, minimum=0),
+    # 0 sizes the request threadpool to db_pool_size + db_max_overflow.
+    app_threadpool_size=_to_int(os.getenv("APP_THREADPOOL_SIZE"), 0, minimum=0),
     sqlite_busy_timeout_ms=max(int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "10000")), 1000),
     sqlite_enable_wal=_to_bool(os.getenv("SQLITE_ENABLE_WAL"), default=True),
     http_pool_connections=max(int(os.getenv("HTTP_POOL_CONNECTIONS", "32")), 1),
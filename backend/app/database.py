@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import anyio.to_thread
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.config import is_sqlite_database_url, settings
 
+# AnyIO's own default worker thread count.
+DEFAULT_REQUEST_THREADPOOL_SIZE = 40
+
 
 if is_sqlite_database_url(settings.database_url):
     # Ensure sqlite target folder exists when using local file path.
@@ -18,6 +22,9 @@ if is_sqlite_database_url(settings.database_url):
 engine_kwargs: dict[str, object] = {
     "future": True,
     "pool_pre_ping": settings.db_pool_pre_ping,
+    # SQLAlchemy's default of 500 compiled statements is too small for the number of
+    # distinct select()/lambda_stmt() shapes the routers issue, so entries would churn.
+    "query_cache_size": settings.db_query_cache_size,
 }
 connect_args: dict[str, object] = {}
 
@@ -81,3 +88,13 @@ def get_db() -> Session:
         raise
     finally:
         db.close()
+
+
+def configure_request_threadpool() -> None:
+    # Sync route handlers run on AnyIO's worker threads (40 by default). Grow the limiter to the
+    # DB pool so requests wait on the pool rather than on free threads, but never shrink it below
+    # the default: auth and payments handlers also block on slow outbound HTTP calls.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.app_threadpool_size or max(
+        DEFAULT_REQUEST_THREADPOOL_SIZE,
+        settings.db_pool_size + settings.db_max_overflow,
+    )
@@ -33,7 +33,7 @@ from app.config import (
     POLZA_STORY_SERVICE_TEXT_MODEL,
     settings,
 )
-from app.database import SessionLocal
+from app.database import SessionLocal, configure_request_threadpool
 from app.models import (
     StoryGame,
     StoryMemoryBlock,
@@ -120,6 +120,7 @@ from app.services.auth_identity import (
 )
 from app.services.auth_verification import close_http_session as _close_auth_verification_http_session
 from app.services.db_bootstrap import StoryBootstrapDefaults, bootstrap_database
+from app.services.json_streaming import FastJSONResponse
 from app.services.concurrency import (
     add_user_tokens as _add_user_tokens_raw,
     spend_user_tokens_if_sufficient as _spend_user_tokens_if_sufficient_raw,
@@ -1656,7 +1657,7 @@ def _build_story_narrator_guardrail_rules(protagonist_label: str) -> tuple[str,
     )
 
 
-app = FastAPI(title=settings.app_name, debug=settings.debug)
+app = FastAPI(title=settings.app_name, debug=settings.debug, default_response_class=FastJSONResponse)
 
 if settings.app_allowed_hosts and settings.app_allowed_hosts != ["*"]:
     app.add_middleware(
@@ -1760,6 +1761,7 @@ app.include_router(shop_router)
 
 @app.on_event("startup")
 def on_startup() -> None:
+    configure_request_threadpool()
     if not settings.db_bootstrap_on_startup:
         logger.info(
             "Skipping database bootstrap on startup for app_mode=%s (DB_BOOTSTRAP_ON_STARTUP=%s)",
@@ -2717,7 +2719,11 @@ def _deserialize_story_world_card_triggers(raw_value: str) -> list[str]:
     raw = raw_value.strip()
     if not raw:
         return []
+    return list(_deserialize_story_world_card_triggers_text(raw))
 
+
+@lru_cache(maxsize=4096)
+def _deserialize_story_world_card_triggers_text(raw: str) -> tuple[str, ...]:
     parsed: Any
     try:
         parsed = json.loads(raw)
@@ -2725,7 +2731,7 @@ def _deserialize_story_world_card_triggers(raw_value: str) -> list[str]:
         parsed = [part.strip() for part in raw.split(",")]
 
     if not isinstance(parsed, list):
-        return []
+        return ()
 
     normalized: list[str] = []
     seen: set[str] = set()
@@ -2745,7 +2751,7 @@ def _deserialize_story_world_card_triggers(raw_value: str) -> list[str]:
             seen.add(trigger_key)
             normalized.append(trigger)
 
-    return normalized[:40]
+    return tuple(normalized[:40])
 
 
 def _normalize_story_world_card_source(value: str | None) -> str:
@@ -14509,7 +14515,7 @@ def _process_story_summary_job(job_id: int) -> None:
         if job is None or str(job.status or "").strip().lower() in STORY_SUMMARY_JOB_TERMINAL_STATUSES:
             return
 
-        user = db.scalar(select(User).where(User.id == job.user_id))
+        user = db.get(User, job.user_id)
         game = db.scalar(select(StoryGame).where(StoryGame.id == job.game_id))
         if user is None or game is None:
             job.status = STORY_SUMMARY_JOB_STATUS_FAILED
@@ -10,6 +10,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.config import settings
+from app.services.json_streaming import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +142,9 @@ def _include_service_routers(
 def _register_service_lifecycle(service_app: FastAPI) -> None:
     @service_app.on_event("startup")
     def _on_startup() -> None:
+        from app.database import configure_request_threadpool
+
+        configure_request_threadpool()
         if not settings.db_bootstrap_on_startup:
             logger.info(
                 "Skipping database bootstrap on startup for app_mode=%s (DB_BOOTSTRAP_ON_STARTUP=%s)",
@@ -182,7 +186,7 @@ def create_service_app(
     include_prefixes: Iterable[str],
     include_health_route: bool = True,
 ) -> FastAPI:
-    service_app = FastAPI(title=title, debug=settings.debug)
+    service_app = FastAPI(title=title, debug=settings.debug, default_response_class=FastJSONResponse)
     if settings.app_allowed_hosts and settings.app_allowed_hosts != ["*"]:
         service_app.add_middleware(
             TrustedHostMiddleware,
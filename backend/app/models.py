@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 import json
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import Boolean, Computed, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -383,6 +383,9 @@ class WikiArticleImage(Base):
 
 class StoryGame(Base):
     __tablename__ = "story_games"
+    # Fetch server-side timestamps through RETURNING during flush, so new and updated games
+    # do not need a refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
@@ -707,7 +710,11 @@ class StoryCommunityWorldRating(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    world_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    world_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     rating: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -725,7 +732,11 @@ class StoryCommunityWorldView(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    world_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    world_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
@@ -737,7 +748,11 @@ class StoryCommunityWorldLaunch(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    world_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    world_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
@@ -749,7 +764,11 @@ class StoryCommunityWorldFavorite(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    world_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    world_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
@@ -758,7 +777,11 @@ class StoryCommunityWorldComment(Base):
     __tablename__ = "story_community_world_comments"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    world_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    world_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     content: Mapped[str] = mapped_column(Text, nullable=False, default="", server_default="")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -776,7 +799,11 @@ class StoryCommunityWorldReport(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    world_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    world_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     reporter_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     reason: Mapped[str] = mapped_column(String(32), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False, default="", server_default="")
@@ -861,7 +888,11 @@ class StoryMessage(Base):
     __tablename__ = "story_messages"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     role: Mapped[str] = mapped_column(String(16), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False, default="")
     # Chronological log of every reroll attempt generated for this turn: [{content,
@@ -895,7 +926,11 @@ class StoryNovelBeat(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     message_id: Mapped[int] = mapped_column(ForeignKey("story_messages.id"), nullable=False, index=True)
     order_index: Mapped[int] = mapped_column(Integer, nullable=False)
     kind: Mapped[str] = mapped_column(String(16), nullable=False, default="narration", server_default="narration")
@@ -931,7 +966,11 @@ class StorySceneBackground(Base):
     __tablename__ = "story_scene_backgrounds"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     title: Mapped[str] = mapped_column(String(160), nullable=False, default="", server_default="")
     prompt: Mapped[str] = mapped_column(Text, nullable=False, default="", server_default="")
     triggers: Mapped[str] = mapped_column(Text, nullable=False, default="[]", server_default="[]")
@@ -980,7 +1019,11 @@ class StoryTurnImage(Base):
     __tablename__ = "story_turn_images"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     assistant_message_id: Mapped[int] = mapped_column(ForeignKey("story_messages.id"), nullable=False, index=True)
     model: Mapped[str] = mapped_column(String(120), nullable=False, default="", server_default="")
     prompt: Mapped[str] = mapped_column(Text, nullable=False, default="", server_default="")
@@ -1023,7 +1066,11 @@ class StoryInstructionCard(Base):
     __tablename__ = "story_instruction_cards"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     title: Mapped[str] = mapped_column(String(120), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     is_active: Mapped[bool] = mapped_column(
@@ -1040,8 +1087,15 @@ class StoryInstructionCard(Base):
     )
 
 
+STORY_INSTRUCTION_TEMPLATE_RATING_AVG_SQL = (
+    "CASE WHEN community_rating_count > 0 AND community_rating_sum > 0 "
+    "THEN CAST(community_rating_sum AS DOUBLE PRECISION) / community_rating_count ELSE 0 END"
+)
+
+
 class StoryInstructionTemplate(Base):
     __tablename__ = "story_instruction_templates"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
@@ -1052,6 +1106,11 @@ class StoryInstructionTemplate(Base):
     community_rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     community_rating_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     community_additions_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Kept in step with the sum/count by the database so rating sorts can read (and index) it directly.
+    community_rating_avg: Mapped[float] = mapped_column(
+        Float,
+        Computed(STORY_INSTRUCTION_TEMPLATE_RATING_AVG_SQL, persisted=True),
+    )
     publication_status: Mapped[str] = mapped_column(
         String(16),
         nullable=False,
@@ -1264,9 +1323,14 @@ class StoryCommunityInstructionTemplateAddition(Base):
 
 class StoryWorldCard(Base):
     __tablename__ = "story_world_cards"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     title: Mapped[str] = mapped_column(String(120), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     race: Mapped[str] = mapped_column(String(120), nullable=False, default="", server_default="")
@@ -1300,7 +1364,11 @@ class StoryPlotCard(Base):
     __tablename__ = "story_plot_cards"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     title: Mapped[str] = mapped_column(String(120), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     triggers: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
@@ -1320,7 +1388,11 @@ class StoryCharacterStateSnapshot(Base):
     __tablename__ = "story_character_state_snapshots"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     assistant_message_id: Mapped[int | None] = mapped_column(ForeignKey("story_messages.id"), nullable=True, index=True)
     payload: Mapped[str] = mapped_column(Text, nullable=False, default="", server_default="")
     undone_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -1336,7 +1408,11 @@ class StoryMapImage(Base):
     __tablename__ = "story_map_images"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     scope: Mapped[str] = mapped_column(String(32), nullable=False, default="world", server_default="world")
     target_region_id: Mapped[str | None] = mapped_column(String(80), nullable=True, index=True)
     target_location_id: Mapped[str | None] = mapped_column(String(80), nullable=True, index=True)
@@ -1359,7 +1435,11 @@ class StoryMemoryBlock(Base):
     __tablename__ = "story_memory_blocks"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     assistant_message_id: Mapped[int | None] = mapped_column(ForeignKey("story_messages.id"), nullable=True, index=True)
     layer: Mapped[str] = mapped_column(String(32), nullable=False, default="raw", server_default="raw")
     title: Mapped[str] = mapped_column(String(160), nullable=False, default="", server_default="")
@@ -1381,7 +1461,11 @@ class StoryGraphNode(Base):
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     card_type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     card_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     x: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default="0")
@@ -1405,7 +1489,11 @@ class StoryGraphEdge(Base):
     __tablename__ = "story_graph_edges"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     source_node_id: Mapped[int] = mapped_column(ForeignKey("story_graph_nodes.id"), nullable=False, index=True)
     target_node_id: Mapped[int] = mapped_column(ForeignKey("story_graph_nodes.id"), nullable=False, index=True)
     source_card_type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
@@ -1435,7 +1523,11 @@ class StoryGraphSuggestion(Base):
     __tablename__ = "story_graph_suggestions"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     kind: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     status: Mapped[str] = mapped_column(String(16), nullable=False, default="pending", server_default="pending", index=True)
     payload: Mapped[str] = mapped_column(Text, nullable=False, default="{}", server_default="{}")
@@ -1455,7 +1547,11 @@ class StoryGraphEvent(Base):
     __tablename__ = "story_graph_events"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     assistant_message_id: Mapped[int | None] = mapped_column(ForeignKey("story_messages.id"), nullable=True, index=True)
     event_type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
     message: Mapped[str] = mapped_column(Text, nullable=False, default="", server_default="")
@@ -1467,7 +1563,11 @@ class StoryPlotCardChangeEvent(Base):
     __tablename__ = "story_plot_card_change_events"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     assistant_message_id: Mapped[int] = mapped_column(ForeignKey("story_messages.id"), nullable=False, index=True)
     plot_card_id: Mapped[int | None] = mapped_column(ForeignKey("story_plot_cards.id"), nullable=True, index=True)
     action: Mapped[str] = mapped_column(String(16), nullable=False)
@@ -1483,7 +1583,11 @@ class StoryWorldCardChangeEvent(Base):
     __tablename__ = "story_world_card_change_events"
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    game_id: Mapped[int] = mapped_column(ForeignKey("story_games.id"), nullable=False, index=True)
+    game_id: Mapped[int] = mapped_column(
+        ForeignKey("story_games.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     assistant_message_id: Mapped[int] = mapped_column(ForeignKey("story_messages.id"), nullable=False, index=True)
     world_card_id: Mapped[int | None] = mapped_column(ForeignKey("story_world_cards.id"), nullable=True, index=True)
     action: Mapped[str] = mapped_column(String(16), nullable=False)
@@ -4,9 +4,10 @@ import json
 from datetime import datetime, timedelta, timezone
 from typing import Iterable, Literal
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy import delete as sa_delete, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from app.database import get_db
 from app.models import (
@@ -66,8 +67,13 @@ from app.services.auth_identity import (
     user_has_admin_panel_access,
 )
 from app.services.concurrency import add_user_tokens, spend_user_tokens_if_sufficient
+from app.services.json_streaming import json_model_response
 from app.services.maintenance import read_maintenance_settings, write_maintenance_settings
 from app.services.story_characters import unlink_story_character_from_world_cards
+from app.services.story_community_cache import (
+    STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE,
+    invalidate_story_community_list_cache,
+)
 from app.services.story_games import delete_story_game_with_relations, story_author_name
 
 router = APIRouter()
@@ -75,6 +81,7 @@ router = APIRouter()
 DEFAULT_SEARCH_LIMIT = 30
 MAX_SEARCH_LIMIT = 100
 SEARCH_QUERY_MAX_LENGTH = 120
+_ADMIN_USER_LIST_ADAPTER = TypeAdapter(list[AdminUserOut])
 STORY_REPORT_STATUS_OPEN = "open"
 STORY_REPORT_STATUS_DISMISSED = "dismissed"
 STORY_BUG_REPORT_STATUS_OPEN = "open"
@@ -95,7 +102,7 @@ def _get_admin_user(
 
 
 def _get_target_user_or_404(db: Session, *, user_id: int) -> User:
-    user = db.scalar(select(User).where(User.id == user_id))
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return user
@@ -250,6 +257,17 @@ def _admin_user_out(db: Session, user: User) -> AdminUserOut:
     return AdminUserOut.model_validate(user)
 
 
+def _admin_user_list_response(users: list[User], *, total_count: int, offset: int) -> Response:
+    # The page is validated in one pass and the wrapper is trusted, so FastAPI does not re-validate it.
+    return json_model_response(
+        AdminUserListResponse.model_construct(
+            users=_ADMIN_USER_LIST_ADAPTER.validate_python(users, from_attributes=True),
+            total_count=total_count,
+            has_more=offset + len(users) < total_count,
+        )
+    )
+
+
 def _author_name_by_user_id(db: Session, *, user_ids: list[int]) -> dict[int, str]:
     if not user_ids:
         return {}
@@ -355,7 +373,12 @@ def _list_open_instruction_template_reports(db: Session) -> list[AdminReportOut]
         return []
 
     template_ids = sorted({int(report.template_id) for report in open_reports})
-    templates = db.scalars(select(StoryInstructionTemplate).where(StoryInstructionTemplate.id.in_(template_ids))).all()
+    # The report queue only shows titles, so the template content is never loaded here.
+    templates = db.scalars(
+        select(StoryInstructionTemplate)
+        .options(load_only(StoryInstructionTemplate.id, StoryInstructionTemplate.user_id, StoryInstructionTemplate.title))
+        .where(StoryInstructionTemplate.id.in_(template_ids))
+    ).all()
     template_by_id = {int(template.id): template for template in templates}
 
     author_ids = sorted({int(template.user_id) for template in templates})
@@ -597,7 +620,7 @@ def search_users(
     sort: Literal["created_desc", "coins_desc", "coins_asc", "donation_desc"] = Query(default="created_desc"),
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> AdminUserListResponse:
+) -> AdminUserListResponse | Response:
     _get_admin_user(db=db, authorization=authorization)
 
     normalized_query = _normalize_admin_user_search(query)
@@ -648,11 +671,7 @@ def search_users(
         users = users_all[offset : offset + limit]
         _sync_users_access_state(db, users)
         _attach_admin_user_payment_metadata(db, users, payment_by_user_id=payment_by_user_id)
-        return AdminUserListResponse(
-            users=[AdminUserOut.model_validate(user) for user in users],
-            total_count=total_count,
-            has_more=offset + len(users) < total_count,
-        )
+        return _admin_user_list_response(users, total_count=total_count, offset=offset)
 
     total_count = max(int(db.scalar(select(func.count()).select_from(statement.subquery())) or 0), 0)
 
@@ -668,11 +687,7 @@ def search_users(
     users = list(db.scalars(statement).all())
     _sync_users_access_state(db, users)
     _attach_admin_user_payment_metadata(db, users)
-    return AdminUserListResponse(
-        users=[AdminUserOut.model_validate(user) for user in users],
-        total_count=total_count,
-        has_more=offset + len(users) < total_count,
-    )
+    return _admin_user_list_response(users, total_count=total_count, offset=offset)
 
 
 @router.post("/api/auth/admin/users/{user_id}/tokens", response_model=AdminUserOut)
@@ -996,4 +1011,5 @@ def remove_instruction_template_by_reports(
     closed_reports_count = len(open_reports)
     _delete_instruction_template_with_relations(db, template=template)
     db.commit()
+    invalidate_story_community_list_cache(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE)
     return MessageResponse(message=f"Instruction template deleted permanently. Closed reports: {closed_reports_count}")
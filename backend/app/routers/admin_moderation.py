@@ -79,6 +79,10 @@ from app.services.story_characters import (
     story_character_to_out,
     unlink_story_character_from_world_cards,
 )
+from app.services.story_community_cache import (
+    STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE,
+    invalidate_story_community_list_cache,
+)
 from app.services.story_games import (
     delete_story_game_with_relations,
     normalize_story_cover_image_url,
@@ -406,7 +410,7 @@ def _get_returnable_instruction_template_or_404(
 
 
 def _get_author_or_404(db: Session, *, user_id: int) -> User:
-    author = db.scalar(select(User).where(User.id == user_id))
+    author = db.get(User, user_id)
     if author is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Author not found")
     return author
@@ -1105,6 +1109,7 @@ def approve_pending_instruction_template_submission(
         ],
     )
     _commit_admin_moderation_write(db, action_label="approving pending instruction template submission")
+    invalidate_story_community_list_cache(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE)
     db.refresh(template)
     send_notification_emails(db, notifications)
     return _build_instruction_template_detail_out(author, template)
@@ -1140,6 +1145,7 @@ def return_published_instruction_template_to_moderation(
         ],
     )
     _commit_admin_moderation_write(db, action_label="returning published instruction template to moderation")
+    invalidate_story_community_list_cache(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE)
     send_notification_emails(db, notifications)
     return MessageResponse(message="Instruction template was returned to moderation")
 
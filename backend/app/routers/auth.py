@@ -563,7 +563,7 @@ def _resolve_yandex_login_user(db: Session, identity: YandexIdentity) -> tuple[U
 
 
 def _link_yandex_identity(db: Session, *, user_id: int, identity: YandexIdentity) -> User:
-    user = db.scalar(select(User).where(User.id == int(user_id)))
+    user = db.get(User, int(user_id))
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User profile was not found")
 
@@ -648,7 +648,7 @@ def _resolve_vk_id_login_user(db: Session, identity: VKIDIdentity) -> tuple[User
 
 def _link_vk_id_identity(db: Session, *, user_id: int, identity: VKIDIdentity) -> User:
     identity_email = _vk_id_identity_email(identity)
-    user = db.scalar(select(User).where(User.id == int(user_id)))
+    user = db.get(User, int(user_id))
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User profile was not found")
 
@@ -1237,7 +1237,7 @@ def complete_vk_id_oauth(
         user_id = int(str(completion_payload.get("sub")))
     except (TypeError, ValueError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="VK ID OAuth result is invalid") from exc
-    user = db.scalar(select(User).where(User.id == user_id))
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User profile was not found")
     sync_user_access_state(user)
@@ -1460,7 +1460,7 @@ def complete_yandex_oauth(
         user_id = int(str(completion_payload.get("sub")))
     except (TypeError, ValueError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Yandex OAuth result is invalid") from exc
-    user = db.scalar(select(User).where(User.id == user_id))
+    user = db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User profile was not found")
     sync_user_access_state(user)
@@ -100,7 +100,7 @@ AVATAR_SCALE_DEFAULT = 1.0
 
 
 def _resolve_user_or_404(db: Session, user_id: int) -> User:
-    target_user = db.scalar(select(User).where(User.id == user_id))
+    target_user = db.get(User, user_id)
     if target_user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return target_user
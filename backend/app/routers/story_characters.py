@@ -295,7 +295,7 @@ def _build_story_community_character_summary(
     is_added_by_user_override: bool | None = None,
     is_reported_by_user_override: bool | None = None,
 ) -> StoryCommunityCharacterSummaryOut:
-    author = db.scalar(select(User).where(User.id == character.user_id))
+    author = db.get(User, character.user_id)
     character_out = story_character_to_out(character)
     if user_rating_override is None:
         user_rating_value = db.scalar(
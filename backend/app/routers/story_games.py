@@ -4,12 +4,24 @@ import json
 import logging
 from datetime import datetime, timedelta, timezone
 import re
-from typing import Any
+from typing import Any, Callable
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 import requests
-from sqlalchemy import case, delete as sa_delete, func, or_, select, update as sa_update
+from sqlalchemy import (
+    bindparam,
+    case,
+    delete as sa_delete,
+    false,
+    func,
+    insert as sa_insert,
+    lambda_stmt,
+    null,
+    or_,
+    select,
+    update as sa_update,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, aliased, load_only
 
@@ -19,7 +31,6 @@ from app.models import (
     StoryBugReport,
     StoryCommunityWorldComment,
     StoryCommunityWorldFavorite,
-    StoryCommunityWorldLaunch,
     StoryCommunityWorldReport,
     StoryCommunityWorldRating,
     StoryCommunityWorldView,
@@ -68,9 +79,9 @@ except Exception:  # pragma: no cover - compatibility fallback for partial deplo
 from app.services.auth_identity import get_current_user
 from app.services.concurrency import (
     apply_story_world_rating_delete,
-    apply_story_world_rating_insert,
-    apply_story_world_rating_update,
-    increment_story_world_launches,
+    apply_story_world_rating_upsert,
+    record_story_world_launch,
+    upsert_story_world_rating,
 )
 from app.services.story_games import (
     STORY_DEFAULT_TITLE,
@@ -83,7 +94,6 @@ from app.services.story_games import (
     coerce_story_image_model,
     coerce_story_game_age_rating,
     ensure_story_game_public_card_snapshots,
-    deserialize_story_game_genres,
     get_story_game_public_cards_out,
     normalize_story_ambient_enabled,
     normalize_story_appearance_background_mode,
@@ -171,7 +181,9 @@ from app.services.story_queries import (
     touch_story_game,
     list_story_turn_images,
     list_story_world_cards,
+    load_story_turn_count_by_game_id,
 )
+from app.services.json_streaming import FastJSONResponse, json_model_list_response
 from app.services.story_world_comments import (
     list_story_community_world_comments_out,
     normalize_story_community_world_comment_content,
@@ -375,7 +387,7 @@ except Exception:  # pragma: no cover - compatibility fallback for partial deplo
     def serialize_story_world_card_triggers(values: list[str]) -> str:
         return json.dumps(values, ensure_ascii=False)
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 logger = logging.getLogger(__name__)
 
 STORY_WORLD_REPORT_STATUS_OPEN = "open"
@@ -396,12 +408,104 @@ STORY_CLONE_DISPLAY_SUFFIX_PATTERN = re.compile(
 )
 STORY_COMMUNITY_WORLD_SORT_OPTIONS = {"updated_desc", "rating_desc", "launches_desc", "views_desc"}
 STORY_COMMUNITY_WORLD_AGE_FILTER_OPTIONS = {"6+", "16+", "18+"}
+_STORY_COMMUNITY_WORLD_USER_RATINGS_STATEMENT = lambda_stmt(
+    lambda: select(StoryCommunityWorldRating).where(
+        StoryCommunityWorldRating.user_id == bindparam("user_id"),
+        StoryCommunityWorldRating.world_id.in_(bindparam("world_ids", expanding=True)),
+    )
+)
+_STORY_COMMUNITY_WORLD_USER_REPORTS_STATEMENT = lambda_stmt(
+    lambda: select(StoryCommunityWorldReport).where(
+        StoryCommunityWorldReport.reporter_user_id == bindparam("user_id"),
+        StoryCommunityWorldReport.world_id.in_(bindparam("world_ids", expanding=True)),
+    )
+)
+_STORY_COMMUNITY_WORLD_SUMMARY_LIST_ADAPTER = TypeAdapter(list[StoryCommunityWorldSummaryOut])
+_STORY_GAME_SUMMARY_LIST_ADAPTER = TypeAdapter(list[StoryGameSummaryOut])
+
+# PATCH fields whose normalizer only needs the submitted value. "Non-null" fields ignore an explicit
+# null from the client, "nullable" fields pass it on to the normalizer.
+_STORY_GAME_SETTINGS_NON_NULL_FIELD_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    "response_max_tokens": normalize_story_response_max_tokens,
+    "response_max_tokens_enabled": normalize_story_response_max_tokens_enabled,
+    "image_model": normalize_story_image_model,
+    "image_style_prompt": normalize_story_image_style_prompt,
+    "memory_optimization_mode": normalize_story_memory_optimization_mode,
+    "show_gg_thoughts": normalize_story_show_gg_thoughts,
+    "show_npc_thoughts": normalize_story_show_npc_thoughts,
+    "auto_npc_cards_enabled": bool,
+    "auto_graph_nodes_enabled": normalize_story_auto_graph_nodes_enabled,
+    "auto_graph_edges_enabled": normalize_story_auto_graph_edges_enabled,
+    "graph_confirm_low_confidence": normalize_story_graph_confirm_low_confidence,
+    "graph_auto_apply_confidence": normalize_story_graph_auto_apply_confidence,
+}
+_STORY_GAME_SETTINGS_NULLABLE_FIELD_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    "appearance_background_mode": normalize_story_appearance_background_mode,
+    "appearance_gradient_enabled": normalize_story_appearance_gradient_enabled,
+    "appearance_gradient_from": lambda value: normalize_story_appearance_color(
+        value,
+        default=STORY_APPEARANCE_DEFAULT_GRADIENT_FROM,
+    ),
+    "appearance_gradient_to": lambda value: normalize_story_appearance_color(
+        value,
+        default=STORY_APPEARANCE_DEFAULT_GRADIENT_TO,
+    ),
+    "appearance_solid_color": lambda value: normalize_story_appearance_color(
+        value,
+        default=STORY_APPEARANCE_DEFAULT_SOLID_COLOR,
+    ),
+    "appearance_ui_style": normalize_story_appearance_ui_style,
+    "appearance_text_style": normalize_story_appearance_text_style,
+    "environment_current_datetime": lambda value: serialize_story_environment_datetime(
+        deserialize_story_environment_datetime(value)
+    ),
+    "environment_current_weather": serialize_story_environment_weather,
+    "environment_tomorrow_weather": serialize_story_environment_weather,
+}
+_STORY_GAME_META_NON_NULL_FIELD_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    "title": lambda value: value.strip() or STORY_DEFAULT_TITLE,
+    "description": normalize_story_game_description,
+    "opening_scene": normalize_story_game_opening_scene,
+    "age_rating": normalize_story_game_age_rating,
+    "genres": lambda value: serialize_story_game_genres(normalize_story_game_genres(value)),
+    "cover_scale": normalize_story_cover_scale,
+    "cover_position_x": normalize_story_cover_position,
+    "cover_position_y": normalize_story_cover_position,
+}
 
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _apply_story_game_patch_fields(
+    game: StoryGame,
+    payload: BaseModel,
+    field_normalizers: dict[str, Callable[[Any], Any]],
+    *,
+    skip_null: bool,
+) -> None:
+    for field_name in payload.model_fields_set:
+        normalizer = field_normalizers.get(field_name)
+        if normalizer is None:
+            continue
+        value = getattr(payload, field_name)
+        if value is None and skip_null:
+            continue
+        normalized_value = normalizer(value)
+        if getattr(game, field_name) != normalized_value:
+            setattr(game, field_name, normalized_value)
+
+
+def _touch_story_game_before_flush(db: Session, game: StoryGame) -> bool:
+    # A pending game UPDATE is about to be flushed anyway, so bump last_activity_at inside it
+    # instead of leaving it for a separate UPDATE at commit time.
+    if not db.is_modified(game, include_collections=False):
+        return False
+    touch_story_game(game)
+    return True
+
+
 def _normalize_story_community_world_sort(value: str | None) -> str:
     normalized = str(value or "").strip().lower()
     if normalized in STORY_COMMUNITY_WORLD_SORT_OPTIONS:
@@ -1544,89 +1648,55 @@ def _load_latest_story_message_preview_by_game_id(
     return preview_by_game_id
 
 
-def _load_story_turn_count_by_game_id(
-    db: Session,
-    *,
-    game_ids: list[int],
-) -> dict[int, int]:
-    if not game_ids:
-        return {}
+def _load_story_author_avatar_frame_image_by_id(db: Session, *, authors: list[User]) -> dict[int, str | None]:
+    frame_image_by_author_id: dict[int, str | None] = {}
+    for author in authors:
+        if author.id in frame_image_by_author_id:
+            continue
+        frame_image_by_author_id[author.id] = story_author_avatar_frame_image_url(db, author)
+    return frame_image_by_author_id
 
-    rows = db.execute(
-        select(StoryMessage.game_id, StoryMessage.role)
-        .where(
-            StoryMessage.game_id.in_(game_ids),
-            StoryMessage.undone_at.is_(None),
+
+def _load_story_community_world_user_rating(db: Session, *, user_id: int, world_id: int) -> int | None:
+    user_rating_value = db.scalar(
+        select(StoryCommunityWorldRating.rating).where(
+            StoryCommunityWorldRating.world_id == world_id,
+            StoryCommunityWorldRating.user_id == user_id,
         )
-        .order_by(StoryMessage.game_id.asc(), StoryMessage.id.asc())
-    ).all()
+    )
+    return int(user_rating_value) if user_rating_value is not None else None
 
-    turn_count_by_game_id: dict[int, int] = {}
-    current_game_id: int | None = None
-    has_pending_user_turn = False
 
-    for raw_game_id, raw_role in rows:
-        game_id = int(raw_game_id)
-        if current_game_id != game_id:
-            current_game_id = game_id
-            has_pending_user_turn = False
-            turn_count_by_game_id.setdefault(game_id, 0)
+def _is_story_community_world_reported_by_user(db: Session, *, user_id: int, world_id: int) -> bool:
+    user_report_id = db.scalar(
+        select(StoryCommunityWorldReport.id).where(
+            StoryCommunityWorldReport.world_id == world_id,
+            StoryCommunityWorldReport.reporter_user_id == user_id,
+        )
+    )
+    return user_report_id is not None
 
-        role = str(raw_role or "").strip().lower()
-        if role == "user":
-            has_pending_user_turn = True
-            continue
-        if role == "assistant" and has_pending_user_turn:
-            turn_count_by_game_id[game_id] = turn_count_by_game_id.get(game_id, 0) + 1
-            has_pending_user_turn = False
 
-    return turn_count_by_game_id
+def _is_story_community_world_favorited_by_user(db: Session, *, user_id: int, world_id: int) -> bool:
+    user_favorite_id = db.scalar(
+        select(StoryCommunityWorldFavorite.id).where(
+            StoryCommunityWorldFavorite.world_id == world_id,
+            StoryCommunityWorldFavorite.user_id == user_id,
+        )
+    )
+    return user_favorite_id is not None
 
 
-def _build_story_community_world_summary(
+def _story_community_world_summary_with_author(
     db: Session,
     *,
-    user_id: int,
     world: StoryGame,
-    user_rating_override: int | None = None,
-    is_reported_by_user_override: bool | None = None,
-    is_favorited_by_user_override: bool | None = None,
+    user_rating: int | None,
+    is_reported_by_user: bool,
+    is_favorited_by_user: bool,
 ) -> StoryCommunityWorldSummaryOut:
-    author = db.scalar(select(User).where(User.id == world.user_id))
-
-    if user_rating_override is None:
-        user_rating_value = db.scalar(
-            select(StoryCommunityWorldRating.rating).where(
-                StoryCommunityWorldRating.world_id == world.id,
-                StoryCommunityWorldRating.user_id == user_id,
-            )
-        )
-        user_rating = int(user_rating_value) if user_rating_value is not None else None
-    else:
-        user_rating = int(user_rating_override)
-
-    if is_reported_by_user_override is None:
-        user_report_id = db.scalar(
-            select(StoryCommunityWorldReport.id).where(
-                StoryCommunityWorldReport.world_id == world.id,
-                StoryCommunityWorldReport.reporter_user_id == user_id,
-            )
-        )
-        is_reported_by_user = user_report_id is not None
-    else:
-        is_reported_by_user = bool(is_reported_by_user_override)
-
-    if is_favorited_by_user_override is None:
-        user_favorite_id = db.scalar(
-            select(StoryCommunityWorldFavorite.id).where(
-                StoryCommunityWorldFavorite.world_id == world.id,
-                StoryCommunityWorldFavorite.user_id == user_id,
-            )
-        )
-        is_favorited_by_user = user_favorite_id is not None
-    else:
-        is_favorited_by_user = bool(is_favorited_by_user_override)
-
+    # Session.get() hits the identity map first, so an author loaded earlier in the request costs no query.
+    author = db.get(User, world.user_id)
     return story_community_world_summary_to_out(
         world,
         author_id=world.user_id,
@@ -1640,6 +1710,53 @@ def _build_story_community_world_summary(
     )
 
 
+def _build_story_community_world_summary_for_rating(
+    db: Session,
+    *,
+    user_id: int,
+    world: StoryGame,
+    user_rating: int | None,
+) -> StoryCommunityWorldSummaryOut:
+    return _story_community_world_summary_with_author(
+        db,
+        world=world,
+        user_rating=int(user_rating) if user_rating is not None else None,
+        is_reported_by_user=_is_story_community_world_reported_by_user(db, user_id=user_id, world_id=world.id),
+        is_favorited_by_user=_is_story_community_world_favorited_by_user(db, user_id=user_id, world_id=world.id),
+    )
+
+
+def _build_story_community_world_summary_for_report(
+    db: Session,
+    *,
+    user_id: int,
+    world: StoryGame,
+) -> StoryCommunityWorldSummaryOut:
+    return _story_community_world_summary_with_author(
+        db,
+        world=world,
+        user_rating=_load_story_community_world_user_rating(db, user_id=user_id, world_id=world.id),
+        is_reported_by_user=True,
+        is_favorited_by_user=_is_story_community_world_favorited_by_user(db, user_id=user_id, world_id=world.id),
+    )
+
+
+def _build_story_community_world_summary_for_favorite(
+    db: Session,
+    *,
+    user_id: int,
+    world: StoryGame,
+    is_favorited_by_user: bool,
+) -> StoryCommunityWorldSummaryOut:
+    return _story_community_world_summary_with_author(
+        db,
+        world=world,
+        user_rating=_load_story_community_world_user_rating(db, user_id=user_id, world_id=world.id),
+        is_reported_by_user=_is_story_community_world_reported_by_user(db, user_id=user_id, world_id=world.id),
+        is_favorited_by_user=is_favorited_by_user,
+    )
+
+
 def _is_story_game_publication_copy_candidate(game: StoryGame) -> bool:
     publication_status = str(getattr(game, "publication_status", "") or "").strip().lower()
     return (
@@ -1791,11 +1908,14 @@ def list_story_games(
     visibility: str = Query(default="all", max_length=16),
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> list[StoryGameSummaryOut]:
-    response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    response.headers["Vary"] = "Authorization"
+) -> list[StoryGameSummaryOut] | Response:
+    response_headers = {
+        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+        "Pragma": "no-cache",
+        "Expires": "0",
+        "Vary": "Authorization",
+    }
+    response.headers.update(response_headers)
     user = get_current_user(db, authorization)
     statement = (
         select(StoryGame)
@@ -1871,7 +1991,7 @@ def list_story_games(
     if offset > 0:
         statement = statement.offset(offset)
     games = db.scalars(statement).all()
-    turn_count_by_game_id = _load_story_turn_count_by_game_id(
+    turn_count_by_game_id = load_story_turn_count_by_game_id(
         db,
         game_ids=[game.id for game in games],
     )
@@ -1882,30 +2002,38 @@ def list_story_games(
         return summary.model_copy(update={"game_mode": STORY_GAME_MODE_RPG})
 
     if not compact:
-        return [
-            _mask_story_game_mode(
-                story_game_summary_to_out(
-                    game,
-                    turn_count=turn_count_by_game_id.get(game.id, 0),
+        return json_model_list_response(
+            _STORY_GAME_SUMMARY_LIST_ADAPTER,
+            [
+                _mask_story_game_mode(
+                    story_game_summary_to_out(
+                        game,
+                        turn_count=turn_count_by_game_id.get(game.id, 0),
+                    )
                 )
-            )
-            for game in games
-        ]
+                for game in games
+            ],
+            headers=response_headers,
+        )
 
     preview_by_game_id = _load_latest_story_message_preview_by_game_id(
         db,
         game_ids=[game.id for game in games],
     )
-    return [
-        _mask_story_game_mode(
-            story_game_summary_to_compact_out(
-                game,
-                latest_message_preview=preview_by_game_id.get(game.id),
-                turn_count=turn_count_by_game_id.get(game.id, 0),
+    return json_model_list_response(
+        _STORY_GAME_SUMMARY_LIST_ADAPTER,
+        [
+            _mask_story_game_mode(
+                story_game_summary_to_compact_out(
+                    game,
+                    latest_message_preview=preview_by_game_id.get(game.id),
+                    turn_count=turn_count_by_game_id.get(game.id, 0),
+                )
             )
-        )
-        for game in games
-    ]
+            for game in games
+        ],
+        headers=response_headers,
+    )
 
 
 @router.get("/api/story/community/worlds", response_model=list[StoryCommunityWorldSummaryOut])
@@ -1918,7 +2046,7 @@ def list_story_community_worlds(
     genre: str | None = Query(default=None, max_length=80),
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> list[StoryCommunityWorldSummaryOut]:
+) -> list[StoryCommunityWorldSummaryOut] | Response:
     user = get_current_user(db, authorization) if authorization else None
     normalized_sort = _normalize_story_community_world_sort(sort)
     normalized_query = _normalize_story_community_world_search_query(query)
@@ -1931,9 +2059,46 @@ def list_story_community_worlds(
         ),
         else_=0.0,
     )
+    if user is not None:
+        user_rating_column = (
+            select(StoryCommunityWorldRating.rating)
+            .where(
+                StoryCommunityWorldRating.world_id == StoryGame.id,
+                StoryCommunityWorldRating.user_id == user.id,
+            )
+            .order_by(StoryCommunityWorldRating.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        is_reported_by_user_column = (
+            select(StoryCommunityWorldReport.id)
+            .where(
+                StoryCommunityWorldReport.world_id == StoryGame.id,
+                StoryCommunityWorldReport.reporter_user_id == user.id,
+            )
+            .exists()
+        )
+        is_favorited_by_user_column = (
+            select(StoryCommunityWorldFavorite.id)
+            .where(
+                StoryCommunityWorldFavorite.world_id == StoryGame.id,
+                StoryCommunityWorldFavorite.user_id == user.id,
+            )
+            .exists()
+        )
+    else:
+        user_rating_column = null()
+        is_reported_by_user_column = false()
+        is_favorited_by_user_column = false()
 
     statement = (
-        select(StoryGame)
+        select(
+            StoryGame,
+            User,
+            user_rating_column.label("user_rating"),
+            is_reported_by_user_column.label("is_reported_by_user"),
+            is_favorited_by_user_column.label("is_favorited_by_user"),
+        )
         .options(
             load_only(
                 StoryGame.id,
@@ -1952,7 +2117,15 @@ def list_story_community_worlds(
                 StoryGame.community_rating_count,
                 StoryGame.created_at,
                 StoryGame.updated_at,
-            )
+            ),
+            load_only(
+                User.id,
+                User.email,
+                User.display_name,
+                User.avatar_url,
+                User.avatar_frame_id,
+                User.updated_at,
+            ),
         )
         .join(User, User.id == StoryGame.user_id)
         .where(StoryGame.visibility == "public")
@@ -2001,72 +2174,31 @@ def list_story_community_worlds(
             StoryGame.id.desc(),
         )
 
-    worlds = db.scalars(statement.offset(offset).limit(limit)).all()
-    if not worlds:
+    rows = db.execute(statement.offset(offset).limit(limit)).all()
+    if not rows:
         return []
 
-    world_ids = [world.id for world in worlds]
-    author_ids = sorted({world.user_id for world in worlds})
-    authors = db.scalars(
-        select(User)
-        .options(
-            load_only(
-                User.id,
-                User.email,
-                User.display_name,
-                User.avatar_url,
-                User.avatar_frame_id,
-                User.updated_at,
-            )
-        )
-        .where(User.id.in_(author_ids))
-    ).all()
-    author_name_by_id = {author.id: story_author_name(author) for author in authors}
-    author_avatar_by_id = {author.id: story_author_avatar_url(author) for author in authors}
-    author_avatar_frame_by_id = {author.id: story_author_avatar_frame_id(author) for author in authors}
-    author_avatar_frame_image_by_id = {author.id: story_author_avatar_frame_image_url(db, author) for author in authors}
-
-    if user is not None:
-        user_rating_rows = db.scalars(
-            select(StoryCommunityWorldRating).where(
-                StoryCommunityWorldRating.user_id == user.id,
-                StoryCommunityWorldRating.world_id.in_(world_ids),
-            )
-        ).all()
-        user_rating_by_world_id = {row.world_id: int(row.rating) for row in user_rating_rows}
-        user_report_rows = db.scalars(
-            select(StoryCommunityWorldReport).where(
-                StoryCommunityWorldReport.reporter_user_id == user.id,
-                StoryCommunityWorldReport.world_id.in_(world_ids),
-            )
-        ).all()
-        reported_world_ids = {row.world_id for row in user_report_rows}
-        user_favorite_rows = db.scalars(
-            select(StoryCommunityWorldFavorite).where(
-                StoryCommunityWorldFavorite.user_id == user.id,
-                StoryCommunityWorldFavorite.world_id.in_(world_ids),
+    author_avatar_frame_image_by_id = _load_story_author_avatar_frame_image_by_id(
+        db,
+        authors=[row[1] for row in rows],
+    )
+    return json_model_list_response(
+        _STORY_COMMUNITY_WORLD_SUMMARY_LIST_ADAPTER,
+        [
+            story_community_world_summary_to_out(
+                world,
+                author_id=world.user_id,
+                author_name=story_author_name(author),
+                author_avatar_url=story_author_avatar_url(author),
+                author_avatar_frame_id=story_author_avatar_frame_id(author),
+                author_avatar_frame_image_url=author_avatar_frame_image_by_id.get(world.user_id),
+                user_rating=int(user_rating) if user_rating is not None else None,
+                is_reported_by_user=bool(is_reported_by_user),
+                is_favorited_by_user=bool(is_favorited_by_user),
             )
-        ).all()
-        favorited_world_ids = {row.world_id for row in user_favorite_rows}
-    else:
-        user_rating_by_world_id = {}
-        reported_world_ids = set()
-        favorited_world_ids = set()
-
-    return [
-        story_community_world_summary_to_out(
-            world,
-            author_id=world.user_id,
-            author_name=author_name_by_id.get(world.user_id, "Unknown"),
-            author_avatar_url=author_avatar_by_id.get(world.user_id),
-            author_avatar_frame_id=author_avatar_frame_by_id.get(world.user_id, "none"),
-            author_avatar_frame_image_url=author_avatar_frame_image_by_id.get(world.user_id),
-            user_rating=user_rating_by_world_id.get(world.id),
-            is_reported_by_user=world.id in reported_world_ids,
-            is_favorited_by_user=world.id in favorited_world_ids,
-        )
-        for world in worlds
-    ]
+            for world, author, user_rating, is_reported_by_user, is_favorited_by_user in rows
+        ]
+    )
 
 
 @router.get("/api/story/community/favorites", response_model=list[StoryCommunityWorldSummaryOut])
@@ -2075,7 +2207,7 @@ def list_story_community_favorites(
     offset: int = Query(default=0, ge=0),
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> list[StoryCommunityWorldSummaryOut]:
+) -> list[StoryCommunityWorldSummaryOut] | Response:
     user = get_current_user(db, authorization)
     favorite_rows = db.scalars(
         select(StoryCommunityWorldFavorite)
@@ -2096,58 +2228,57 @@ def list_story_community_favorites(
         seen_world_ids.add(world_id)
         ordered_world_ids.append(world_id)
 
-    worlds = db.scalars(
-        select(StoryGame).where(
+    rows = db.execute(
+        select(StoryGame, User)
+        .join(User, User.id == StoryGame.user_id)
+        .where(
             StoryGame.id.in_(ordered_world_ids),
             StoryGame.visibility == "public",
         )
     ).all()
-    if not worlds:
+    if not rows:
         return []
 
-    world_by_id = {world.id: world for world in worlds}
-    ordered_worlds = [world_by_id[world_id] for world_id in ordered_world_ids if world_id in world_by_id]
-    if not ordered_worlds:
+    row_by_world_id = {world.id: (world, author) for world, author in rows}
+    ordered_rows = [row_by_world_id[world_id] for world_id in ordered_world_ids if world_id in row_by_world_id]
+    if not ordered_rows:
         return []
 
-    world_ids = [world.id for world in ordered_worlds]
-    author_ids = sorted({world.user_id for world in ordered_worlds})
-    authors = db.scalars(select(User).where(User.id.in_(author_ids))).all()
-    author_name_by_id = {author.id: story_author_name(author) for author in authors}
-    author_avatar_by_id = {author.id: story_author_avatar_url(author) for author in authors}
-    author_avatar_frame_by_id = {author.id: story_author_avatar_frame_id(author) for author in authors}
-    author_avatar_frame_image_by_id = {author.id: story_author_avatar_frame_image_url(db, author) for author in authors}
+    world_ids = [world.id for world, _ in ordered_rows]
+    author_avatar_frame_image_by_id = _load_story_author_avatar_frame_image_by_id(
+        db,
+        authors=[author for _, author in ordered_rows],
+    )
 
     user_rating_rows = db.scalars(
-        select(StoryCommunityWorldRating).where(
-            StoryCommunityWorldRating.user_id == user.id,
-            StoryCommunityWorldRating.world_id.in_(world_ids),
-        )
+        _STORY_COMMUNITY_WORLD_USER_RATINGS_STATEMENT,
+        {"user_id": user.id, "world_ids": world_ids},
     ).all()
     user_rating_by_world_id = {row.world_id: int(row.rating) for row in user_rating_rows}
 
     user_report_rows = db.scalars(
-        select(StoryCommunityWorldReport).where(
-            StoryCommunityWorldReport.reporter_user_id == user.id,
-            StoryCommunityWorldReport.world_id.in_(world_ids),
-        )
+        _STORY_COMMUNITY_WORLD_USER_REPORTS_STATEMENT,
+        {"user_id": user.id, "world_ids": world_ids},
     ).all()
     reported_world_ids = {row.world_id for row in user_report_rows}
 
-    return [
-        story_community_world_summary_to_out(
-            world,
-            author_id=world.user_id,
-            author_name=author_name_by_id.get(world.user_id, "Unknown"),
-            author_avatar_url=author_avatar_by_id.get(world.user_id),
-            author_avatar_frame_id=author_avatar_frame_by_id.get(world.user_id, "none"),
-            author_avatar_frame_image_url=author_avatar_frame_image_by_id.get(world.user_id),
-            user_rating=user_rating_by_world_id.get(world.id),
-            is_reported_by_user=world.id in reported_world_ids,
-            is_favorited_by_user=True,
-        )
-        for world in ordered_worlds
-    ]
+    return json_model_list_response(
+        _STORY_COMMUNITY_WORLD_SUMMARY_LIST_ADAPTER,
+        [
+            story_community_world_summary_to_out(
+                world,
+                author_id=world.user_id,
+                author_name=story_author_name(author),
+                author_avatar_url=story_author_avatar_url(author),
+                author_avatar_frame_id=story_author_avatar_frame_id(author),
+                author_avatar_frame_image_url=author_avatar_frame_image_by_id.get(world.user_id),
+                user_rating=user_rating_by_world_id.get(world.id),
+                is_reported_by_user=world.id in reported_world_ids,
+                is_favorited_by_user=True,
+            )
+            for world, author in ordered_rows
+        ]
+    )
 
 
 @router.post("/api/story/community/worlds/{world_id}/launch", response_model=StoryGameSummaryOut)
@@ -2167,7 +2298,7 @@ def launch_story_community_world(
         opening_scene=world.opening_scene or "",
         visibility=STORY_GAME_VISIBILITY_PRIVATE,
         age_rating=coerce_story_game_age_rating(world.age_rating),
-        genres=serialize_story_game_genres(deserialize_story_game_genres(world.genres)),
+        genres=world.genres or "[]",
         cover_image_url=normalize_story_cover_image_url(world.cover_image_url, db=db),
         cover_scale=normalize_story_cover_scale(world.cover_scale),
         cover_position_x=normalize_story_cover_position(world.cover_position_x),
@@ -2264,25 +2395,8 @@ def launch_story_community_world(
         source_world_cards_out=source_world_cards,
     )
 
-    launch_inserted = False
-    try:
-        with db.begin_nested():
-            db.add(
-                StoryCommunityWorldLaunch(
-                    world_id=world.id,
-                    user_id=user.id,
-                )
-            )
-            db.flush()
-        launch_inserted = True
-    except IntegrityError:
-        launch_inserted = False
-
-    if launch_inserted:
-        increment_story_world_launches(db, world.id)
-    touch_story_game(cloned_game)
+    record_story_world_launch(db, world_id=world.id, user_id=user.id)
     db.commit()
-    db.refresh(cloned_game)
     return _story_game_summary_response(db, cloned_game)
 
 
@@ -2297,60 +2411,41 @@ def rate_story_community_world(
     world = get_public_story_world_or_404(db, world_id)
     rating_value = int(payload.rating)
 
-    existing_rating = db.scalar(
-        select(StoryCommunityWorldRating).where(
-            StoryCommunityWorldRating.world_id == world.id,
-            StoryCommunityWorldRating.user_id == user.id,
-        )
-    )
     if rating_value <= 0:
-        if existing_rating is not None:
-            previous_rating = int(existing_rating.rating)
-            db.delete(existing_rating)
-            apply_story_world_rating_delete(db, world.id, previous_rating)
+        previous_rating = db.scalar(
+            sa_delete(StoryCommunityWorldRating)
+            .where(
+                StoryCommunityWorldRating.world_id == world.id,
+                StoryCommunityWorldRating.user_id == user.id,
+            )
+            .returning(StoryCommunityWorldRating.rating)
+        )
+        if previous_rating is not None:
+            apply_story_world_rating_delete(db, world.id, int(previous_rating))
         db.commit()
         db.refresh(world)
-        return _build_story_community_world_summary(
+        return _build_story_community_world_summary_for_rating(
             db,
             user_id=user.id,
             world=world,
-            user_rating_override=None,
+            user_rating=None,
         )
 
-    if existing_rating is None:
-        inserted_rating: StoryCommunityWorldRating | None = None
-        try:
-            with db.begin_nested():
-                inserted_rating = StoryCommunityWorldRating(
-                    world_id=world.id,
-                    user_id=user.id,
-                    rating=rating_value,
-                )
-                db.add(inserted_rating)
-                db.flush()
-            apply_story_world_rating_insert(db, world.id, rating_value)
-            existing_rating = inserted_rating
-        except IntegrityError:
-            existing_rating = db.scalar(
-                select(StoryCommunityWorldRating).where(
-                    StoryCommunityWorldRating.world_id == world.id,
-                    StoryCommunityWorldRating.user_id == user.id,
-                )
-            )
-
-    if existing_rating is not None:
-        previous_rating = int(existing_rating.rating)
-        if previous_rating != rating_value:
-            existing_rating.rating = rating_value
-            apply_story_world_rating_update(db, world.id, rating_value - previous_rating)
+    previous_rating = upsert_story_world_rating(
+        db,
+        world_id=world.id,
+        user_id=user.id,
+        rating_value=rating_value,
+    )
+    apply_story_world_rating_upsert(db, world.id, rating_value, previous_rating)
 
     db.commit()
     db.refresh(world)
-    return _build_story_community_world_summary(
+    return _build_story_community_world_summary_for_rating(
         db,
         user_id=user.id,
         world=world,
-        user_rating_override=rating_value,
+        user_rating=rating_value,
     )
 
 
@@ -2411,11 +2506,10 @@ def report_story_community_world(
         actor_user_id=int(user.id),
     )
     db.refresh(world)
-    return _build_story_community_world_summary(
+    return _build_story_community_world_summary_for_report(
         db,
         user_id=user.id,
         world=world,
-        is_reported_by_user_override=True,
     )
 
 
@@ -2559,11 +2653,11 @@ def favorite_story_community_world(
         except IntegrityError:
             db.rollback()
 
-    return _build_story_community_world_summary(
+    return _build_story_community_world_summary_for_favorite(
         db,
         user_id=user.id,
         world=world,
-        is_favorited_by_user_override=True,
+        is_favorited_by_user=True,
     )
 
 
@@ -2585,11 +2679,11 @@ def unfavorite_story_community_world(
         db.delete(favorite_row)
         db.commit()
 
-    return _build_story_community_world_summary(
+    return _build_story_community_world_summary_for_favorite(
         db,
         user_id=user.id,
         world=world,
-        is_favorited_by_user_override=False,
+        is_favorited_by_user=False,
     )
 
 
@@ -2720,7 +2814,6 @@ def create_story_game(
     if requested_visibility == STORY_GAME_VISIBILITY_PUBLIC:
         mark_story_publication_pending(game)
     db.commit()
-    db.refresh(game)
     if requested_visibility == STORY_GAME_VISIBILITY_PUBLIC:
         game_title = str(game.title or "").strip() or f"Мир #{int(game.id)}"
         author_name = story_author_name(user)
@@ -2891,10 +2984,35 @@ def create_story_quick_start_game(
 
     touch_story_game(game)
     db.commit()
-    db.refresh(game)
     return _story_game_summary_response(db, game)
 
 
+def _clone_story_message_history(db: Session, *, source_game_id: int, target_game_id: int) -> dict[int, int]:
+    source_messages = db.execute(
+        select(StoryMessage.id, StoryMessage.role, StoryMessage.content)
+        .where(
+            StoryMessage.game_id == source_game_id,
+            StoryMessage.undone_at.is_(None),
+        )
+        .order_by(StoryMessage.id.asc())
+    ).all()
+    if not source_messages:
+        return {}
+
+    # RETURNING rows come back in parameter order, which pairs every new id with its source message.
+    cloned_message_ids = db.scalars(
+        sa_insert(StoryMessage).returning(StoryMessage.id, sort_by_parameter_order=True),
+        [
+            {"game_id": target_game_id, "role": source_message.role, "content": source_message.content}
+            for source_message in source_messages
+        ],
+    ).all()
+    return {
+        int(source_message.id): int(cloned_message_id)
+        for source_message, cloned_message_id in zip(source_messages, cloned_message_ids)
+    }
+
+
 @router.post("/api/story/games/{game_id}/clone", response_model=StoryGameSummaryOut)
 def clone_story_game(
     game_id: int,
@@ -2912,7 +3030,7 @@ def clone_story_game(
         opening_scene=normalize_story_game_opening_scene(source_game.opening_scene),
         visibility=STORY_GAME_VISIBILITY_PRIVATE,
         age_rating=coerce_story_game_age_rating(source_game.age_rating),
-        genres=serialize_story_game_genres(deserialize_story_game_genres(source_game.genres)),
+        genres=source_game.genres or "[]",
         cover_image_url=normalize_story_cover_image_url(source_game.cover_image_url, db=db),
         cover_scale=normalize_story_cover_scale(source_game.cover_scale),
         cover_position_x=normalize_story_cover_position(source_game.cover_position_x),
@@ -3050,21 +3168,16 @@ def clone_story_game(
             )
 
     if payload.copy_history:
-        source_messages = list_story_messages(db, source_game.id)
-        message_id_map: dict[int, int] = {}
-        for message in source_messages:
-            cloned_message = StoryMessage(
-                game_id=cloned_game.id,
-                role=message.role,
-                content=message.content,
-            )
-            db.add(cloned_message)
-            db.flush()
-            message_id_map[int(message.id)] = int(cloned_message.id)
+        message_id_map = _clone_story_message_history(
+            db,
+            source_game_id=int(source_game.id),
+            target_game_id=int(cloned_game.id),
+        )
 
         # Visual Novel pages are persisted separately from their assistant messages. Keep
         # them aligned with the cloned history instead of leaving a VN clone with text turns
         # that the stage cannot render.
+        cloned_beat_rows: list[dict[str, Any]] = []
         for beat in list_story_novel_beats(
             db,
             source_game.id,
@@ -3073,21 +3186,24 @@ def clone_story_game(
             cloned_message_id = message_id_map.get(int(beat.message_id))
             if cloned_message_id is None:
                 continue
-            db.add(
-                StoryNovelBeat(
-                    game_id=cloned_game.id,
-                    message_id=cloned_message_id,
-                    order_index=int(beat.order_index),
-                    kind=beat.kind,
-                    speaker_name=beat.speaker_name,
-                    speaker_character_id=beat.speaker_character_id,
-                    emotion=beat.emotion,
-                    scene_characters_json=getattr(beat, "scene_characters_json", "[]") or "[]",
-                    text=beat.text,
-                )
+            cloned_beat_rows.append(
+                {
+                    "game_id": cloned_game.id,
+                    "message_id": cloned_message_id,
+                    "order_index": int(beat.order_index),
+                    "kind": beat.kind,
+                    "speaker_name": beat.speaker_name,
+                    "speaker_character_id": beat.speaker_character_id,
+                    "emotion": beat.emotion,
+                    "scene_characters_json": getattr(beat, "scene_characters_json", "[]") or "[]",
+                    "text": beat.text,
+                }
             )
+        if cloned_beat_rows:
+            db.execute(sa_insert(StoryNovelBeat), cloned_beat_rows)
 
         source_memory_blocks = list_story_memory_blocks(db, source_game.id)
+        cloned_memory_block_rows: list[dict[str, Any]] = []
         for block in source_memory_blocks:
             block_layer = normalize_story_memory_layer(getattr(block, "layer", None))
             if block_layer in {
@@ -3100,19 +3216,21 @@ def clone_story_game(
             target_assistant_message_id: int | None = None
             if source_assistant_message_id is not None:
                 target_assistant_message_id = message_id_map.get(int(source_assistant_message_id))
-            cloned_memory_block = StoryMemoryBlock(
-                game_id=cloned_game.id,
-                assistant_message_id=target_assistant_message_id,
-                layer=block_layer,
-                title=str(block.title or ""),
-                content=str(block.content or ""),
-                token_count=max(int(getattr(block, "token_count", 0) or 0), 0),
+            cloned_memory_block_rows.append(
+                {
+                    "game_id": cloned_game.id,
+                    "assistant_message_id": target_assistant_message_id,
+                    "layer": block_layer,
+                    "title": str(block.title or ""),
+                    "content": str(block.content or ""),
+                    "token_count": max(int(getattr(block, "token_count", 0) or 0), 0),
+                }
             )
-            db.add(cloned_memory_block)
+        if cloned_memory_block_rows:
+            db.execute(sa_insert(StoryMemoryBlock), cloned_memory_block_rows)
 
     touch_story_game(cloned_game)
     db.commit()
-    db.refresh(cloned_game)
     return _story_game_summary_response(db, cloned_game)
 
 
@@ -3194,28 +3312,22 @@ def update_story_game_settings(
             getattr(game, "context_limit_chars", None),
             model_name=next_story_model,
         )
-    if payload.response_max_tokens is not None:
-        game.response_max_tokens = normalize_story_response_max_tokens(payload.response_max_tokens)
-    if payload.response_max_tokens_enabled is not None:
-        game.response_max_tokens_enabled = normalize_story_response_max_tokens_enabled(
-            payload.response_max_tokens_enabled
-        )
+    _apply_story_game_patch_fields(
+        game,
+        payload,
+        _STORY_GAME_SETTINGS_NON_NULL_FIELD_NORMALIZERS,
+        skip_null=True,
+    )
     if payload.response_token_limit_enabled is not None:
         if str(getattr(user, "role", "") or "").strip().lower() != "administrator":
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
         game.response_token_limit_enabled = normalize_story_response_token_limit_enabled(
             payload.response_token_limit_enabled
         )
-    if payload.image_model is not None:
-        game.image_model = normalize_story_image_model(payload.image_model)
-    if payload.image_style_prompt is not None:
-        game.image_style_prompt = normalize_story_image_style_prompt(payload.image_style_prompt)
     # Memory optimization is mandatory and cannot be disabled.
     game.memory_optimization_enabled = normalize_story_memory_optimization_enabled(
         payload.memory_optimization_enabled
     )
-    if payload.memory_optimization_mode is not None:
-        game.memory_optimization_mode = normalize_story_memory_optimization_mode(payload.memory_optimization_mode)
     if "story_top_k" in payload.model_fields_set:
         game.story_top_k = normalize_story_top_k(payload.story_top_k, model_name=next_story_model)
     elif story_model_changed:
@@ -3235,10 +3347,6 @@ def update_story_game_settings(
         )
     elif story_model_changed:
         game.story_repetition_penalty = normalize_story_repetition_penalty(None, model_name=next_story_model)
-    if payload.show_gg_thoughts is not None:
-        game.show_gg_thoughts = normalize_story_show_gg_thoughts(payload.show_gg_thoughts)
-    if payload.show_npc_thoughts is not None:
-        game.show_npc_thoughts = normalize_story_show_npc_thoughts(payload.show_npc_thoughts)
     if "active_main_hero_card_id" in payload.model_fields_set:
         if payload.active_main_hero_card_id is None:
             game.active_main_hero_card_id = None
@@ -3256,51 +3364,17 @@ def update_story_game_settings(
                     detail="Active main hero card not found",
                 )
             game.active_main_hero_card_id = int(active_main_hero_card.id)
-    if payload.auto_npc_cards_enabled is not None:
-        game.auto_npc_cards_enabled = bool(payload.auto_npc_cards_enabled)
-    if payload.auto_graph_nodes_enabled is not None:
-        game.auto_graph_nodes_enabled = normalize_story_auto_graph_nodes_enabled(payload.auto_graph_nodes_enabled)
-    if payload.auto_graph_edges_enabled is not None:
-        game.auto_graph_edges_enabled = normalize_story_auto_graph_edges_enabled(payload.auto_graph_edges_enabled)
-    if payload.graph_confirm_low_confidence is not None:
-        game.graph_confirm_low_confidence = normalize_story_graph_confirm_low_confidence(
-            payload.graph_confirm_low_confidence
-        )
-    if payload.graph_auto_apply_confidence is not None:
-        game.graph_auto_apply_confidence = normalize_story_graph_auto_apply_confidence(
-            payload.graph_auto_apply_confidence
-        )
     if payload.accelerated_service_enabled is not None:
         game.accelerated_service_enabled = False
     if payload.ambient_enabled is not None and can_use_visual_novel_mode:
         game.ambient_enabled = normalize_story_ambient_enabled(payload.ambient_enabled)
-    if "appearance_background_mode" in payload.model_fields_set:
-        game.appearance_background_mode = normalize_story_appearance_background_mode(payload.appearance_background_mode)
-    if "appearance_gradient_enabled" in payload.model_fields_set:
-        game.appearance_gradient_enabled = normalize_story_appearance_gradient_enabled(
-            payload.appearance_gradient_enabled
-        )
-    if "appearance_gradient_from" in payload.model_fields_set:
-        game.appearance_gradient_from = normalize_story_appearance_color(
-            payload.appearance_gradient_from,
-            default=STORY_APPEARANCE_DEFAULT_GRADIENT_FROM,
-        )
-    if "appearance_gradient_to" in payload.model_fields_set:
-        game.appearance_gradient_to = normalize_story_appearance_color(
-            payload.appearance_gradient_to,
-            default=STORY_APPEARANCE_DEFAULT_GRADIENT_TO,
-        )
-    if "appearance_solid_color" in payload.model_fields_set:
-        game.appearance_solid_color = normalize_story_appearance_color(
-            payload.appearance_solid_color,
-            default=STORY_APPEARANCE_DEFAULT_SOLID_COLOR,
-        )
-    if "appearance_ui_style" in payload.model_fields_set:
-        game.appearance_ui_style = normalize_story_appearance_ui_style(payload.appearance_ui_style)
-    if "appearance_text_style" in payload.model_fields_set:
-        game.appearance_text_style = normalize_story_appearance_text_style(payload.appearance_text_style)
+    # Set when a step writes rows or flushes, which db.is_modified(game) alone cannot see.
+    has_flushed_changes = False
+    has_touched_game = False
     if payload.character_state_enabled is not None:
+        has_flushed_changes = True
         game.character_state_enabled = normalize_story_character_state_enabled(payload.character_state_enabled)
+        has_touched_game = _touch_story_game_before_flush(db, game)
         sync_story_character_state_payload_from_world_cards(
             db=db,
             game=game,
@@ -3345,14 +3419,12 @@ def update_story_game_settings(
     game.environment_time_enabled = next_environment_time_enabled
     game.environment_weather_enabled = next_environment_weather_enabled
     game.environment_enabled = next_environment_time_enabled or next_environment_weather_enabled
-    if "environment_current_datetime" in payload.model_fields_set:
-        game.environment_current_datetime = serialize_story_environment_datetime(
-            deserialize_story_environment_datetime(payload.environment_current_datetime)
-        )
-    if "environment_current_weather" in payload.model_fields_set:
-        game.environment_current_weather = serialize_story_environment_weather(payload.environment_current_weather)
-    if "environment_tomorrow_weather" in payload.model_fields_set:
-        game.environment_tomorrow_weather = serialize_story_environment_weather(payload.environment_tomorrow_weather)
+    _apply_story_game_patch_fields(
+        game,
+        payload,
+        _STORY_GAME_SETTINGS_NULLABLE_FIELD_NORMALIZERS,
+        skip_null=False,
+    )
     if "current_location_label" in payload.model_fields_set:
         manual_location_label = _normalize_story_environment_location_label(payload.current_location_label)
         game.current_location_label = manual_location_label
@@ -3373,19 +3445,23 @@ def update_story_game_settings(
             datetime.now().replace(second=0, microsecond=0, tzinfo=None)
         )
     if game.environment_enabled:
+        has_touched_game = _touch_story_game_before_flush(db, game) or has_touched_game
         try:
             from app.services import story_memory_pipeline
 
-            story_memory_pipeline._ensure_story_environment_seeded(db=db, game=game)
+            if story_memory_pipeline._ensure_story_environment_seeded(db=db, game=game):
+                has_flushed_changes = True
         except Exception:
             logger.exception(
                 "Failed to seed story environment after settings update: game_id=%s user_id=%s",
                 game.id,
                 user.id,
             )
-    touch_story_game(game)
+    if not has_flushed_changes and not db.is_modified(game, include_collections=False):
+        return _story_game_summary_response(db, game)
+    if not has_touched_game:
+        touch_story_game(game)
     db.commit()
-    db.refresh(game)
     return _story_game_summary_response(db, game)
 
 
@@ -3539,7 +3615,6 @@ def _regenerate_story_game_environment_weather_safe(
         story_memory_pipeline._sync_story_manual_environment_memory_blocks(db=db, game=game)
         touch_story_game(game)
         db.commit()
-        db.refresh(game)
         return _story_game_summary_response(db, game)
     except HTTPException:
         raise
@@ -3615,7 +3690,6 @@ def _regenerate_story_game_environment_weather_service_safe(
         story_memory_pipeline._sync_story_manual_environment_memory_blocks(db=db, game=game)
         touch_story_game(game)
         db.commit()
-        db.refresh(game)
         return _story_game_summary_response(db, game)
     except HTTPException:
         db.rollback()
@@ -3775,7 +3849,6 @@ def regenerate_story_game_environment_weather(
     story_memory_pipeline._sync_story_manual_environment_memory_blocks(db=db, game=game)
     touch_story_game(game)
     db.commit()
-    db.refresh(game)
     return _story_game_summary_response(db, game)
 
 
@@ -4247,38 +4320,32 @@ def update_story_game_meta(
     previous_publication_status = str(getattr(game, "publication_status", "") or "").strip().lower()
     requested_visibility: str | None = None
     should_notify_publication_queue = False
-    if payload.title is not None:
-        normalized_title = payload.title.strip()
-        game.title = normalized_title or STORY_DEFAULT_TITLE
-    if payload.description is not None:
-        game.description = normalize_story_game_description(payload.description)
-    if payload.opening_scene is not None:
-        game.opening_scene = normalize_story_game_opening_scene(payload.opening_scene)
+    has_flushed_changes = False
+    has_touched_game = False
+    _apply_story_game_patch_fields(
+        game,
+        payload,
+        _STORY_GAME_META_NON_NULL_FIELD_NORMALIZERS,
+        skip_null=True,
+    )
     if payload.visibility is not None:
         requested_visibility = normalize_story_game_visibility(payload.visibility)
-    if payload.age_rating is not None:
-        game.age_rating = normalize_story_game_age_rating(payload.age_rating)
-    if payload.genres is not None:
-        game.genres = serialize_story_game_genres(normalize_story_game_genres(payload.genres))
     if "cover_image_url" in payload.model_fields_set:
         game.cover_image_url = normalize_story_cover_image_url(payload.cover_image_url, db=db)
-    if payload.cover_scale is not None:
-        game.cover_scale = normalize_story_cover_scale(payload.cover_scale)
-    if payload.cover_position_x is not None:
-        game.cover_position_x = normalize_story_cover_position(payload.cover_position_x)
-    if payload.cover_position_y is not None:
-        game.cover_position_y = normalize_story_cover_position(payload.cover_position_y)
     if requested_visibility is not None:
         if requested_visibility == STORY_GAME_VISIBILITY_PUBLIC and game.source_world_id is None:
             mark_story_publication_pending(game)
             game.visibility = STORY_GAME_VISIBILITY_PRIVATE
             should_notify_publication_queue = previous_publication_status != "pending"
         else:
+            game.visibility = requested_visibility
             if requested_visibility == STORY_GAME_VISIBILITY_PRIVATE and game.source_world_id is None:
                 clear_story_publication_state(game)
-                _delete_story_game_publication_copies_for_source(db, source_game=game)
-            game.visibility = requested_visibility
+                has_touched_game = _touch_story_game_before_flush(db, game)
+                if _delete_story_game_publication_copies_for_source(db, source_game=game):
+                    has_flushed_changes = True
     if (str(game.visibility or "").strip().lower() == STORY_GAME_VISIBILITY_PUBLIC):
+        has_touched_game = _touch_story_game_before_flush(db, game) or has_touched_game
         main_hero_card_ids = db.scalars(
             select(StoryWorldCard.id).where(
                 StoryWorldCard.game_id == game.id,
@@ -4286,6 +4353,7 @@ def update_story_game_meta(
             )
         ).all()
         if main_hero_card_ids:
+            has_flushed_changes = True
             db.execute(
                 sa_update(StoryWorldCardChangeEvent)
                 .where(StoryWorldCardChangeEvent.world_card_id.in_(main_hero_card_ids))
@@ -4303,15 +4371,20 @@ def update_story_game_meta(
     # point the VN opening can be materialized with the complete speaker map, so the very
     # first screen after navigation already uses VisualNovelStage instead of the RPG intro.
     if normalize_story_game_mode(getattr(game, "game_mode", None)) == STORY_GAME_MODE_VISUAL_NOVEL:
-        ensure_story_novel_opening_scene_beats(
+        has_touched_game = _touch_story_game_before_flush(db, game) or has_touched_game
+        opening_bootstrap = ensure_story_novel_opening_scene_beats(
             db=db,
             game=game,
             world_cards=list_story_world_cards(db, int(game.id)),
         )
+        if opening_bootstrap.changed:
+            has_flushed_changes = True
 
-    touch_story_game(game)
+    if not has_flushed_changes and not db.is_modified(game, include_collections=False):
+        return _story_game_summary_response(db, game)
+    if not has_touched_game:
+        touch_story_game(game)
     db.commit()
-    db.refresh(game)
     if should_notify_publication_queue:
         game_title = str(game.title or "").strip() or f"Мир #{int(game.id)}"
         author_name = story_author_name(user)
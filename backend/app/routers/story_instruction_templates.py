@@ -1,7 +1,10 @@
-from sqlalchemy import case, delete as sa_delete, func, or_, select
+from typing import Any
+
+from sqlalchemy import bindparam, delete as sa_delete, func, insert as sa_insert, lambda_stmt, literal, or_, select
 from sqlalchemy.exc import IntegrityError
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
-from sqlalchemy.orm import Session, load_only
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session, aliased, load_only
 
 from app.database import get_db
 from app.models import (
@@ -21,10 +24,17 @@ from app.schemas import (
     StoryInstructionTemplateUpdateRequest,
 )
 from app.services.auth_identity import get_current_user
+from app.services.json_streaming import json_model_list_response
+from app.services.story_community_cache import (
+    STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE,
+    get_cached_story_community_list,
+    invalidate_story_community_list_cache,
+    store_cached_story_community_list,
+)
 from app.services.concurrency import (
-    apply_story_instruction_template_rating_insert,
-    apply_story_instruction_template_rating_update,
-    increment_story_instruction_template_additions,
+    apply_story_instruction_template_rating_upsert,
+    record_story_instruction_template_addition,
+    upsert_story_instruction_template_rating,
 )
 from app.services.story_cards import (
     STORY_TEMPLATE_VISIBILITY_PRIVATE,
@@ -120,6 +130,43 @@ router = APIRouter()
 STORY_INSTRUCTION_TEMPLATE_REPORT_STATUS_OPEN = "open"
 STORY_COMMUNITY_INSTRUCTION_SORT_OPTIONS = {"updated_desc", "rating_desc", "additions_desc"}
 STORY_COMMUNITY_ADDED_FILTER_OPTIONS = {"all", "added", "not_added"}
+_STORY_INSTRUCTION_TEMPLATE_LIST_ADAPTER = TypeAdapter(list[StoryInstructionTemplateOut])
+_STORY_COMMUNITY_INSTRUCTION_TEMPLATE_SUMMARY_LIST_ADAPTER = TypeAdapter(
+    list[StoryCommunityInstructionTemplateSummaryOut]
+)
+
+_STORY_INSTRUCTION_TEMPLATE_USER_COPY = aliased(StoryInstructionTemplate)
+_STORY_COMMUNITY_INSTRUCTION_TEMPLATE_VIEWER_STATE_STATEMENT = lambda_stmt(
+    lambda: select(
+        StoryInstructionTemplate,
+        User,
+        select(StoryCommunityInstructionTemplateRating.rating)
+        .where(
+            StoryCommunityInstructionTemplateRating.template_id == bindparam("template_id"),
+            StoryCommunityInstructionTemplateRating.user_id == bindparam("user_id"),
+        )
+        .limit(1)
+        .scalar_subquery()
+        .label("user_rating"),
+        select(_STORY_INSTRUCTION_TEMPLATE_USER_COPY.id)
+        .where(
+            _STORY_INSTRUCTION_TEMPLATE_USER_COPY.user_id == bindparam("user_id"),
+            _STORY_INSTRUCTION_TEMPLATE_USER_COPY.source_template_id == bindparam("template_id"),
+        )
+        .exists()
+        .label("is_added_by_user"),
+        select(StoryCommunityInstructionTemplateReport.id)
+        .where(
+            StoryCommunityInstructionTemplateReport.template_id == bindparam("template_id"),
+            StoryCommunityInstructionTemplateReport.reporter_user_id == bindparam("user_id"),
+        )
+        .exists()
+        .label("is_reported_by_user"),
+    )
+    .select_from(StoryInstructionTemplate)
+    .outerjoin(User, User.id == StoryInstructionTemplate.user_id)
+    .where(StoryInstructionTemplate.id == bindparam("template_id"))
+)
 
 
 def _normalize_story_community_instruction_sort(value: str | None) -> str:
@@ -179,41 +226,27 @@ def _build_story_community_instruction_template_summary(
     is_added_by_user_override: bool | None = None,
     is_reported_by_user_override: bool | None = None,
 ) -> StoryCommunityInstructionTemplateSummaryOut:
-    author = db.scalar(select(User).where(User.id == template.user_id))
+    # The template row (re-read over the session copy, so counters bumped by UPDATE statements are
+    # current), its author and the viewer's rating/copy/report state come back in one round-trip.
+    template, author, user_rating_value, is_added_by_user_value, is_reported_by_user_value = db.execute(
+        _STORY_COMMUNITY_INSTRUCTION_TEMPLATE_VIEWER_STATE_STATEMENT,
+        {"template_id": template.id, "user_id": user_id},
+        execution_options={"populate_existing": True},
+    ).one()
     if user_rating_override is None:
-        user_rating_value = db.scalar(
-            select(StoryCommunityInstructionTemplateRating.rating).where(
-                StoryCommunityInstructionTemplateRating.template_id == template.id,
-                StoryCommunityInstructionTemplateRating.user_id == user_id,
-            )
-        )
         user_rating = int(user_rating_value) if user_rating_value is not None else None
     else:
         user_rating = int(user_rating_override)
-
     if is_added_by_user_override is None:
-        user_template_copy_id = db.scalar(
-            select(StoryInstructionTemplate.id).where(
-                StoryInstructionTemplate.user_id == user_id,
-                StoryInstructionTemplate.source_template_id == template.id,
-            )
-        )
-        is_added_by_user = user_template_copy_id is not None
+        is_added_by_user = bool(is_added_by_user_value)
     else:
         is_added_by_user = bool(is_added_by_user_override)
-
     if is_reported_by_user_override is None:
-        user_report_id = db.scalar(
-            select(StoryCommunityInstructionTemplateReport.id).where(
-                StoryCommunityInstructionTemplateReport.template_id == template.id,
-                StoryCommunityInstructionTemplateReport.reporter_user_id == user_id,
-            )
-        )
-        is_reported_by_user = user_report_id is not None
+        is_reported_by_user = bool(is_reported_by_user_value)
     else:
         is_reported_by_user = bool(is_reported_by_user_override)
 
-    return StoryCommunityInstructionTemplateSummaryOut(
+    return StoryCommunityInstructionTemplateSummaryOut.model_construct(
         id=template.id,
         title=template.title,
         content=template.content,
@@ -234,6 +267,20 @@ def _build_story_community_instruction_template_summary(
     )
 
 
+def _story_community_instruction_template_summary_from_entry(
+    public_entry: dict[str, Any],
+    user_rating: int | None,
+    is_added_by_user: bool | None,
+    is_reported_by_user: bool | None,
+) -> StoryCommunityInstructionTemplateSummaryOut:
+    return StoryCommunityInstructionTemplateSummaryOut.model_construct(
+        **public_entry,
+        user_rating=int(user_rating) if user_rating is not None else None,
+        is_added_by_user=bool(is_added_by_user),
+        is_reported_by_user=bool(is_reported_by_user),
+    )
+
+
 def _create_story_instruction_template_publication_copy_from_source(
     db: Session,
     *,
@@ -255,24 +302,29 @@ def _create_story_instruction_template_publication_copy_from_source(
 
 
 def _delete_story_instruction_template_with_relations(db: Session, *, template_id: int) -> None:
-    db.execute(
+    relation_deletes = (
         sa_delete(StoryCommunityInstructionTemplateRating).where(
             StoryCommunityInstructionTemplateRating.template_id == template_id,
-        )
-    )
-    db.execute(
+        ),
         sa_delete(StoryCommunityInstructionTemplateAddition).where(
             StoryCommunityInstructionTemplateAddition.template_id == template_id,
-        )
-    )
-    db.execute(
+        ),
         sa_delete(StoryCommunityInstructionTemplateReport).where(
             StoryCommunityInstructionTemplateReport.template_id == template_id,
-        )
+        ),
     )
-    template = db.scalar(select(StoryInstructionTemplate).where(StoryInstructionTemplate.id == template_id))
-    if template is not None:
-        db.delete(template)
+    template_delete = sa_delete(StoryInstructionTemplate).where(StoryInstructionTemplate.id == template_id)
+    if db.get_bind().dialect.name == "postgresql":
+        # Foreign keys are checked at the end of the statement, so the relation rows can be
+        # removed by data-modifying CTEs in the same round-trip as the template itself.
+        for cte_index, relation_delete in enumerate(relation_deletes):
+            template_delete = template_delete.add_cte(relation_delete.cte(f"deleted_relations_{cte_index}"))
+        db.execute(template_delete)
+        return
+
+    for relation_delete in relation_deletes:
+        db.execute(relation_delete)
+    db.execute(template_delete)
 
 
 def _get_story_instruction_template_publication_copy(
@@ -294,10 +346,13 @@ def list_story_instruction_templates_route(
     query: str = Query(default="", max_length=120),
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> list[StoryInstructionTemplateOut]:
+) -> list[StoryInstructionTemplateOut] | Response:
     user = get_current_user(db, authorization)
-    templates = list_story_instruction_templates(db, user.id, limit=limit, offset=offset, query=query)
-    return [story_instruction_template_to_out(template) for template in templates]
+    template_rows = list_story_instruction_templates(db, user.id, limit=limit, offset=offset, query=query)
+    return json_model_list_response(
+        _STORY_INSTRUCTION_TEMPLATE_LIST_ADAPTER,
+        [story_instruction_template_to_out(template_row) for template_row in template_rows],
+    )
 
 
 @router.get("/api/story/community/instruction-templates", response_model=list[StoryCommunityInstructionTemplateSummaryOut])
@@ -309,18 +364,11 @@ def list_story_community_instruction_templates(
     added_filter: str = Query(default="all"),
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> list[StoryCommunityInstructionTemplateSummaryOut]:
+) -> list[StoryCommunityInstructionTemplateSummaryOut] | Response:
     user = get_current_user(db, authorization)
     normalized_sort = _normalize_story_community_instruction_sort(sort)
     normalized_query = _normalize_story_community_search_query(query)
     normalized_added_filter = _normalize_story_community_added_filter(added_filter)
-    rating_average_expr = case(
-        (
-            StoryInstructionTemplate.community_rating_count > 0,
-            (StoryInstructionTemplate.community_rating_sum * 1.0) / StoryInstructionTemplate.community_rating_count,
-        ),
-        else_=0.0,
-    )
     added_by_user_exists = (
         select(StoryCommunityInstructionTemplateAddition.id)
         .where(
@@ -329,9 +377,84 @@ def list_story_community_instruction_templates(
         )
         .exists()
     )
+    user_template_copy = aliased(StoryInstructionTemplate)
+    user_rating_column = (
+        select(StoryCommunityInstructionTemplateRating.rating)
+        .where(
+            StoryCommunityInstructionTemplateRating.template_id == StoryInstructionTemplate.id,
+            StoryCommunityInstructionTemplateRating.user_id == user.id,
+        )
+        .limit(1)
+        .scalar_subquery()
+    )
+    is_added_by_user_column = (
+        select(user_template_copy.id)
+        .where(
+            user_template_copy.user_id == user.id,
+            user_template_copy.source_template_id == StoryInstructionTemplate.id,
+        )
+        .exists()
+    )
+    is_reported_by_user_column = (
+        select(StoryCommunityInstructionTemplateReport.id)
+        .where(
+            StoryCommunityInstructionTemplateReport.template_id == StoryInstructionTemplate.id,
+            StoryCommunityInstructionTemplateReport.reporter_user_id == user.id,
+        )
+        .exists()
+    )
+
+    # The shared part of the page is cached per sort/search/page; the viewer's own state is always read live.
+    # The cache is per process, and moderation runs under /api/auth (a separate service in microservices
+    # mode), so its invalidation does not reach this cache. Visibility is therefore re-checked live on
+    # every hit: removed or unpublished templates drop out at once, and new approvals appear within the TTL.
+    cache_key = (
+        (normalized_sort, normalized_query, offset, limit)
+        if normalized_added_filter == "all"
+        else None
+    )
+    cached_entries = (
+        get_cached_story_community_list(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE, cache_key)
+        if cache_key is not None
+        else None
+    )
+    if cached_entries is not None:
+        if not cached_entries:
+            return []
+        viewer_state_by_template_id = {
+            template_id: (user_rating, is_added_by_user, is_reported_by_user)
+            for template_id, user_rating, is_added_by_user, is_reported_by_user in db.execute(
+                select(
+                    StoryInstructionTemplate.id,
+                    user_rating_column,
+                    is_added_by_user_column,
+                    is_reported_by_user_column,
+                ).where(
+                    StoryInstructionTemplate.id.in_([entry["id"] for entry in cached_entries]),
+                    StoryInstructionTemplate.visibility == "public",
+                )
+            ).all()
+        }
+        return json_model_list_response(
+            _STORY_COMMUNITY_INSTRUCTION_TEMPLATE_SUMMARY_LIST_ADAPTER,
+            [
+                _story_community_instruction_template_summary_from_entry(
+                    cached_entry,
+                    *viewer_state_by_template_id[cached_entry["id"]],
+                )
+                for cached_entry in cached_entries
+                if cached_entry["id"] in viewer_state_by_template_id
+            ]
+        )
 
     statement = (
-        select(StoryInstructionTemplate)
+        select(
+            StoryInstructionTemplate,
+            User,
+            user_rating_column.label("user_rating"),
+            is_added_by_user_column.label("is_added_by_user"),
+            is_reported_by_user_column.label("is_reported_by_user"),
+        )
         .options(
             load_only(
                 StoryInstructionTemplate.id,
@@ -339,12 +462,20 @@ def list_story_community_instruction_templates(
                 StoryInstructionTemplate.title,
                 StoryInstructionTemplate.content,
                 StoryInstructionTemplate.visibility,
-                StoryInstructionTemplate.community_rating_sum,
                 StoryInstructionTemplate.community_rating_count,
+                StoryInstructionTemplate.community_rating_avg,
                 StoryInstructionTemplate.community_additions_count,
                 StoryInstructionTemplate.created_at,
                 StoryInstructionTemplate.updated_at,
-            )
+            ),
+            load_only(
+                User.id,
+                User.email,
+                User.display_name,
+                User.avatar_url,
+                User.avatar_frame_id,
+                User.updated_at,
+            ),
         )
         .join(User, User.id == StoryInstructionTemplate.user_id)
         .where(StoryInstructionTemplate.visibility == "public")
@@ -366,7 +497,7 @@ def list_story_community_instruction_templates(
         statement = statement.order_by(StoryInstructionTemplate.created_at.desc(), StoryInstructionTemplate.id.desc())
     elif normalized_sort == "rating_desc":
         statement = statement.order_by(
-            rating_average_expr.desc(),
+            StoryInstructionTemplate.community_rating_avg.desc(),
             StoryInstructionTemplate.community_rating_count.desc(),
             StoryInstructionTemplate.created_at.desc(),
             StoryInstructionTemplate.id.desc(),
@@ -378,81 +509,47 @@ def list_story_community_instruction_templates(
             StoryInstructionTemplate.id.desc(),
         )
 
-    templates = db.scalars(statement.offset(offset).limit(limit)).all()
-    if not templates:
+    rows = db.execute(statement.offset(offset).limit(limit)).all()
+    if not rows:
+        if cache_key is not None:
+            store_cached_story_community_list(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE, cache_key, ())
         return []
 
-    template_ids = [template.id for template in templates]
-    author_ids = sorted({template.user_id for template in templates})
-    authors = db.scalars(
-        select(User)
-        .options(
-            load_only(
-                User.id,
-                User.email,
-                User.display_name,
-                User.avatar_url,
-                User.avatar_frame_id,
-                User.updated_at,
-            )
-        )
-        .where(User.id.in_(author_ids))
-    ).all()
+    authors = list({row[1].id: row[1] for row in rows}.values())
     author_name_by_id = {author.id: story_author_name(author) for author in authors}
     author_avatar_by_id = {author.id: story_author_avatar_url(author) for author in authors}
     author_avatar_frame_by_id = {author.id: story_author_avatar_frame_id(author) for author in authors}
     author_avatar_frame_image_by_id = {author.id: story_author_avatar_frame_image_url(db, author) for author in authors}
 
-    user_rating_rows = db.scalars(
-        select(StoryCommunityInstructionTemplateRating).where(
-            StoryCommunityInstructionTemplateRating.user_id == user.id,
-            StoryCommunityInstructionTemplateRating.template_id.in_(template_ids),
-        )
-    ).all()
-    user_rating_by_template_id = {row.template_id: int(row.rating) for row in user_rating_rows}
-
-    user_added_template_source_ids = db.scalars(
-        select(StoryInstructionTemplate.source_template_id).where(
-            StoryInstructionTemplate.user_id == user.id,
-            StoryInstructionTemplate.source_template_id.in_(template_ids),
-        )
-    ).all()
-    added_template_ids = {
-        int(source_template_id)
-        for source_template_id in user_added_template_source_ids
-        if isinstance(source_template_id, int)
-    }
-
-    user_report_rows = db.scalars(
-        select(StoryCommunityInstructionTemplateReport).where(
-            StoryCommunityInstructionTemplateReport.reporter_user_id == user.id,
-            StoryCommunityInstructionTemplateReport.template_id.in_(template_ids),
-        )
-    ).all()
-    reported_template_ids = {row.template_id for row in user_report_rows}
-
-    return [
-        StoryCommunityInstructionTemplateSummaryOut(
-            id=template.id,
-            title=template.title,
-            content=template.content,
-            visibility=coerce_story_instruction_template_visibility(getattr(template, "visibility", None)),
-            author_id=template.user_id,
-            author_name=author_name_by_id.get(template.user_id, "Unknown"),
-            author_avatar_url=author_avatar_by_id.get(template.user_id),
-            author_avatar_frame_id=author_avatar_frame_by_id.get(template.user_id, "none"),
-            author_avatar_frame_image_url=author_avatar_frame_image_by_id.get(template.user_id),
-            community_rating_avg=story_instruction_template_rating_average(template),
-            community_rating_count=max(int(getattr(template, "community_rating_count", 0) or 0), 0),
-            community_additions_count=max(int(getattr(template, "community_additions_count", 0) or 0), 0),
-            user_rating=user_rating_by_template_id.get(template.id),
-            is_added_by_user=template.id in added_template_ids,
-            is_reported_by_user=template.id in reported_template_ids,
-            created_at=template.created_at,
-            updated_at=template.updated_at,
-        )
-        for template in templates
-    ]
+    public_entries = tuple(
+        {
+            "id": template.id,
+            "title": template.title,
+            "content": template.content,
+            "visibility": coerce_story_instruction_template_visibility(getattr(template, "visibility", None)),
+            "author_id": template.user_id,
+            "author_name": author_name_by_id.get(template.user_id, "Unknown"),
+            "author_avatar_url": author_avatar_by_id.get(template.user_id),
+            "author_avatar_frame_id": author_avatar_frame_by_id.get(template.user_id, "none"),
+            "author_avatar_frame_image_url": author_avatar_frame_image_by_id.get(template.user_id),
+            "community_rating_avg": story_instruction_template_rating_average(template),
+            "community_rating_count": max(int(getattr(template, "community_rating_count", 0) or 0), 0),
+            "community_additions_count": max(int(getattr(template, "community_additions_count", 0) or 0), 0),
+            "created_at": template.created_at,
+            "updated_at": template.updated_at,
+        }
+        for template, *_ in rows
+    )
+    if cache_key is not None:
+        store_cached_story_community_list(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE, cache_key, public_entries)
+
+    return json_model_list_response(
+        _STORY_COMMUNITY_INSTRUCTION_TEMPLATE_SUMMARY_LIST_ADAPTER,
+        [
+            _story_community_instruction_template_summary_from_entry(public_entry, *row[2:])
+            for public_entry, row in zip(public_entries, rows)
+        ]
+    )
 
 
 @router.get("/api/story/community/instruction-templates/{template_id}", response_model=StoryCommunityInstructionTemplateSummaryOut)
@@ -483,41 +580,16 @@ def rate_story_community_instruction_template(
     if rating_value <= 0:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Rating should be between 1 and 5")
 
-    existing_rating = db.scalar(
-        select(StoryCommunityInstructionTemplateRating).where(
-            StoryCommunityInstructionTemplateRating.template_id == template.id,
-            StoryCommunityInstructionTemplateRating.user_id == user.id,
-        )
+    previous_rating = upsert_story_instruction_template_rating(
+        db,
+        template_id=template.id,
+        user_id=user.id,
+        rating_value=rating_value,
     )
-    if existing_rating is None:
-        inserted_rating: StoryCommunityInstructionTemplateRating | None = None
-        try:
-            with db.begin_nested():
-                inserted_rating = StoryCommunityInstructionTemplateRating(
-                    template_id=template.id,
-                    user_id=user.id,
-                    rating=rating_value,
-                )
-                db.add(inserted_rating)
-                db.flush()
-            apply_story_instruction_template_rating_insert(db, template.id, rating_value)
-            existing_rating = inserted_rating
-        except IntegrityError:
-            existing_rating = db.scalar(
-                select(StoryCommunityInstructionTemplateRating).where(
-                    StoryCommunityInstructionTemplateRating.template_id == template.id,
-                    StoryCommunityInstructionTemplateRating.user_id == user.id,
-                )
-            )
-
-    if existing_rating is not None:
-        previous_rating = int(existing_rating.rating)
-        if previous_rating != rating_value:
-            existing_rating.rating = rating_value
-            apply_story_instruction_template_rating_update(db, template.id, rating_value - previous_rating)
+    apply_story_instruction_template_rating_upsert(db, template.id, rating_value, previous_rating)
 
     db.commit()
-    db.refresh(template)
+    invalidate_story_community_list_cache(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE)
     return _build_story_community_instruction_template_summary(
         db,
         user_id=user.id,
@@ -582,7 +654,6 @@ def report_story_community_instruction_template(
         action_url=f"/profile?admin=reports&target_type=instruction_template&target_id={int(template.id)}",
         actor_user_id=int(user.id),
     )
-    db.refresh(template)
     return _build_story_community_instruction_template_summary(
         db,
         user_id=user.id,
@@ -605,52 +676,44 @@ def add_story_community_instruction_template_to_account(
             detail="You cannot add your own public instruction template",
         )
 
-    existing_addition_id = db.scalar(
-        select(StoryCommunityInstructionTemplateAddition.id).where(
-            StoryCommunityInstructionTemplateAddition.template_id == template.id,
-            StoryCommunityInstructionTemplateAddition.user_id == user.id,
-        )
-    )
-    addition_inserted = False
-    if existing_addition_id is None:
-        try:
-            with db.begin_nested():
-                db.add(
-                    StoryCommunityInstructionTemplateAddition(
-                        template_id=template.id,
-                        user_id=user.id,
-                    )
+    addition_inserted = record_story_instruction_template_addition(db, template_id=template.id, user_id=user.id)
+    # Copy the template into the user's account unless an earlier add already did.
+    db.execute(
+        sa_insert(StoryInstructionTemplate).from_select(
+            [
+                StoryInstructionTemplate.user_id,
+                StoryInstructionTemplate.title,
+                StoryInstructionTemplate.content,
+                StoryInstructionTemplate.visibility,
+                StoryInstructionTemplate.source_template_id,
+                StoryInstructionTemplate.community_rating_sum,
+                StoryInstructionTemplate.community_rating_count,
+                StoryInstructionTemplate.community_additions_count,
+            ],
+            select(
+                literal(user.id),
+                StoryInstructionTemplate.title,
+                StoryInstructionTemplate.content,
+                literal(STORY_TEMPLATE_VISIBILITY_PRIVATE),
+                StoryInstructionTemplate.id,
+                literal(0),
+                literal(0),
+                literal(0),
+            ).where(
+                StoryInstructionTemplate.id == template.id,
+                ~select(_STORY_INSTRUCTION_TEMPLATE_USER_COPY.id)
+                .where(
+                    _STORY_INSTRUCTION_TEMPLATE_USER_COPY.user_id == user.id,
+                    _STORY_INSTRUCTION_TEMPLATE_USER_COPY.source_template_id == template.id,
                 )
-                db.flush()
-            addition_inserted = True
-        except IntegrityError:
-            addition_inserted = False
-
-    if addition_inserted:
-        increment_story_instruction_template_additions(db, template.id)
-
-    existing_copy_id = db.scalar(
-        select(StoryInstructionTemplate.id).where(
-            StoryInstructionTemplate.user_id == user.id,
-            StoryInstructionTemplate.source_template_id == template.id,
+                .exists(),
+            ),
         )
     )
-    if existing_copy_id is None:
-        db.add(
-            StoryInstructionTemplate(
-                user_id=user.id,
-                title=template.title,
-                content=template.content,
-                visibility=STORY_TEMPLATE_VISIBILITY_PRIVATE,
-                source_template_id=template.id,
-                community_rating_sum=0,
-                community_rating_count=0,
-                community_additions_count=0,
-            )
-        )
 
     db.commit()
-    db.refresh(template)
+    if addition_inserted:
+        invalidate_story_community_list_cache(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE)
     return _build_story_community_instruction_template_summary(
         db,
         user_id=user.id,
@@ -711,6 +774,7 @@ def update_story_instruction_template(
     template.content = normalize_story_instruction_content(payload.content)
     requested_visibility: str | None = None
     should_notify_publication_queue = False
+    has_deleted_publication_copy = False
     if payload.visibility is not None:
         requested_visibility = normalize_story_instruction_template_visibility(payload.visibility)
     if requested_visibility is not None:
@@ -727,8 +791,12 @@ def update_story_instruction_template(
                 )
                 if publication_copy is not None:
                     _delete_story_instruction_template_with_relations(db, template_id=int(publication_copy.id))
+                    has_deleted_publication_copy = True
             template.visibility = requested_visibility
+    if not has_deleted_publication_copy and not db.is_modified(template, include_collections=False):
+        return story_instruction_template_to_out(template)
     db.commit()
+    invalidate_story_community_list_cache(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE)
     db.refresh(template)
     if should_notify_publication_queue:
         template_title = str(template.title or "").strip() or f"Карточка #{int(template.id)}"
@@ -754,4 +822,5 @@ def delete_story_instruction_template(
     template = get_story_instruction_template_for_user_or_404(db, user.id, template_id)
     _delete_story_instruction_template_with_relations(db, template_id=template.id)
     db.commit()
+    invalidate_story_community_list_cache(STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE)
     return MessageResponse(message="Instruction template deleted")
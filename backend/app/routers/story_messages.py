@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
-from sqlalchemy import delete as sa_delete, select
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy import bindparam, delete as sa_delete, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import StoryMemoryBlock, StoryMessage, StoryNovelBeat, StoryWorldCard
 from app.schemas import StoryMessageOut, StoryMessageSelectVariantRequest, StoryMessageUpdateRequest
-from app.services.auth_identity import get_current_user
+from app.services.json_streaming import json_model_response
 from app.services.story_memory import (
     STORY_MEMORY_LAYER_COMPRESSED,
     STORY_MEMORY_LAYER_FACTS,
@@ -33,7 +33,7 @@ from app.services.story_novel import (
     is_story_visual_novel_enabled,
     persist_story_novel_beats_for_message,
 )
-from app.services.story_queries import get_user_story_game_or_404, touch_story_game
+from app.services.story_queries import get_current_user_story_game_or_404, touch_story_game
 from app.services.story_text import normalize_story_text
 
 router = APIRouter()
@@ -50,6 +50,13 @@ _STORY_INLINE_EDIT_REPLACEABLE_MEMORY_LAYERS = {
     STORY_MEMORY_LAYER_FACTS,
     STORY_MEMORY_LAYER_RAW_PENDING,
 }
+_STORY_ACTIVE_MESSAGE_STATEMENT = lambda_stmt(
+    lambda: select(StoryMessage).where(
+        StoryMessage.id == bindparam("message_id"),
+        StoryMessage.game_id == bindparam("game_id"),
+        StoryMessage.undone_at.is_(None),
+    )
+)
 
 
 def _acquire_story_operation_lease_or_409(*, game_id: int, operation: str):
@@ -340,17 +347,13 @@ def update_story_message(
     payload: StoryMessageUpdateRequest,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> StoryMessageOut:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
+) -> StoryMessageOut | Response:
+    user, game = get_current_user_story_game_or_404(db, authorization, game_id)
 
     with _acquire_story_operation_lease_or_409(game_id=game.id, operation="story_message_update"):
         message = db.scalar(
-            select(StoryMessage).where(
-                StoryMessage.id == message_id,
-                StoryMessage.game_id == game.id,
-                StoryMessage.undone_at.is_(None),
-            )
+            _STORY_ACTIVE_MESSAGE_STATEMENT,
+            {"message_id": message_id, "game_id": game.id},
         )
         if message is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
@@ -406,7 +409,7 @@ def update_story_message(
                 detail="Failed to update story message",
             ) from exc
         db.refresh(message)
-        return story_message_to_out(message)
+        return json_model_response(story_message_to_out(message))
 
 
 @router.post(
@@ -419,11 +422,10 @@ def select_story_message_variant(
     payload: StoryMessageSelectVariantRequest,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> StoryMessageOut:
+) -> StoryMessageOut | Response:
     """Switch the displayed/canonical text of the last assistant message to one of its
     discarded reroll variants (or back to the newest one), without re-running generation."""
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
+    user, game = get_current_user_story_game_or_404(db, authorization, game_id)
 
     with _acquire_story_operation_lease_or_409(game_id=game.id, operation="story_message_select_variant"):
         message = db.scalar(
@@ -480,5 +482,5 @@ def select_story_message_variant(
                 detail="Failed to switch story message variant",
             ) from exc
         db.refresh(message)
-        return story_message_to_out(message)
+        return json_model_response(story_message_to_out(message))
 
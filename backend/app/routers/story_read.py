@@ -3,8 +3,7 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, Depends, Header, Response
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -12,7 +11,7 @@ from app.models import (
     StoryCommunityWorldFavorite,
     StoryCommunityWorldRating,
     StoryCommunityWorldReport,
-    StoryCommunityWorldView,
+    StoryGame,
     StoryMessage,
     User,
 )
@@ -25,7 +24,8 @@ from app.schemas import (
     StoryTurnImageOut,
 )
 from app.services.auth_identity import get_current_user
-from app.services.concurrency import increment_story_world_views
+from app.services.concurrency import record_story_world_view
+from app.services.json_streaming import json_model_response
 from app.services.story_cards import story_plot_card_to_out
 from app.services.story_games import (
     count_story_completed_turns,
@@ -65,6 +65,7 @@ from app.services.story_queries import (
     list_story_turn_images,
     list_story_plot_cards,
     list_story_world_cards,
+    load_story_turn_count_by_game_id,
 )
 from app.services.story_world_comments import list_story_community_world_comments_out
 from app.services.story_world_cards import story_world_card_to_out
@@ -73,6 +74,36 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 _DEV_MEMORY_LAYERS = {"raw", "compressed", "super"}
 _STORY_GAME_MESSAGES_DEFAULT_ASSISTANT_TURNS = 20
+_STORY_COMMUNITY_WORLD_VIEWER_STATE_STATEMENT = lambda_stmt(
+    lambda: select(
+        User,
+        select(StoryCommunityWorldRating.rating)
+        .where(
+            StoryCommunityWorldRating.world_id == bindparam("world_id"),
+            StoryCommunityWorldRating.user_id == bindparam("user_id"),
+        )
+        .limit(1)
+        .scalar_subquery()
+        .label("user_rating"),
+        select(StoryCommunityWorldReport.id)
+        .where(
+            StoryCommunityWorldReport.world_id == bindparam("world_id"),
+            StoryCommunityWorldReport.reporter_user_id == bindparam("user_id"),
+        )
+        .exists()
+        .label("is_reported_by_user"),
+        select(StoryCommunityWorldFavorite.id)
+        .where(
+            StoryCommunityWorldFavorite.world_id == bindparam("world_id"),
+            StoryCommunityWorldFavorite.user_id == bindparam("user_id"),
+        )
+        .exists()
+        .label("is_favorited_by_user"),
+    )
+    .select_from(StoryGame)
+    .outerjoin(User, User.id == StoryGame.user_id)
+    .where(StoryGame.id == bindparam("world_id"))
+)
 
 
 def _safe_story_read_map(
@@ -308,10 +339,15 @@ def _build_story_game_out_resilient(
         )
         can_redo_assistant_step = False
     try:
-        summary_messages = messages if not has_older_messages else list_story_messages(db, resolved_game_id)
+        # Older pages only matter for the turn count, so scan roles instead of loading full messages.
+        turn_count = (
+            load_story_turn_count_by_game_id(db, game_ids=[resolved_game_id]).get(resolved_game_id, 0)
+            if has_older_messages
+            else count_story_completed_turns(messages)
+        )
         game_summary = story_game_summary_to_out(
             game,
-            turn_count=count_story_completed_turns(summary_messages),
+            turn_count=turn_count,
         )
     except Exception:
         logger.exception(
@@ -510,70 +546,43 @@ def get_story_community_world(
     world_id: int,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> StoryCommunityWorldOut:
+) -> StoryCommunityWorldOut | Response:
     user = get_current_user(db, authorization)
     world = get_public_story_world_or_404(db, world_id)
-    view_inserted = False
-    try:
-        with db.begin_nested():
-            db.add(
-                StoryCommunityWorldView(
-                    world_id=world.id,
-                    user_id=user.id,
-                )
-            )
-            db.flush()
-        view_inserted = True
-    except IntegrityError:
-        view_inserted = False
-
+    view_inserted = record_story_world_view(db, world_id=world.id, user_id=user.id)
     snapshot_backfilled = ensure_story_game_public_card_snapshots(db, world)
-    if view_inserted:
-        increment_story_world_views(db, world.id)
     if view_inserted or snapshot_backfilled:
         db.commit()
         db.refresh(world)
 
-    author = db.scalar(select(User).where(User.id == world.user_id))
-    user_rating = db.scalar(
-        select(StoryCommunityWorldRating.rating).where(
-            StoryCommunityWorldRating.world_id == world.id,
-            StoryCommunityWorldRating.user_id == user.id,
-        )
-    )
-    user_report = db.scalar(
-        select(StoryCommunityWorldReport.id).where(
-            StoryCommunityWorldReport.world_id == world.id,
-            StoryCommunityWorldReport.reporter_user_id == user.id,
-        )
-    )
-    user_favorite = db.scalar(
-        select(StoryCommunityWorldFavorite.id).where(
-            StoryCommunityWorldFavorite.world_id == world.id,
-            StoryCommunityWorldFavorite.user_id == user.id,
-        )
-    )
+    # Author and the viewer's rating/report/favorite state come back in one round-trip.
+    author, user_rating, is_reported_by_user, is_favorited_by_user = db.execute(
+        _STORY_COMMUNITY_WORLD_VIEWER_STATE_STATEMENT,
+        {"world_id": world.id, "user_id": user.id},
+    ).one()
     instruction_cards, plot_cards, world_cards = get_story_game_public_cards_out(db, world)
     comments = list_story_community_world_comments_out(db, world_id=world.id)
 
-    return StoryCommunityWorldOut(
-        world=story_community_world_summary_to_out(
-            world,
-            author_id=world.user_id,
-            author_name=story_author_name(author),
-            author_avatar_url=story_author_avatar_url(author),
-            user_rating=int(user_rating) if user_rating is not None else None,
-            is_reported_by_user=user_report is not None,
-            is_favorited_by_user=user_favorite is not None,
-        ),
-        context_limit_chars=normalize_story_context_limit_chars(
-            getattr(world, "context_limit_chars", None),
-            model_name=getattr(world, "story_llm_model", None),
-        ),
-        instruction_cards=instruction_cards,
-        plot_cards=plot_cards,
-        world_cards=world_cards,
-        comments=comments,
+    return json_model_response(
+        StoryCommunityWorldOut(
+            world=story_community_world_summary_to_out(
+                world,
+                author_id=world.user_id,
+                author_name=story_author_name(author),
+                author_avatar_url=story_author_avatar_url(author),
+                user_rating=int(user_rating) if user_rating is not None else None,
+                is_reported_by_user=bool(is_reported_by_user),
+                is_favorited_by_user=bool(is_favorited_by_user),
+            ),
+            context_limit_chars=normalize_story_context_limit_chars(
+                getattr(world, "context_limit_chars", None),
+                model_name=getattr(world, "story_llm_model", None),
+            ),
+            instruction_cards=instruction_cards,
+            plot_cards=plot_cards,
+            world_cards=world_cards,
+            comments=comments,
+        )
     )
 
 
@@ -585,11 +594,14 @@ def get_story_game(
     before_message_id: int | None = None,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> StoryGameOut:
-    response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    response.headers["Vary"] = "Authorization"
+) -> StoryGameOut | Response:
+    response_headers = {
+        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+        "Pragma": "no-cache",
+        "Expires": "0",
+        "Vary": "Authorization",
+    }
+    response.headers.update(response_headers)
     user = get_current_user(db, authorization)
     try:
         game = get_user_story_game_or_404(db, user.id, game_id)
@@ -611,13 +623,16 @@ def get_story_game(
             assistant_turns_limit=assistant_turns_limit,
             before_message_id=before_message_id,
         )
-        return _build_story_game_out_resilient(
-            db=db,
-            game=game,
-            user=user,
-            requested_game_id=game_id,
-            messages=list(messages),
-            has_older_messages=has_older_messages,
+        return json_model_response(
+            _build_story_game_out_resilient(
+                db=db,
+                game=game,
+                user=user,
+                requested_game_id=game_id,
+                messages=list(messages),
+                has_older_messages=has_older_messages,
+            ),
+            headers=response_headers,
         )
     except Exception:
         logger.exception("Story read primary route failed, retrying legacy load: requested_game_id=%s", game_id)
@@ -627,11 +642,14 @@ def get_story_game(
             pass
         game = get_user_story_game_or_404(db, user.id, game_id)
         messages = list_story_messages(db, int(getattr(game, "id", 0) or 0))
-        return _build_story_game_out_resilient(
-            db=db,
-            game=game,
-            user=user,
-            requested_game_id=game_id,
-            messages=list(messages),
-            has_older_messages=False,
+        return json_model_response(
+            _build_story_game_out_resilient(
+                db=db,
+                game=game,
+                user=user,
+                requested_game_id=game_id,
+                messages=list(messages),
+                has_older_messages=False,
+            ),
+            headers=response_headers,
         )
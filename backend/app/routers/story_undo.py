@@ -1,20 +1,20 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import StoryPlotCardChangeEvent, StoryWorldCardChangeEvent
 from app.schemas import MessageResponse
-from app.services.auth_identity import get_current_user
+from app.services.json_streaming import json_model_response
 from app.services.story_game_operation_lock import (
     STORY_GAME_OPERATION_BUSY_DETAIL,
     StoryGameOperationBusyError,
     acquire_story_game_operation_lock,
 )
 from app.services.story_generation_cancel import cancel_story_generation
-from app.services.story_queries import get_user_story_game_or_404
+from app.services.story_queries import get_current_user_story_game_or_404
 from app.services.story_undo import (
     redo_story_assistant_step,
     undo_story_assistant_step,
@@ -25,6 +25,18 @@ from app.services.story_undo import (
 router = APIRouter()
 _STORY_OPERATION_LOCK_TIMEOUT_SECONDS = 3.0
 _STORY_OPERATION_LOCK_CANCEL_WAIT_SECONDS = 20.0
+_STORY_WORLD_CARD_EVENT_STATEMENT = lambda_stmt(
+    lambda: select(StoryWorldCardChangeEvent).where(
+        StoryWorldCardChangeEvent.id == bindparam("event_id"),
+        StoryWorldCardChangeEvent.game_id == bindparam("game_id"),
+    )
+)
+_STORY_PLOT_CARD_EVENT_STATEMENT = lambda_stmt(
+    lambda: select(StoryPlotCardChangeEvent).where(
+        StoryPlotCardChangeEvent.id == bindparam("event_id"),
+        StoryPlotCardChangeEvent.game_id == bindparam("game_id"),
+    )
+)
 
 
 def _acquire_story_operation_lease_or_409(*, game_id: int, operation: str):
@@ -59,9 +71,8 @@ def undo_story_assistant_step_route(
     game_id: int,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> MessageResponse:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
+) -> MessageResponse | Response:
+    _, game = get_current_user_story_game_or_404(db, authorization, game_id)
     with _acquire_story_operation_lease_or_409(game_id=game.id, operation="story_assistant_step_undo"):
         action = undo_story_assistant_step(db=db, game=game)
 
@@ -73,7 +84,7 @@ def undo_story_assistant_step_route(
         message = "User message reverted"
     else:
         message = "Rollback step applied"
-    return MessageResponse(message=message)
+    return json_model_response(MessageResponse(message=message))
 
 
 @router.post("/api/story/games/{game_id}/assistant-step/redo", response_model=MessageResponse)
@@ -81,9 +92,8 @@ def redo_story_assistant_step_route(
     game_id: int,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> MessageResponse:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
+) -> MessageResponse | Response:
+    _, game = get_current_user_story_game_or_404(db, authorization, game_id)
     with _acquire_story_operation_lease_or_409(game_id=game.id, operation="story_assistant_step_redo"):
         action = redo_story_assistant_step(db=db, game=game)
 
@@ -95,7 +105,7 @@ def redo_story_assistant_step_route(
         message = "User message restored"
     else:
         message = "Restore step applied"
-    return MessageResponse(message=message)
+    return json_model_response(MessageResponse(message=message))
 
 
 @router.post("/api/story/games/{game_id}/world-card-events/{event_id}/undo", response_model=MessageResponse)
@@ -104,21 +114,15 @@ def undo_story_world_card_event_route(
     event_id: int,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> MessageResponse:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
+) -> MessageResponse | Response:
+    _, game = get_current_user_story_game_or_404(db, authorization, game_id)
     with _acquire_story_operation_lease_or_409(game_id=game.id, operation="story_world_event_undo"):
-        event = db.scalar(
-            select(StoryWorldCardChangeEvent).where(
-                StoryWorldCardChangeEvent.id == event_id,
-                StoryWorldCardChangeEvent.game_id == game.id,
-            )
-        )
+        event = db.scalar(_STORY_WORLD_CARD_EVENT_STATEMENT, {"event_id": event_id, "game_id": game.id})
         if event is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="World card event not found")
 
         undo_story_world_card_change_event(db, game, event)
-    return MessageResponse(message="World card change reverted")
+    return json_model_response(MessageResponse(message="World card change reverted"))
 
 
 @router.post("/api/story/games/{game_id}/plot-card-events/{event_id}/undo", response_model=MessageResponse)
@@ -127,18 +131,12 @@ def undo_story_plot_card_event_route(
     event_id: int,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> MessageResponse:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
+) -> MessageResponse | Response:
+    _, game = get_current_user_story_game_or_404(db, authorization, game_id)
     with _acquire_story_operation_lease_or_409(game_id=game.id, operation="story_plot_event_undo"):
-        event = db.scalar(
-            select(StoryPlotCardChangeEvent).where(
-                StoryPlotCardChangeEvent.id == event_id,
-                StoryPlotCardChangeEvent.game_id == game.id,
-            )
-        )
+        event = db.scalar(_STORY_PLOT_CARD_EVENT_STATEMENT, {"event_id": event_id, "game_id": game.id})
         if event is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plot card event not found")
 
         undo_story_plot_card_change_event(db, game, event)
-    return MessageResponse(message="Plot card change reverted")
+    return json_model_response(MessageResponse(message="Plot card change reverted"))
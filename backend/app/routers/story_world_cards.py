@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
-from sqlalchemy import func, or_, select, update as sa_update
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import delete as sa_delete, func, or_, select, update as sa_update
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -23,6 +25,7 @@ from app.schemas import (
     StoryWorldCardUpdateRequest,
 )
 from app.services.auth_identity import get_current_user
+from app.services.json_streaming import json_model_list_response
 from app.services.media import resolve_media_storage_value
 from app.services.story_characters import (
     normalize_story_avatar_scale,
@@ -41,10 +44,11 @@ from app.services.story_character_state_fields import (
     sync_story_character_state_payload_from_world_cards,
 )
 from app.services.story_queries import (
+    get_current_user_story_game_or_404,
     get_story_character_for_user_or_404,
     get_story_main_hero_card,
-    get_user_story_game_or_404,
-    list_story_world_cards,
+    get_user_story_game_world_card_or_404,
+    list_story_world_card_rows,
     touch_story_game,
 )
 from app.services.story_world_cards import (
@@ -75,8 +79,10 @@ from app.services.story_world_card_templates import (
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
+_STORY_WORLD_CARD_LIST_ADAPTER = TypeAdapter(list[StoryWorldCardOut])
 
 
+@lru_cache(maxsize=4096)
 def _normalize_character_identity_name(value: str) -> str:
     return " ".join(str(value or "").split()).strip().casefold()
 
@@ -88,6 +94,46 @@ def _is_same_character_identity(card: StoryWorldCard, *, character_id: int, norm
     return bool(card_name and card_name == normalized_name)
 
 
+def _list_story_world_cards_of_kind(db: Session, *, game_id: int, kind: str) -> list[StoryWorldCard]:
+    return db.scalars(
+        select(StoryWorldCard)
+        .where(
+            StoryWorldCard.game_id == game_id,
+            StoryWorldCard.kind == kind,
+        )
+        .order_by(StoryWorldCard.id.asc())
+    ).all()
+
+
+def _find_story_character_identity_cards(
+    db: Session,
+    *,
+    game_id: int,
+    character_id: int,
+    normalized_name: str,
+) -> tuple[StoryWorldCard | None, StoryWorldCard | None]:
+    # Only main hero and NPC cards can carry a character identity, so the other kinds are never loaded.
+    existing_main_hero: StoryWorldCard | None = None
+    existing_npc: StoryWorldCard | None = None
+    for card in db.scalars(
+        select(StoryWorldCard)
+        .where(
+            StoryWorldCard.game_id == game_id,
+            StoryWorldCard.kind.in_((STORY_WORLD_CARD_KIND_MAIN_HERO, STORY_WORLD_CARD_KIND_NPC)),
+        )
+        .order_by(StoryWorldCard.id.asc())
+    ):
+        if not _is_same_character_identity(card, character_id=character_id, normalized_name=normalized_name):
+            continue
+        if card.kind == STORY_WORLD_CARD_KIND_MAIN_HERO:
+            existing_main_hero = existing_main_hero or card
+        else:
+            existing_npc = existing_npc or card
+        if existing_main_hero is not None and existing_npc is not None:
+            break
+    return existing_main_hero, existing_npc
+
+
 def _refresh_public_story_game_snapshots_if_needed(db: Session, game) -> None:
     if (str(getattr(game, "visibility", "") or "").strip().lower() != STORY_GAME_VISIBILITY_PUBLIC):
         return
@@ -267,11 +313,13 @@ def list_story_world_cards_route(
     game_id: int,
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
-) -> list[StoryWorldCardOut]:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
-    cards = list_story_world_cards(db, game.id)
-    return [story_world_card_to_out(card) for card in cards]
+) -> list[StoryWorldCardOut] | Response:
+    _, game = get_current_user_story_game_or_404(db, authorization, game_id)
+    card_rows = list_story_world_card_rows(db, game.id)
+    return json_model_list_response(
+        _STORY_WORLD_CARD_LIST_ADAPTER,
+        [story_world_card_to_out(card_row) for card_row in card_rows],
+    )
 
 
 @router.post("/api/story/games/{game_id}/main-hero", response_model=StoryWorldCardOut)
@@ -281,28 +329,18 @@ def select_story_main_hero(
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
 ) -> StoryWorldCardOut:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
+    user, game = get_current_user_story_game_or_404(db, authorization, game_id)
     if _is_public_story_game(game):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Public worlds are published without a main hero",
         )
     character = get_story_character_for_user_or_404(db, user.id, payload.character_id)
-    normalized_character_name = _normalize_character_identity_name(character.name)
-    existing_cards = list_story_world_cards(db, game.id)
-    existing_npc = next(
-        (
-            card
-            for card in existing_cards
-            if normalize_story_world_card_kind(card.kind) == STORY_WORLD_CARD_KIND_NPC
-            and _is_same_character_identity(
-                card,
-                character_id=payload.character_id,
-                normalized_name=normalized_character_name,
-            )
-        ),
-        None,
+    existing_main_hero, existing_npc = _find_story_character_identity_cards(
+        db,
+        game_id=game.id,
+        character_id=payload.character_id,
+        normalized_name=_normalize_character_identity_name(character.name),
     )
     if existing_npc is not None:
         raise HTTPException(
@@ -310,24 +348,10 @@ def select_story_main_hero(
             detail="This character is already selected as NPC",
         )
 
-    existing_main_hero = next(
-        (
-            card
-            for card in existing_cards
-            if normalize_story_world_card_kind(card.kind) == STORY_WORLD_CARD_KIND_MAIN_HERO
-            and _is_same_character_identity(
-                card,
-                character_id=payload.character_id,
-                normalized_name=normalized_character_name,
-            )
-        ),
-        None,
-    )
     if existing_main_hero is not None:
         game.active_main_hero_card_id = int(existing_main_hero.id)
         touch_story_game(game)
         db.commit()
-        db.refresh(existing_main_hero)
         return story_world_card_to_out(existing_main_hero)
 
     main_hero_card = build_story_world_card_from_character(
@@ -348,7 +372,6 @@ def select_story_main_hero(
     touch_story_game(game)
     _refresh_public_story_game_snapshots_if_needed(db, game)
     db.commit()
-    db.refresh(main_hero_card)
     return story_world_card_to_out(main_hero_card)
 
 
@@ -359,23 +382,13 @@ def create_story_npc_from_character(
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
 ) -> StoryWorldCardOut:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
+    user, game = get_current_user_story_game_or_404(db, authorization, game_id)
     character = get_story_character_for_user_or_404(db, user.id, payload.character_id)
-    normalized_character_name = _normalize_character_identity_name(character.name)
-    existing_cards = list_story_world_cards(db, game.id)
-    existing_main_hero = next(
-        (
-            card
-            for card in existing_cards
-            if normalize_story_world_card_kind(card.kind) == STORY_WORLD_CARD_KIND_MAIN_HERO
-            and _is_same_character_identity(
-                card,
-                character_id=payload.character_id,
-                normalized_name=normalized_character_name,
-            )
-        ),
-        None,
+    existing_main_hero, existing_npc = _find_story_character_identity_cards(
+        db,
+        game_id=game.id,
+        character_id=payload.character_id,
+        normalized_name=_normalize_character_identity_name(character.name),
     )
     if existing_main_hero is not None:
         raise HTTPException(
@@ -383,19 +396,6 @@ def create_story_npc_from_character(
             detail="Main hero cannot be added as NPC",
         )
 
-    existing_npc = next(
-        (
-            card
-            for card in existing_cards
-            if normalize_story_world_card_kind(card.kind) == STORY_WORLD_CARD_KIND_NPC
-            and _is_same_character_identity(
-                card,
-                character_id=payload.character_id,
-                normalized_name=normalized_character_name,
-            )
-        ),
-        None,
-    )
     if existing_npc is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -418,7 +418,6 @@ def create_story_npc_from_character(
     touch_story_game(game)
     _refresh_public_story_game_snapshots_if_needed(db, game)
     db.commit()
-    db.refresh(npc_card)
     return story_world_card_to_out(npc_card)
 
 
@@ -431,15 +430,7 @@ def update_story_world_card_avatar(
     db: Session = Depends(get_db),
 ) -> StoryWorldCardOut:
     user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
-    world_card = db.scalar(
-        select(StoryWorldCard).where(
-            StoryWorldCard.id == card_id,
-            StoryWorldCard.game_id == game.id,
-        )
-    )
-    if world_card is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="World card not found")
+    game, world_card = get_user_story_game_world_card_or_404(db, user.id, game_id, card_id)
 
     normalized_avatar = normalize_story_character_avatar_url(payload.avatar_url, db=db)
     normalized_avatar_original = normalize_story_character_avatar_original_url(payload.avatar_original_url, db=db)
@@ -458,7 +449,6 @@ def update_story_world_card_avatar(
     touch_story_game(game)
     _refresh_public_story_game_snapshots_if_needed(db, game)
     db.commit()
-    db.refresh(world_card)
     return story_world_card_to_out(world_card)
 
 
@@ -471,15 +461,7 @@ def update_story_world_card_ai_edit(
     db: Session = Depends(get_db),
 ) -> StoryWorldCardOut:
     user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
-    world_card = db.scalar(
-        select(StoryWorldCard).where(
-            StoryWorldCard.id == card_id,
-            StoryWorldCard.game_id == game.id,
-        )
-    )
-    if world_card is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="World card not found")
+    game, world_card = get_user_story_game_world_card_or_404(db, user.id, game_id, card_id)
 
     world_card.ai_edit_enabled = bool(payload.ai_edit_enabled)
     sync_story_character_state_payload_from_world_cards(
@@ -508,7 +490,6 @@ def update_story_world_card_ai_edit(
     touch_story_game(game)
     _refresh_public_story_game_snapshots_if_needed(db, game)
     db.commit()
-    db.refresh(world_card)
     return story_world_card_to_out(world_card)
 
 
@@ -519,9 +500,7 @@ def create_story_world_card(
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
 ) -> StoryWorldCardOut:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
-    existing_cards = list_story_world_cards(db, game.id)
+    user, game = get_current_user_story_game_or_404(db, authorization, game_id)
     normalized_title = normalize_story_world_card_title(payload.title)
     normalized_content = normalize_story_world_card_content(payload.content)
     normalized_triggers = normalize_story_world_card_triggers(payload.triggers, fallback_title=normalized_title)
@@ -574,19 +553,16 @@ def create_story_world_card(
         duplicate_main_hero = next(
             (
                 card
-                for card in existing_cards
-                if normalize_story_world_card_kind(card.kind) == STORY_WORLD_CARD_KIND_MAIN_HERO
-                and (
-                    (
-                        linked_character is not None
-                        and _is_same_character_identity(
-                            card,
-                            character_id=linked_character.id,
-                            normalized_name=normalized_title.casefold(),
-                        )
+                for card in _list_story_world_cards_of_kind(db, game_id=game.id, kind=STORY_WORLD_CARD_KIND_MAIN_HERO)
+                if (
+                    linked_character is not None
+                    and _is_same_character_identity(
+                        card,
+                        character_id=linked_character.id,
+                        normalized_name=normalized_title.casefold(),
                     )
-                    or _normalize_character_identity_name(card.title) == normalized_title.casefold()
                 )
+                or _normalize_character_identity_name(card.title) == normalized_title.casefold()
             ),
             None,
         )
@@ -596,15 +572,15 @@ def create_story_world_card(
                 detail="This character is already selected as main hero",
             )
     if normalized_kind == STORY_WORLD_CARD_KIND_WORLD_PROFILE:
-        existing_world_profile = next(
-            (
-                card
-                for card in existing_cards
-                if normalize_story_world_card_kind(getattr(card, "kind", None)) == STORY_WORLD_CARD_KIND_WORLD_PROFILE
-            ),
-            None,
+        existing_world_profile_id = db.scalar(
+            select(StoryWorldCard.id)
+            .where(
+                StoryWorldCard.game_id == game.id,
+                StoryWorldCard.kind == STORY_WORLD_CARD_KIND_WORLD_PROFILE,
+            )
+            .limit(1)
         )
-        if existing_world_profile is not None:
+        if existing_world_profile_id is not None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="World description card is already created",
@@ -648,7 +624,6 @@ def create_story_world_card(
     touch_story_game(game)
     _refresh_public_story_game_snapshots_if_needed(db, game)
     db.commit()
-    db.refresh(world_card)
     return story_world_card_to_out(world_card)
 
 
@@ -661,15 +636,7 @@ def update_story_world_card(
     db: Session = Depends(get_db),
 ) -> StoryWorldCardOut:
     user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
-    world_card = db.scalar(
-        select(StoryWorldCard).where(
-            StoryWorldCard.id == card_id,
-            StoryWorldCard.game_id == game.id,
-        )
-    )
-    if world_card is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="World card not found")
+    game, world_card = get_user_story_game_world_card_or_404(db, user.id, game_id, card_id)
     if bool(world_card.is_locked):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -743,7 +710,6 @@ def update_story_world_card(
     touch_story_game(game)
     _refresh_public_story_game_snapshots_if_needed(db, game)
     db.commit()
-    db.refresh(world_card)
     return story_world_card_to_out(world_card)
 
 
@@ -755,43 +721,44 @@ def delete_story_world_card(
     authorization: str | None = Header(default=None),
     db: Session = Depends(get_db),
 ) -> MessageResponse:
-    user = get_current_user(db, authorization)
-    game = get_user_story_game_or_404(db, user.id, game_id)
-    world_card = db.scalar(
-        select(StoryWorldCard).where(
+    _, game = get_current_user_story_game_or_404(db, authorization, game_id)
+    db.execute(
+        sa_update(StoryWorldCardChangeEvent)
+        .where(
+            StoryWorldCardChangeEvent.game_id == game.id,
+            StoryWorldCardChangeEvent.world_card_id == card_id,
+        )
+        .values(world_card_id=None)
+    )
+    deleted_kind = db.scalar(
+        sa_delete(StoryWorldCard)
+        .where(
             StoryWorldCard.id == card_id,
             StoryWorldCard.game_id == game.id,
         )
+        .returning(StoryWorldCard.kind)
+        .execution_options(synchronize_session=False)
     )
-    if world_card is None:
+    if deleted_kind is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="World card not found")
     remaining_main_hero_id = None
-    if normalize_story_world_card_kind(world_card.kind) == STORY_WORLD_CARD_KIND_MAIN_HERO:
+    if normalize_story_world_card_kind(deleted_kind) == STORY_WORLD_CARD_KIND_MAIN_HERO:
         remaining_main_hero_id = db.scalar(
             select(StoryWorldCard.id)
             .where(
                 StoryWorldCard.game_id == game.id,
                 StoryWorldCard.kind == STORY_WORLD_CARD_KIND_MAIN_HERO,
-                StoryWorldCard.id != world_card.id,
             )
             .order_by(StoryWorldCard.id.desc())
             .limit(1)
         )
 
-    db.execute(
-        sa_update(StoryWorldCardChangeEvent)
-        .where(
-            StoryWorldCardChangeEvent.world_card_id == world_card.id,
-        )
-        .values(world_card_id=None)
-    )
     delete_story_graph_card_references(
         db,
         game_id=int(game.id),
         card_type="world_card",
-        card_id=int(world_card.id),
+        card_id=int(card_id),
     )
-    db.delete(world_card)
     if int(getattr(game, "active_main_hero_card_id", 0) or 0) == int(card_id):
         game.active_main_hero_card_id = int(remaining_main_hero_id or 0) or None
     sync_story_character_state_payload_from_world_cards(
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
 
 from app.services.media import build_media_display_url, normalize_media_scale, resolve_media_display_url
 
+MediaUrlUpdate = Annotated[str | None, Field(max_length=3_000_000)]
+MediaScaleUpdate = Annotated[float | None, Field(ge=1.0, le=3.0)]
+MediaPositionUpdate = Annotated[float | None, Field(ge=0.0, le=100.0)]
+
 
 class UserSubscriptionOut(BaseModel):
     plan_id: str
@@ -355,8 +359,8 @@ class PasswordResetVerifyRequest(BaseModel):
 
 
 class AvatarUpdateRequest(BaseModel):
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_scale: float | None = Field(default=None, ge=1.0, le=3.0)
+    avatar_url: MediaUrlUpdate = None
+    avatar_scale: MediaScaleUpdate = None
 
 
 class ProfileUpdateRequest(BaseModel):
@@ -885,10 +889,10 @@ class StoryGameCreateRequest(BaseModel):
     visibility: str | None = Field(default=None, max_length=16)
     age_rating: str | None = Field(default=None, max_length=8)
     genres: list[str] | None = Field(default=None, max_length=3)
-    cover_image_url: str | None = Field(default=None, max_length=3_000_000)
-    cover_scale: float | None = Field(default=None, ge=1.0, le=3.0)
-    cover_position_x: float | None = Field(default=None, ge=0.0, le=100.0)
-    cover_position_y: float | None = Field(default=None, ge=0.0, le=100.0)
+    cover_image_url: MediaUrlUpdate = None
+    cover_scale: MediaScaleUpdate = None
+    cover_position_x: MediaPositionUpdate = None
+    cover_position_y: MediaPositionUpdate = None
     context_limit_chars: int | None = Field(default=None, ge=6_000, le=128_000)
     response_max_tokens: int | None = Field(default=None, ge=200, le=3_000)
     response_max_tokens_enabled: bool | None = None
@@ -984,10 +988,10 @@ class StoryGameMetaUpdateRequest(BaseModel):
     visibility: str | None = Field(default=None, max_length=16)
     age_rating: str | None = Field(default=None, max_length=8)
     genres: list[str] | None = Field(default=None, max_length=3)
-    cover_image_url: str | None = Field(default=None, max_length=3_000_000)
-    cover_scale: float | None = Field(default=None, ge=1.0, le=3.0)
-    cover_position_x: float | None = Field(default=None, ge=0.0, le=100.0)
-    cover_position_y: float | None = Field(default=None, ge=0.0, le=100.0)
+    cover_image_url: MediaUrlUpdate = None
+    cover_scale: MediaScaleUpdate = None
+    cover_position_x: MediaPositionUpdate = None
+    cover_position_y: MediaPositionUpdate = None
 
 
 class StoryInstructionCardInput(BaseModel):
@@ -1335,9 +1339,9 @@ class StoryWorldCardCreateRequest(BaseModel):
     thought_bubble_color: str | None = Field(default=None, max_length=16)
     kind: str | None = Field(default=None, max_length=16)
     detail_type: str = Field(default="", max_length=120)
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_original_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_scale: float | None = Field(default=None, ge=1.0, le=3.0)
+    avatar_url: MediaUrlUpdate = None
+    avatar_original_url: MediaUrlUpdate = None
+    avatar_scale: MediaScaleUpdate = None
     character_id: int | None = Field(default=None, ge=1)
     memory_turns: int | None = Field(default=None)
 
@@ -1360,9 +1364,9 @@ class StoryWorldCardUpdateRequest(BaseModel):
 
 
 class StoryWorldCardAvatarUpdateRequest(BaseModel):
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_original_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_scale: float | None = Field(default=None, ge=1.0, le=3.0)
+    avatar_url: MediaUrlUpdate = None
+    avatar_original_url: MediaUrlUpdate = None
+    avatar_scale: MediaScaleUpdate = None
 
 
 class StoryWorldCardAiEditUpdateRequest(BaseModel):
@@ -1390,9 +1394,9 @@ class StoryCharacterCreateRequest(BaseModel):
     speech_color: str | None = Field(default=None, max_length=16)
     bubble_color: str | None = Field(default=None, max_length=16)
     thought_bubble_color: str | None = Field(default=None, max_length=16)
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_original_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_scale: float | None = Field(default=None, ge=1.0, le=3.0)
+    avatar_url: MediaUrlUpdate = None
+    avatar_original_url: MediaUrlUpdate = None
+    avatar_scale: MediaScaleUpdate = None
     emotion_assets: dict[str, str] = Field(default_factory=dict)
     novel_sprite_gender: str | None = Field(default=None, max_length=8)
     visibility: str | None = Field(default=None, max_length=16)
@@ -1411,9 +1415,9 @@ class StoryCharacterUpdateRequest(BaseModel):
     speech_color: str | None = Field(default=None, max_length=16)
     bubble_color: str | None = Field(default=None, max_length=16)
     thought_bubble_color: str | None = Field(default=None, max_length=16)
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_original_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_scale: float | None = Field(default=None, ge=1.0, le=3.0)
+    avatar_url: MediaUrlUpdate = None
+    avatar_original_url: MediaUrlUpdate = None
+    avatar_scale: MediaScaleUpdate = None
     emotion_assets: dict[str, str] = Field(default_factory=dict)
     novel_sprite_gender: str | None = Field(default=None, max_length=8)
     visibility: str | None = Field(default=None, max_length=16)
@@ -2329,9 +2333,9 @@ class StoryWorldCardTemplateCreateRequest(BaseModel):
     triggers: list[str] = Field(default_factory=list, max_length=40)
     kind: str | None = Field(default=None, max_length=16)
     detail_type: str = Field(default="", max_length=120)
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_original_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_scale: float | None = Field(default=None, ge=1.0, le=3.0)
+    avatar_url: MediaUrlUpdate = None
+    avatar_original_url: MediaUrlUpdate = None
+    avatar_scale: MediaScaleUpdate = None
     memory_turns: int | None = Field(default=None)
 
 
@@ -2340,9 +2344,9 @@ class StoryWorldCardTemplateUpdateRequest(BaseModel):
     content: str = Field(min_length=1, max_length=8_000)
     triggers: list[str] = Field(default_factory=list, max_length=40)
     detail_type: str = Field(default="", max_length=120)
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_original_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_scale: float | None = Field(default=None, ge=1.0, le=3.0)
+    avatar_url: MediaUrlUpdate = None
+    avatar_original_url: MediaUrlUpdate = None
+    avatar_scale: MediaScaleUpdate = None
     memory_turns: int | None = Field(default=None)
 
 
@@ -2387,8 +2391,8 @@ class AdminModerationWorldCardUpdateRequest(BaseModel):
     title: str = Field(min_length=1, max_length=120)
     content: str = Field(min_length=1, max_length=8_000)
     triggers: list[str] = Field(default_factory=list, max_length=80)
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_original_url: str | None = Field(default=None, max_length=3_000_000)
+    avatar_url: MediaUrlUpdate = None
+    avatar_original_url: MediaUrlUpdate = None
     avatar_scale: float = Field(default=1.0, ge=1.0, le=3.0)
     memory_turns: int | None = None
 
@@ -2399,7 +2403,7 @@ class AdminModerationWorldUpdateRequest(BaseModel):
     opening_scene: str = Field(default="", max_length=12_000)
     age_rating: str = Field(default="16+", max_length=8)
     genres: list[str] = Field(default_factory=list, max_length=3)
-    cover_image_url: str | None = Field(default=None, max_length=3_000_000)
+    cover_image_url: MediaUrlUpdate = None
     cover_scale: float = Field(default=1.0, ge=1.0, le=3.0)
     cover_position_x: float = Field(default=50.0, ge=0.0, le=100.0)
     cover_position_y: float = Field(default=50.0, ge=0.0, le=100.0)
@@ -2413,8 +2417,8 @@ class AdminModerationCharacterUpdateRequest(BaseModel):
     description: str = Field(default="", max_length=6_000)
     note: str = Field(default="", max_length=20)
     triggers: list[str] = Field(default_factory=list, max_length=80)
-    avatar_url: str | None = Field(default=None, max_length=3_000_000)
-    avatar_original_url: str | None = Field(default=None, max_length=3_000_000)
+    avatar_url: MediaUrlUpdate = None
+    avatar_original_url: MediaUrlUpdate = None
     avatar_scale: float = Field(default=1.0, ge=1.0, le=3.0)
 
 
@@ -2443,3 +2447,6 @@ class AdminModerationCharacterDetailOut(BaseModel):
 class AdminModerationInstructionTemplateDetailOut(BaseModel):
     author: AdminModerationAuthorOut
     template: StoryInstructionTemplateOut
+
+
+ProfileViewOut.model_rebuild()
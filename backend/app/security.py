@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
+import time
 from typing import Any
 
 import bcrypt
@@ -43,8 +44,9 @@ def create_access_token(
     claims: dict[str, Any] | None = None,
     expires_delta: timedelta | None = None,
 ) -> str:
-    issued_at = datetime.now(timezone.utc)
-    expire_at = issued_at + (expires_delta or timedelta(minutes=settings.access_token_ttl_minutes))
+    # NumericDate claims are whole seconds; building them directly skips jose's datetime conversion.
+    issued_at = int(time.time())
+    expire_at = issued_at + int((expires_delta or timedelta(minutes=settings.access_token_ttl_minutes)).total_seconds())
     payload: dict[str, Any] = {"sub": subject, "iat": issued_at, "exp": expire_at}
     if claims:
         payload.update(claims)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache
+import hashlib
+from threading import Lock
+import time
+from typing import AbstractSet, Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models import User
@@ -29,6 +33,13 @@ PRIVILEGED_ROLE_BY_EMAIL = {
     "borisow.n2011@gmail.com": ROLE_MODERATOR,
     "iltteam@yandex.ru": ROLE_ADMINISTRATOR,
 }
+ACCESS_TOKEN_CLAIMS_CACHE_TTL_SECONDS = 60
+ACCESS_TOKEN_CLAIMS_CACHE_MAX_SIZE = 10_000
+ACCESS_TOKEN_ISSUED_AT_GRACE = timedelta(minutes=2)
+# sha256(token) -> (cache expiry as time.monotonic(), user_id, normalized email, issued_at)
+_ACCESS_TOKEN_CLAIMS_CACHE: OrderedDict[bytes, tuple[float, int, str, datetime]] = OrderedDict()
+_ACCESS_TOKEN_CLAIMS_CACHE_LOCK = Lock()
+_validate_user_out = UserOut.__pydantic_validator__.validate_python
 
 
 def normalize_email(email: str) -> str:
@@ -64,7 +75,7 @@ def sync_user_role_with_email(user: User) -> bool:
 
 
 def _compact_display_name(value: str | None) -> str:
-    return " ".join(str(value or "").replace("\r", " ").replace("\n", " ").split())
+    return " ".join(str(value or "").split())
 
 
 def _truncate_display_name(value: str) -> str:
@@ -72,9 +83,15 @@ def _truncate_display_name(value: str) -> str:
 
 
 def provider_union(current_provider: str, next_provider: str) -> str:
-    providers = {value.strip() for value in current_provider.split("+") if value.strip()}
-    providers.add(next_provider)
-    return "+".join(sorted(providers))
+    providers: list[str] = []
+    for value in current_provider.split("+"):
+        value = value.strip()
+        if value and value not in providers:
+            providers.append(value)
+    if next_provider not in providers:
+        providers.append(next_provider)
+    providers.sort()
+    return "+".join(providers)
 
 
 def sync_auth_provider(user: User) -> bool:
@@ -139,26 +156,20 @@ def normalize_avatar_frame_id(value: str | None) -> str:
     return normalized if normalized in AVATAR_FRAME_IDS else AVATAR_FRAME_DEFAULT_ID
 
 
-def parse_google_client_ids(raw_value: str) -> set[str]:
-    return {item.strip() for item in raw_value.split(",") if item.strip()}
+@lru_cache(maxsize=8)
+def parse_google_client_ids(raw_value: str) -> frozenset[str]:
+    return frozenset(item.strip() for item in raw_value.split(",") if item.strip())
 
 
-def is_allowed_google_audience(claim_aud: Any, claim_azp: Any, allowed_client_ids: set[str]) -> bool:
-    if isinstance(claim_aud, str) and claim_aud in allowed_client_ids:
+def is_allowed_google_audience(claim_aud: Any, claim_azp: Any, allowed_client_ids: AbstractSet[str]) -> bool:
+    audiences = claim_aud if isinstance(claim_aud, list) else (claim_aud,)
+    if any(isinstance(value, str) and value in allowed_client_ids for value in audiences):
         return True
-
-    if isinstance(claim_aud, list):
-        if any(isinstance(value, str) and value in allowed_client_ids for value in claim_aud):
-            return True
-
-    if isinstance(claim_azp, str) and claim_azp in allowed_client_ids:
-        return True
-
-    return False
+    return isinstance(claim_azp, str) and claim_azp in allowed_client_ids
 
 
 def serialize_user_out(user: User, *, db: Session | None = None) -> UserOut:
-    payload = UserOut.model_validate(user)
+    payload = _validate_user_out(user, from_attributes=True)
     if db is None:
         return payload
     try:
@@ -217,14 +228,19 @@ def serialize_user_out(user: User, *, db: Session | None = None) -> UserOut:
 
 def issue_auth_response(user: User, *, is_new_user: bool = False, db: Session | None = None) -> AuthResponse:
     token = create_access_token(subject=str(user.id), claims={"email": user.email})
-    return AuthResponse(access_token=token, user=serialize_user_out(user, db=db), is_new_user=is_new_user)
+    return AuthResponse.model_construct(
+        access_token=token,
+        token_type="bearer",
+        user=serialize_user_out(user, db=db),
+        is_new_user=bool(is_new_user),
+    )
 
 
 def _extract_bearer_token(authorization: str | None) -> str | None:
     if not authorization:
         return None
     token_prefix = "bearer "
-    if not authorization.lower().startswith(token_prefix):
+    if authorization[: len(token_prefix)].lower() != token_prefix:
         return None
     return authorization[len(token_prefix) :].strip()
 
@@ -279,12 +295,12 @@ def user_has_admin_panel_access(user: User) -> bool:
 
 
 def _parse_token_issued_at(raw_value: Any) -> datetime:
-    if isinstance(raw_value, datetime):
-        return _to_utc(raw_value)
-
     if isinstance(raw_value, (int, float)):
         return datetime.fromtimestamp(float(raw_value), tz=timezone.utc)
 
+    if isinstance(raw_value, datetime):
+        return _to_utc(raw_value)
+
     if isinstance(raw_value, str):
         cleaned = raw_value.strip()
         if not cleaned:
@@ -297,13 +313,50 @@ def _parse_token_issued_at(raw_value: Any) -> datetime:
     raise ValueError("Token iat claim is missing")
 
 
-def get_current_user(
-    db: Session,
-    authorization: str | None,
-) -> User:
-    token = _extract_bearer_token(authorization)
-    if not token:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing authorization token")
+def _access_token_cache_key(token: str) -> bytes:
+    # Keep only a fixed-size digest in memory instead of the bearer token itself.
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _get_cached_access_token_claims(token: str) -> tuple[int, str, datetime] | None:
+    cache_key = _access_token_cache_key(token)
+    with _ACCESS_TOKEN_CLAIMS_CACHE_LOCK:
+        cached = _ACCESS_TOKEN_CLAIMS_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            _ACCESS_TOKEN_CLAIMS_CACHE.pop(cache_key, None)
+            return None
+        _ACCESS_TOKEN_CLAIMS_CACHE.move_to_end(cache_key)
+        return cached[1], cached[2], cached[3]
+
+
+def _store_cached_access_token_claims(
+    token: str,
+    *,
+    expires_at: Any,
+    user_id: int,
+    token_email: str,
+    token_issued_at: datetime,
+) -> None:
+    ttl_seconds = float(ACCESS_TOKEN_CLAIMS_CACHE_TTL_SECONDS)
+    if isinstance(expires_at, (int, float)):
+        # Never serve a token from the cache after its own exp claim.
+        ttl_seconds = min(ttl_seconds, float(expires_at) - time.time())
+    if ttl_seconds <= 0:
+        return
+    cache_key = _access_token_cache_key(token)
+    with _ACCESS_TOKEN_CLAIMS_CACHE_LOCK:
+        _ACCESS_TOKEN_CLAIMS_CACHE[cache_key] = (time.monotonic() + ttl_seconds, user_id, token_email, token_issued_at)
+        _ACCESS_TOKEN_CLAIMS_CACHE.move_to_end(cache_key)
+        while len(_ACCESS_TOKEN_CLAIMS_CACHE) > ACCESS_TOKEN_CLAIMS_CACHE_MAX_SIZE:
+            _ACCESS_TOKEN_CLAIMS_CACHE.popitem(last=False)
+
+
+def _resolve_access_token_claims(token: str) -> tuple[int, str, datetime]:
+    cached_claims = _get_cached_access_token_claims(token)
+    if cached_claims is not None:
+        return cached_claims
 
     payload = safe_decode_access_token(token)
     if not payload:
@@ -325,19 +378,57 @@ def get_current_user(
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload") from exc
 
-    user = db.scalar(select(User).where(User.id == user_id))
+    _store_cached_access_token_claims(
+        token,
+        expires_at=payload.get("exp"),
+        user_id=user_id,
+        token_email=token_email,
+        token_issued_at=token_issued_at,
+    )
+    return user_id, token_email, token_issued_at
+
+
+def resolve_authorization_claims(authorization: str | None) -> tuple[int, str, datetime]:
+    token = _extract_bearer_token(authorization)
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing authorization token")
+    return _resolve_access_token_claims(token)
+
+
+def ensure_authorized_user(
+    db: Session,
+    user: User | None,
+    *,
+    token_email: str,
+    token_issued_at: datetime,
+) -> User:
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-    if normalize_email(user.email) != token_email:
+    # New accounts store normalized emails, so the raw comparison settles most requests.
+    if user.email != token_email and normalize_email(user.email) != token_email:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token does not match user identity")
 
-    user_created_at = _to_utc(user.created_at)
-    if token_issued_at < user_created_at - timedelta(minutes=2):
+    if token_issued_at < _to_utc(user.created_at) - ACCESS_TOKEN_ISSUED_AT_GRACE:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token is no longer valid")
 
     if sync_user_access_state(user):
+        # The flush writes only the changed role/ban columns; their new values are already on the instance.
         db.commit()
-        db.refresh(user)
     ensure_user_not_banned(user)
 
     return user
+
+
+def get_current_user(
+    db: Session,
+    authorization: str | None,
+) -> User:
+    # Only the verified token claims are cached; the user row is always re-read so bans,
+    # role changes and balances apply immediately.
+    user_id, token_email, token_issued_at = resolve_authorization_claims(authorization)
+    return ensure_authorized_user(
+        db,
+        db.get(User, user_id),
+        token_email=token_email,
+        token_issued_at=token_issued_at,
+    )
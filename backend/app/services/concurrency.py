@@ -1,11 +1,28 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import update as sa_update
+from fastapi import HTTPException, status
+from sqlalchemy import exists, func, select, update as sa_update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from app.models import CoinPurchase, StoryCharacter, StoryGame, StoryInstructionTemplate, User
+from app.models import (
+    CoinPurchase,
+    StoryCharacter,
+    StoryCommunityInstructionTemplateAddition,
+    StoryCommunityInstructionTemplateRating,
+    StoryCommunityWorldLaunch,
+    StoryCommunityWorldRating,
+    StoryCommunityWorldView,
+    StoryGame,
+    StoryInstructionTemplate,
+    User,
+)
+
+USER_RATING_UPSERT_MAX_ATTEMPTS = 3
 
 
 def increment_story_world_views(db: Session, world_id: int) -> None:
@@ -24,6 +41,125 @@ def increment_story_world_launches(db: Session, world_id: int) -> None:
     )
 
 
+def record_story_world_view(db: Session, *, world_id: int, user_id: int) -> bool:
+    """Store the user's first view of a world and bump its counter; returns False for repeat views."""
+    is_postgresql = db.get_bind().dialect.name == "postgresql"
+    insert_statement = (
+        (postgresql_insert if is_postgresql else sqlite_insert)(StoryCommunityWorldView)
+        .values(world_id=world_id, user_id=user_id)
+        .on_conflict_do_nothing(
+            index_elements=[StoryCommunityWorldView.world_id, StoryCommunityWorldView.user_id],
+        )
+        .returning(StoryCommunityWorldView.id)
+    )
+    if is_postgresql:
+        inserted_view = insert_statement.cte("inserted_view")
+        updated_world_id = db.scalar(
+            sa_update(StoryGame)
+            .where(
+                StoryGame.id == world_id,
+                exists(select(inserted_view.c.id)),
+            )
+            .values(community_views=StoryGame.community_views + 1)
+            .returning(StoryGame.id)
+        )
+        return updated_world_id is not None
+
+    if db.scalar(insert_statement) is None:
+        return False
+    increment_story_world_views(db, world_id)
+    return True
+
+
+def record_story_world_launch(db: Session, *, world_id: int, user_id: int) -> bool:
+    """Store the user's first launch of a world and bump its counter; returns False for repeat launches."""
+    is_postgresql = db.get_bind().dialect.name == "postgresql"
+    insert_statement = (
+        (postgresql_insert if is_postgresql else sqlite_insert)(StoryCommunityWorldLaunch)
+        .values(world_id=world_id, user_id=user_id)
+        .on_conflict_do_nothing(
+            index_elements=[StoryCommunityWorldLaunch.world_id, StoryCommunityWorldLaunch.user_id],
+        )
+        .returning(StoryCommunityWorldLaunch.id)
+    )
+    if is_postgresql:
+        inserted_launch = insert_statement.cte("inserted_launch")
+        updated_world_id = db.scalar(
+            sa_update(StoryGame)
+            .where(
+                StoryGame.id == world_id,
+                exists(select(inserted_launch.c.id)),
+            )
+            .values(community_launches=StoryGame.community_launches + 1)
+            .returning(StoryGame.id)
+        )
+        return updated_world_id is not None
+
+    # SQLite has no data-modifying CTEs, so the counter is bumped in a second statement.
+    if db.scalar(insert_statement) is None:
+        return False
+    increment_story_world_launches(db, world_id)
+    return True
+
+
+def _upsert_user_rating(db: Session, model: Any, *, key: dict[str, int], rating_value: int) -> int | None:
+    """Insert or overwrite one user's rating row and return the previous value read under a row lock."""
+    key_filter = [getattr(model, column_name) == value for column_name, value in key.items()]
+    previous_rating_statement = select(model.rating).where(*key_filter).with_for_update()
+    is_postgresql = db.get_bind().dialect.name == "postgresql"
+    for _ in range(USER_RATING_UPSERT_MAX_ATTEMPTS):
+        previous_rating = db.scalar(previous_rating_statement)
+        if previous_rating is None:
+            inserted_id = db.scalar(
+                (postgresql_insert if is_postgresql else sqlite_insert)(model)
+                .values(**key, rating=rating_value)
+                .on_conflict_do_nothing(index_elements=[getattr(model, column_name) for column_name in key])
+                .returning(model.id)
+            )
+            if inserted_id is not None:
+                return None
+            # A concurrent insert won the conflict; its row is committed now, so lock and read it.
+            continue
+        if int(previous_rating) == rating_value:
+            return int(previous_rating)
+        updated_id = db.scalar(
+            sa_update(model)
+            .where(*key_filter)
+            .values(rating=rating_value, updated_at=func.now())
+            .returning(model.id)
+        )
+        if updated_id is not None:
+            return int(previous_rating)
+    # Under REPEATABLE READ or SERIALIZABLE a row committed after the snapshot stays invisible to the
+    # locking read while still blocking the insert, so retrying within this transaction cannot succeed.
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="The rating was changed concurrently, please retry",
+    )
+
+
+def upsert_story_world_rating(db: Session, *, world_id: int, user_id: int, rating_value: int) -> int | None:
+    """Insert or overwrite the user's rating and return the previous value (None when inserted)."""
+    return _upsert_user_rating(
+        db,
+        StoryCommunityWorldRating,
+        key={"world_id": world_id, "user_id": user_id},
+        rating_value=rating_value,
+    )
+
+
+def apply_story_world_rating_upsert(
+    db: Session,
+    world_id: int,
+    rating_value: int,
+    previous_rating: int | None,
+) -> None:
+    if previous_rating is None:
+        apply_story_world_rating_insert(db, world_id, rating_value)
+        return
+    apply_story_world_rating_update(db, world_id, rating_value - int(previous_rating))
+
+
 def apply_story_world_rating_insert(db: Session, world_id: int, rating_value: int) -> None:
     db.execute(
         sa_update(StoryGame)
@@ -88,6 +224,34 @@ def increment_story_character_additions(db: Session, character_id: int) -> None:
     )
 
 
+def upsert_story_instruction_template_rating(
+    db: Session,
+    *,
+    template_id: int,
+    user_id: int,
+    rating_value: int,
+) -> int | None:
+    """Insert or overwrite the user's template rating and return the previous value (None when inserted)."""
+    return _upsert_user_rating(
+        db,
+        StoryCommunityInstructionTemplateRating,
+        key={"template_id": template_id, "user_id": user_id},
+        rating_value=rating_value,
+    )
+
+
+def apply_story_instruction_template_rating_upsert(
+    db: Session,
+    template_id: int,
+    rating_value: int,
+    previous_rating: int | None,
+) -> None:
+    if previous_rating is None:
+        apply_story_instruction_template_rating_insert(db, template_id, rating_value)
+        return
+    apply_story_instruction_template_rating_update(db, template_id, rating_value - int(previous_rating))
+
+
 def apply_story_instruction_template_rating_insert(db: Session, template_id: int, rating_value: int) -> None:
     db.execute(
         sa_update(StoryInstructionTemplate)
@@ -109,6 +273,39 @@ def apply_story_instruction_template_rating_update(db: Session, template_id: int
     )
 
 
+def record_story_instruction_template_addition(db: Session, *, template_id: int, user_id: int) -> bool:
+    """Store the user's first addition of a template and bump its counter; returns False for repeat additions."""
+    is_postgresql = db.get_bind().dialect.name == "postgresql"
+    insert_statement = (
+        (postgresql_insert if is_postgresql else sqlite_insert)(StoryCommunityInstructionTemplateAddition)
+        .values(template_id=template_id, user_id=user_id)
+        .on_conflict_do_nothing(
+            index_elements=[
+                StoryCommunityInstructionTemplateAddition.template_id,
+                StoryCommunityInstructionTemplateAddition.user_id,
+            ],
+        )
+        .returning(StoryCommunityInstructionTemplateAddition.id)
+    )
+    if is_postgresql:
+        inserted_addition = insert_statement.cte("inserted_addition")
+        updated_template_id = db.scalar(
+            sa_update(StoryInstructionTemplate)
+            .where(
+                StoryInstructionTemplate.id == template_id,
+                exists(select(inserted_addition.c.id)),
+            )
+            .values(community_additions_count=StoryInstructionTemplate.community_additions_count + 1)
+            .returning(StoryInstructionTemplate.id)
+        )
+        return updated_template_id is not None
+
+    if db.scalar(insert_statement) is None:
+        return False
+    increment_story_instruction_template_additions(db, template_id)
+    return True
+
+
 def increment_story_instruction_template_additions(db: Session, template_id: int) -> None:
     db.execute(
         sa_update(StoryInstructionTemplate)
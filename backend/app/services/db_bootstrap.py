@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import logging
 from pathlib import Path
 import re
 
-from sqlalchemy import inspect, or_, select, text
+from sqlalchemy import case, func, inspect, or_, select, text, update as sa_update
 
 from app.database import Base, SessionLocal, engine
 from app.models import (
+    STORY_INSTRUCTION_TEMPLATE_RATING_AVG_SQL,
     AppSetting,
     AiAssistantActionBatch,
     AiAssistantConversation,
@@ -63,6 +65,8 @@ from app.models import (
 )
 from app.services.media import MEDIA_URL_PREFIX, parse_media_token
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class StoryBootstrapDefaults:
@@ -1138,6 +1142,14 @@ def _ensure_story_instruction_template_community_columns_exist(private_visibilit
             f"ALTER TABLE {StoryInstructionTemplate.__tablename__} "
             "ADD COLUMN community_additions_count INTEGER NOT NULL DEFAULT 0"
         )
+    if "community_rating_avg" not in existing_columns:
+        # SQLite can only add generated columns as VIRTUAL; PostgreSQL only supports STORED.
+        generated_storage = "STORED" if engine.dialect.name == "postgresql" else "VIRTUAL"
+        alter_statements.append(
+            f"ALTER TABLE {StoryInstructionTemplate.__tablename__} "
+            "ADD COLUMN community_rating_avg FLOAT "
+            f"GENERATED ALWAYS AS ({STORY_INSTRUCTION_TEMPLATE_RATING_AVG_SQL}) {generated_storage}"
+        )
     if "publication_status" not in existing_columns:
         alter_statements.append(
             f"ALTER TABLE {StoryInstructionTemplate.__tablename__} "
@@ -1202,6 +1214,111 @@ def _ensure_community_rating_timestamp_columns_exist() -> None:
             connection.execute(text(f"UPDATE {table_name} SET updated_at = created_at WHERE updated_at IS NULL"))
 
 
+def _ensure_story_community_upsert_unique_indexes_exist() -> None:
+    """Back the community ON CONFLICT upserts with a unique index on old databases."""
+    inspector = inspect(engine)
+    # (row model, unique index, key columns, parent model, parent aggregate). Rating rows feed the parent's
+    # sum/count; the other rows each bumped a parent counter once when they were recorded.
+    upsert_models = (
+        (
+            StoryCommunityWorldRating,
+            "uq_story_community_world_ratings_world_user",
+            ("world_id", "user_id"),
+            StoryGame,
+            None,
+        ),
+        (
+            StoryCommunityWorldLaunch,
+            "uq_story_community_world_launches_world_user",
+            ("world_id", "user_id"),
+            StoryGame,
+            "community_launches",
+        ),
+        (
+            StoryCommunityWorldView,
+            "uq_story_community_world_views_world_user",
+            ("world_id", "user_id"),
+            StoryGame,
+            "community_views",
+        ),
+        (
+            StoryCommunityInstructionTemplateRating,
+            "uq_story_community_instruction_template_ratings_template_user",
+            ("template_id", "user_id"),
+            StoryInstructionTemplate,
+            None,
+        ),
+        (
+            StoryCommunityInstructionTemplateAddition,
+            "uq_story_community_instruction_template_additions_template_user",
+            ("template_id", "user_id"),
+            StoryInstructionTemplate,
+            "community_additions_count",
+        ),
+    )
+    with engine.begin() as connection:
+        for model, index_name, key_columns, parent_model, parent_counter_name in upsert_models:
+            table_name = model.__tablename__
+            if not inspector.has_table(table_name):
+                continue
+            unique_column_sets = {
+                tuple(constraint["column_names"]) for constraint in inspector.get_unique_constraints(table_name)
+            }
+            unique_column_sets.update(
+                tuple(index["column_names"]) for index in inspector.get_indexes(table_name) if index.get("unique")
+            )
+            key_columns_sql = ", ".join(key_columns)
+            if key_columns not in unique_column_sets:
+                parent_column_name = key_columns[0]
+                duplicate_filter_sql = f"id NOT IN (SELECT MAX(id) FROM {table_name} GROUP BY {key_columns_sql})"
+                removed_counts = connection.execute(
+                    text(
+                        f"SELECT {parent_column_name}, COUNT(*) FROM {table_name} "
+                        f"WHERE {duplicate_filter_sql} GROUP BY {parent_column_name}"
+                    )
+                ).all()
+                connection.execute(text(f"DELETE FROM {table_name} WHERE {duplicate_filter_sql}"))
+                for parent_id, removed_count in removed_counts:
+                    if parent_counter_name is None:
+                        surviving_ratings = (
+                            select(model.rating).where(getattr(model, parent_column_name) == parent_id).subquery()
+                        )
+                        parent_values = {
+                            "community_rating_sum": select(
+                                func.coalesce(func.sum(surviving_ratings.c.rating), 0)
+                            ).scalar_subquery(),
+                            "community_rating_count": select(func.count()).select_from(surviving_ratings).scalar_subquery(),
+                        }
+                    else:
+                        parent_counter = getattr(parent_model, parent_counter_name)
+                        parent_values = {
+                            parent_counter_name: case(
+                                (parent_counter > removed_count, parent_counter - removed_count),
+                                else_=0,
+                            )
+                        }
+                    connection.execute(sa_update(parent_model).where(parent_model.id == parent_id).values(**parent_values))
+                if removed_counts:
+                    logger.warning(
+                        "Removed %s duplicate rows from %s across %s parents before adding %s",
+                        sum(int(removed_count) for _, removed_count in removed_counts),
+                        table_name,
+                        len(removed_counts),
+                        index_name,
+                    )
+                _execute_schema_statement(
+                    connection,
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table_name} ({key_columns_sql})",
+                )
+            # The unique index serves the same lookups, so the older plain index only costs
+            # an extra btree write per row.
+            plain_index_suffix = "_".join(column.removesuffix("_id") for column in key_columns)
+            _execute_schema_statement(
+                connection,
+                f"DROP INDEX IF EXISTS ix_{table_name}_{plain_index_suffix}_id",
+            )
+
+
 def _ensure_subscription_schema() -> None:
     inspector = inspect(engine)
     table_name = Subscription.__tablename__
@@ -1492,6 +1609,47 @@ def _ensure_story_graph_undo_columns_exist() -> None:
             _execute_schema_statement(connection, statement)
 
 
+def _ensure_story_game_foreign_keys_cascade() -> None:
+    if engine.dialect.name != "postgresql":
+        return
+
+    inspector = inspect(engine)
+    alter_statements: list[str] = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        cascade_columns = {
+            constraint.column_keys[0]
+            for constraint in table.foreign_key_constraints
+            if constraint.referred_table.name == StoryGame.__tablename__
+            and str(constraint.ondelete or "").upper() == "CASCADE"
+            and len(constraint.column_keys) == 1
+        }
+        if not cascade_columns:
+            continue
+        for existing_constraint in inspector.get_foreign_keys(table.name):
+            constrained_columns = existing_constraint.get("constrained_columns") or []
+            if existing_constraint.get("referred_table") != StoryGame.__tablename__:
+                continue
+            if len(constrained_columns) != 1 or constrained_columns[0] not in cascade_columns:
+                continue
+            existing_ondelete = str((existing_constraint.get("options") or {}).get("ondelete") or "").upper()
+            constraint_name = existing_constraint.get("name")
+            if existing_ondelete == "CASCADE" or not constraint_name:
+                continue
+            alter_statements.append(f"ALTER TABLE {table.name} DROP CONSTRAINT IF EXISTS {constraint_name}")
+            alter_statements.append(
+                f"ALTER TABLE {table.name} ADD CONSTRAINT {constraint_name} "
+                f"FOREIGN KEY ({constrained_columns[0]}) REFERENCES {StoryGame.__tablename__} (id) ON DELETE CASCADE"
+            )
+
+    if not alter_statements:
+        return
+    with engine.begin() as connection:
+        for statement in alter_statements:
+            _execute_schema_statement(connection, statement)
+
+
 def _ensure_story_memory_block_schema() -> None:
     inspector = inspect(engine)
     if not inspector.has_table(StoryMemoryBlock.__tablename__):
@@ -1578,6 +1736,16 @@ def _ensure_performance_indexes_exist() -> None:
         "CREATE INDEX IF NOT EXISTS ix_story_games_visibility_rank_id "
         f"ON {StoryGame.__tablename__} "
         "(visibility, source_world_id, community_launches, community_views, community_rating_count, id)",
+        # Partial indexes in the exact order of each community catalog sort, so the first page
+        # is an ordered index walk over public worlds instead of a sort.
+        "CREATE INDEX IF NOT EXISTS ix_story_games_public_created_id "
+        f"ON {StoryGame.__tablename__} (created_at DESC, id DESC) WHERE visibility = 'public'",
+        "CREATE INDEX IF NOT EXISTS ix_story_games_public_launches_created_id "
+        f"ON {StoryGame.__tablename__} (community_launches DESC, created_at DESC, id DESC) "
+        "WHERE visibility = 'public'",
+        "CREATE INDEX IF NOT EXISTS ix_story_games_public_views_created_id "
+        f"ON {StoryGame.__tablename__} (community_views DESC, created_at DESC, id DESC) "
+        "WHERE visibility = 'public'",
         "CREATE INDEX IF NOT EXISTS ix_story_games_source_world_id_id "
         f"ON {StoryGame.__tablename__} (source_world_id, id)",
         "CREATE INDEX IF NOT EXISTS ix_story_messages_game_id_id "
@@ -1608,6 +1776,16 @@ def _ensure_performance_indexes_exist() -> None:
         f"ON {StoryInstructionTemplate.__tablename__} (visibility, source_template_id, id)",
         "CREATE INDEX IF NOT EXISTS ix_story_instruction_templates_source_template_id_id "
         f"ON {StoryInstructionTemplate.__tablename__} (source_template_id, id)",
+        # Same idea for the community instruction template sorts.
+        "CREATE INDEX IF NOT EXISTS ix_story_instruction_templates_public_created_id "
+        f"ON {StoryInstructionTemplate.__tablename__} (created_at DESC, id DESC) WHERE visibility = 'public'",
+        "CREATE INDEX IF NOT EXISTS ix_story_instruction_templates_public_rating_created_id "
+        f"ON {StoryInstructionTemplate.__tablename__} "
+        "(community_rating_avg DESC, community_rating_count DESC, created_at DESC, id DESC) "
+        "WHERE visibility = 'public'",
+        "CREATE INDEX IF NOT EXISTS ix_story_instruction_templates_public_additions_created_id "
+        f"ON {StoryInstructionTemplate.__tablename__} (community_additions_count DESC, created_at DESC, id DESC) "
+        "WHERE visibility = 'public'",
         "CREATE INDEX IF NOT EXISTS ix_story_plot_cards_game_id_id "
         f"ON {StoryPlotCard.__tablename__} (game_id, id)",
         "CREATE INDEX IF NOT EXISTS ix_story_plot_cards_game_enabled_id "
@@ -1674,12 +1852,6 @@ def _ensure_performance_indexes_exist() -> None:
         f"ON {StoryPlotCardChangeEvent.__tablename__} (game_id, id)",
         "CREATE INDEX IF NOT EXISTS ix_story_plot_events_game_undone_id "
         f"ON {StoryPlotCardChangeEvent.__tablename__} (game_id, undone_at, id)",
-        "CREATE INDEX IF NOT EXISTS ix_story_community_world_ratings_world_user_id "
-        f"ON {StoryCommunityWorldRating.__tablename__} (world_id, user_id)",
-        "CREATE INDEX IF NOT EXISTS ix_story_community_world_views_world_user_id "
-        f"ON {StoryCommunityWorldView.__tablename__} (world_id, user_id)",
-        "CREATE INDEX IF NOT EXISTS ix_story_community_world_launches_world_user_id "
-        f"ON {StoryCommunityWorldLaunch.__tablename__} (world_id, user_id)",
         "CREATE INDEX IF NOT EXISTS ix_story_community_world_favorites_world_user_id "
         f"ON {StoryCommunityWorldFavorite.__tablename__} (world_id, user_id)",
         "CREATE INDEX IF NOT EXISTS ix_story_community_world_favorites_user_world_id "
@@ -1706,10 +1878,6 @@ def _ensure_performance_indexes_exist() -> None:
         f"ON {StoryCommunityCharacterReport.__tablename__} (reporter_user_id, character_id)",
         "CREATE INDEX IF NOT EXISTS ix_story_community_character_reports_status_created_id "
         f"ON {StoryCommunityCharacterReport.__tablename__} (status, created_at, id)",
-        "CREATE INDEX IF NOT EXISTS ix_story_community_instruction_template_ratings_template_user_id "
-        f"ON {StoryCommunityInstructionTemplateRating.__tablename__} (template_id, user_id)",
-        "CREATE INDEX IF NOT EXISTS ix_story_community_instruction_template_additions_template_user_id "
-        f"ON {StoryCommunityInstructionTemplateAddition.__tablename__} (template_id, user_id)",
         "CREATE INDEX IF NOT EXISTS ix_story_community_instruction_template_additions_user_template_id "
         f"ON {StoryCommunityInstructionTemplateAddition.__tablename__} (user_id, template_id)",
         "CREATE INDEX IF NOT EXISTS ix_story_community_instruction_template_reports_template_status_id "
@@ -1987,6 +2155,7 @@ def bootstrap_database(*, database_url: str, defaults: StoryBootstrapDefaults) -
     _ensure_story_character_races_schema()
     _ensure_story_instruction_template_community_columns_exist(defaults.private_visibility)
     _ensure_community_rating_timestamp_columns_exist()
+    _ensure_story_community_upsert_unique_indexes_exist()
     _ensure_story_turn_image_history_schema()
     _ensure_story_visual_novel_legacy_tables_dropped()
     _ensure_story_novel_beat_scene_cast_schema()
@@ -1998,6 +2167,7 @@ def bootstrap_database(*, database_url: str, defaults: StoryBootstrapDefaults) -
     _ensure_story_soft_undo_columns_exist()
     _ensure_story_graph_undo_columns_exist()
     _ensure_story_memory_block_schema()
+    _ensure_story_game_foreign_keys_cascade()
     _repair_legacy_story_avatar_media_tokens()
     _repair_story_response_token_limits()
     _ensure_performance_indexes_exist()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_model_list_response(
+    adapter: TypeAdapter[Any],
+    items: list[BaseModel],
+    *,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    # The items are already built, so the array is serialized in one Rust call; the ready Response also
+    # skips FastAPI's response_model re-validation and jsonable_encoder pass.
+    return Response(
+        content=adapter.dump_json(items),
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+def json_model_response(
+    item: BaseModel,
+    *,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    # Returning a ready Response skips FastAPI's response_model re-validation and jsonable_encoder pass.
+    return Response(
+        content=item.model_dump_json(),
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    # Encodes with pydantic-core's Rust serializer instead of the stdlib json module.
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
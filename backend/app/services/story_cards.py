@@ -77,6 +77,9 @@ def normalize_story_instruction_template_visibility(value: str | None) -> str:
 
 
 def story_instruction_template_rating_average(template: StoryInstructionTemplate) -> float:
+    stored_average = getattr(template, "community_rating_avg", None)
+    if stored_average is not None:
+        return round(float(stored_average), 2)
     rating_count = max(int(getattr(template, "community_rating_count", 0) or 0), 0)
     if rating_count <= 0:
         return 0.0
@@ -291,7 +294,7 @@ def story_plot_card_to_out(card: StoryPlotCard) -> StoryPlotCardOut:
         deserialize_story_plot_card_triggers(getattr(card, "triggers", "")),
         fallback_title=card.title,
     )
-    return StoryPlotCardOut(
+    return StoryPlotCardOut.model_construct(
         id=card.id,
         game_id=card.game_id,
         title=normalize_story_plot_card_title(card.title),
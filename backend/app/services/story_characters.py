@@ -301,7 +301,7 @@ def story_character_to_out(character: StoryCharacter, *, include_emotion_assets:
                 )
             )
         }
-    return StoryCharacterOut(
+    return StoryCharacterOut.model_construct(
         id=character.id,
         user_id=character.user_id,
         name=normalize_story_character_name(character.name),
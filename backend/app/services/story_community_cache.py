@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+import time
+from typing import Any, Hashable
+
+STORY_COMMUNITY_LIST_CACHE_TTL_SECONDS = 30
+STORY_COMMUNITY_LIST_CACHE_MAX_SIZE = 512
+STORY_COMMUNITY_INSTRUCTION_TEMPLATES_CACHE_NAMESPACE = "instruction_templates"
+
+# (namespace, key) -> (cache expiry as time.monotonic(), value)
+_STORY_COMMUNITY_LIST_CACHE: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = OrderedDict()
+_STORY_COMMUNITY_LIST_CACHE_LOCK = Lock()
+
+
+def get_cached_story_community_list(namespace: str, key: Hashable) -> Any | None:
+    cache_key = (namespace, key)
+    with _STORY_COMMUNITY_LIST_CACHE_LOCK:
+        cached = _STORY_COMMUNITY_LIST_CACHE.get(cache_key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            _STORY_COMMUNITY_LIST_CACHE.pop(cache_key, None)
+            return None
+        _STORY_COMMUNITY_LIST_CACHE.move_to_end(cache_key)
+        return cached[1]
+
+
+def store_cached_story_community_list(
+    namespace: str,
+    key: Hashable,
+    value: Any,
+    *,
+    ttl_seconds: float = STORY_COMMUNITY_LIST_CACHE_TTL_SECONDS,
+) -> None:
+    cache_key = (namespace, key)
+    with _STORY_COMMUNITY_LIST_CACHE_LOCK:
+        _STORY_COMMUNITY_LIST_CACHE[cache_key] = (time.monotonic() + float(ttl_seconds), value)
+        _STORY_COMMUNITY_LIST_CACHE.move_to_end(cache_key)
+        while len(_STORY_COMMUNITY_LIST_CACHE) > STORY_COMMUNITY_LIST_CACHE_MAX_SIZE:
+            _STORY_COMMUNITY_LIST_CACHE.popitem(last=False)
+
+
+def invalidate_story_community_list_cache(namespace: str) -> None:
+    with _STORY_COMMUNITY_LIST_CACHE_LOCK:
+        for cache_key in [cache_key for cache_key in _STORY_COMMUNITY_LIST_CACHE if cache_key[0] == namespace]:
+            _STORY_COMMUNITY_LIST_CACHE.pop(cache_key, None)
@@ -1,11 +1,14 @@
 from __future__ import annotations
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 import json
 import math
+from threading import Lock
 from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete as sa_delete, select
+from sqlalchemy import and_, delete as sa_delete, func, insert as sa_insert, literal, or_, select, text
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -387,6 +390,77 @@ STORY_APPEARANCE_DEFAULT_GRADIENT_FROM = "#050506"
 STORY_APPEARANCE_DEFAULT_GRADIENT_TO = "#120803"
 STORY_APPEARANCE_DEFAULT_SOLID_COLOR = "#050506"
 
+STORY_GAME_SUMMARY_CACHE_MAX_SIZE = 512
+_STORY_GAME_SUMMARY_SOURCE_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "opening_scene",
+    "visibility",
+    "publication_status",
+    "publication_requested_at",
+    "publication_reviewed_at",
+    "publication_reviewer_user_id",
+    "publication_rejection_reason",
+    "age_rating",
+    "genres",
+    "cover_scale",
+    "cover_position_x",
+    "cover_position_y",
+    "source_world_id",
+    "community_views",
+    "community_launches",
+    "community_rating_sum",
+    "community_rating_count",
+    "context_limit_chars",
+    "response_max_tokens",
+    "response_max_tokens_enabled",
+    "response_token_limit_enabled",
+    "story_llm_model",
+    "image_model",
+    "image_style_prompt",
+    "memory_optimization_enabled",
+    "memory_optimization_mode",
+    "story_repetition_penalty",
+    "story_top_k",
+    "story_top_r",
+    "story_temperature",
+    "show_gg_thoughts",
+    "show_npc_thoughts",
+    "active_main_hero_card_id",
+    "auto_npc_cards_enabled",
+    "auto_graph_nodes_enabled",
+    "auto_graph_edges_enabled",
+    "graph_confirm_low_confidence",
+    "graph_auto_apply_confidence",
+    "ambient_enabled",
+    "game_mode",
+    "character_state_enabled",
+    "appearance_background_mode",
+    "appearance_gradient_enabled",
+    "appearance_gradient_from",
+    "appearance_gradient_to",
+    "appearance_solid_color",
+    "appearance_ui_style",
+    "appearance_text_style",
+    "canonical_state_pipeline_enabled",
+    "canonical_state_safe_fallback_enabled",
+    "environment_enabled",
+    "environment_time_enabled",
+    "environment_weather_enabled",
+    "ambient_profile",
+    "environment_current_datetime",
+    "environment_current_weather",
+    "environment_tomorrow_weather",
+    "current_location_label",
+    "current_location_manual_override_label",
+    "last_activity_at",
+    "created_at",
+    "updated_at",
+)
+_STORY_GAME_SUMMARY_CACHE: OrderedDict[tuple[Any, ...], StoryGameSummaryOut] = OrderedDict()
+_STORY_GAME_SUMMARY_CACHE_LOCK = Lock()
+
 
 def coerce_story_narrator_mode(value: str | None) -> str:
     normalized = str(value or STORY_NARRATOR_MODE_NORMAL).strip().lower()
@@ -480,6 +554,7 @@ def normalize_story_game_age_rating(value: str | None) -> str:
     return normalized
 
 
+@lru_cache(maxsize=4096)
 def _normalize_story_game_genre_value(value: str) -> str:
     return " ".join(sanitize_likely_utf8_mojibake(value).replace("\r", " ").replace("\n", " ").split())
 
@@ -517,17 +592,15 @@ def serialize_story_game_genres(values: list[str]) -> str:
     return json.dumps(values, ensure_ascii=False)
 
 
-def deserialize_story_game_genres(raw_value: str | None) -> list[str]:
-    if not raw_value:
-        return []
-
+@lru_cache(maxsize=1024)
+def _deserialize_story_game_genres_cached(raw_value: str) -> tuple[str, ...]:
     try:
         loaded = json.loads(raw_value)
     except (TypeError, ValueError):
-        return []
+        return ()
 
     if not isinstance(loaded, list):
-        return []
+        return ()
 
     normalized_values: list[str] = []
     seen: set[str] = set()
@@ -542,7 +615,13 @@ def deserialize_story_game_genres(raw_value: str | None) -> list[str]:
         if len(normalized_values) >= STORY_GENRE_MAX_ITEMS:
             break
 
-    return normalized_values
+    return tuple(normalized_values)
+
+
+def deserialize_story_game_genres(raw_value: str | None) -> list[str]:
+    if not raw_value:
+        return []
+    return list(_deserialize_story_game_genres_cached(raw_value))
 
 
 def normalize_story_game_description(value: str | None) -> str:
@@ -1214,31 +1293,79 @@ def count_story_completed_turns(messages: list[StoryMessage]) -> int:
     return completed_turns
 
 
+STORY_GAME_RELATION_DELETE_TARGETS = (
+    (StoryGraphEvent, StoryGraphEvent.game_id),
+    (StoryGraphSuggestion, StoryGraphSuggestion.game_id),
+    (StoryGraphEdge, StoryGraphEdge.game_id),
+    (StoryGraphNode, StoryGraphNode.game_id),
+    (StoryWorldCardChangeEvent, StoryWorldCardChangeEvent.game_id),
+    (StoryPlotCardChangeEvent, StoryPlotCardChangeEvent.game_id),
+    (StoryNovelBeat, StoryNovelBeat.game_id),
+    (StorySceneBackground, StorySceneBackground.game_id),
+    (StoryTurnImage, StoryTurnImage.game_id),
+    (StoryMapImage, StoryMapImage.game_id),
+    (StoryMemoryBlock, StoryMemoryBlock.game_id),
+    (StoryCharacterStateSnapshot, StoryCharacterStateSnapshot.game_id),
+    (StoryMessage, StoryMessage.game_id),
+    (StoryInstructionCard, StoryInstructionCard.game_id),
+    (StoryPlotCard, StoryPlotCard.game_id),
+    (StoryWorldCard, StoryWorldCard.game_id),
+    (StoryCommunityWorldComment, StoryCommunityWorldComment.world_id),
+    (StoryCommunityWorldRating, StoryCommunityWorldRating.world_id),
+    (StoryCommunityWorldView, StoryCommunityWorldView.world_id),
+    (StoryCommunityWorldLaunch, StoryCommunityWorldLaunch.world_id),
+    (StoryCommunityWorldFavorite, StoryCommunityWorldFavorite.world_id),
+    (StoryCommunityWorldReport, StoryCommunityWorldReport.world_id),
+)
+
+
+# Probed once per process; True when every child table above has only ON DELETE CASCADE foreign keys
+# to story_games, so deleting the game row alone removes its relations.
+_story_game_foreign_keys_cascade: bool | None = None
+
+
+def _story_game_foreign_keys_cascade_in_place(db: Session) -> bool:
+    global _story_game_foreign_keys_cascade
+    if _story_game_foreign_keys_cascade is None:
+        delete_rules_by_table: dict[str, set[str]] = {}
+        for table_name, delete_rule in db.execute(
+            text(
+                "SELECT child.relname, constraint_row.confdeltype "
+                "FROM pg_constraint AS constraint_row "
+                "JOIN pg_class AS child ON child.oid = constraint_row.conrelid "
+                "JOIN pg_class AS parent ON parent.oid = constraint_row.confrelid "
+                "WHERE constraint_row.contype = 'f' AND parent.relname = :parent_table"
+            ),
+            {"parent_table": StoryGame.__tablename__},
+        ).all():
+            delete_rules_by_table.setdefault(str(table_name), set()).add(str(delete_rule))
+        _story_game_foreign_keys_cascade = all(
+            delete_rules_by_table.get(model.__tablename__) == {"c"}
+            for model, _ in STORY_GAME_RELATION_DELETE_TARGETS
+        )
+    return _story_game_foreign_keys_cascade
+
+
+def _delete_story_game_relations(db: Session, *, game_id: int) -> None:
+    if db.get_bind().dialect.name == "postgresql":
+        if _story_game_foreign_keys_cascade_in_place(db):
+            return
+        # PostgreSQL runs data-modifying CTEs in one statement and checks the
+        # foreign keys at its end, so all child tables go in a single round-trip.
+        relation_delete_ctes = [
+            sa_delete(model).where(game_column == game_id).cte(f"deleted_relation_{index}")
+            for index, (model, game_column) in enumerate(STORY_GAME_RELATION_DELETE_TARGETS)
+        ]
+        db.execute(select(literal(1)).add_cte(*relation_delete_ctes))
+        return
+    for model, game_column in STORY_GAME_RELATION_DELETE_TARGETS:
+        db.execute(sa_delete(model).where(game_column == game_id))
+
+
 def delete_story_game_with_relations(db: Session, *, game_id: int) -> StoryGame | None:
-    db.execute(sa_delete(StoryGraphEvent).where(StoryGraphEvent.game_id == game_id))
-    db.execute(sa_delete(StoryGraphSuggestion).where(StoryGraphSuggestion.game_id == game_id))
-    db.execute(sa_delete(StoryGraphEdge).where(StoryGraphEdge.game_id == game_id))
-    db.execute(sa_delete(StoryGraphNode).where(StoryGraphNode.game_id == game_id))
-    db.execute(sa_delete(StoryWorldCardChangeEvent).where(StoryWorldCardChangeEvent.game_id == game_id))
-    db.execute(sa_delete(StoryPlotCardChangeEvent).where(StoryPlotCardChangeEvent.game_id == game_id))
-    db.execute(sa_delete(StoryNovelBeat).where(StoryNovelBeat.game_id == game_id))
-    db.execute(sa_delete(StorySceneBackground).where(StorySceneBackground.game_id == game_id))
-    db.execute(sa_delete(StoryTurnImage).where(StoryTurnImage.game_id == game_id))
-    db.execute(sa_delete(StoryMapImage).where(StoryMapImage.game_id == game_id))
-    db.execute(sa_delete(StoryMemoryBlock).where(StoryMemoryBlock.game_id == game_id))
-    db.execute(sa_delete(StoryCharacterStateSnapshot).where(StoryCharacterStateSnapshot.game_id == game_id))
-    db.execute(sa_delete(StoryMessage).where(StoryMessage.game_id == game_id))
-    db.execute(sa_delete(StoryInstructionCard).where(StoryInstructionCard.game_id == game_id))
-    db.execute(sa_delete(StoryPlotCard).where(StoryPlotCard.game_id == game_id))
-    db.execute(sa_delete(StoryWorldCard).where(StoryWorldCard.game_id == game_id))
-    db.execute(sa_delete(StoryCommunityWorldComment).where(StoryCommunityWorldComment.world_id == game_id))
-    db.execute(sa_delete(StoryCommunityWorldRating).where(StoryCommunityWorldRating.world_id == game_id))
-    db.execute(sa_delete(StoryCommunityWorldView).where(StoryCommunityWorldView.world_id == game_id))
-    db.execute(sa_delete(StoryCommunityWorldLaunch).where(StoryCommunityWorldLaunch.world_id == game_id))
-    db.execute(sa_delete(StoryCommunityWorldFavorite).where(StoryCommunityWorldFavorite.world_id == game_id))
-    db.execute(sa_delete(StoryCommunityWorldReport).where(StoryCommunityWorldReport.world_id == game_id))
-
-    game = db.scalar(select(StoryGame).where(StoryGame.id == game_id))
+    _delete_story_game_relations(db, game_id=game_id)
+
+    game = db.get(StoryGame, game_id)
     if game is not None:
         db.delete(game)
     return game
@@ -1250,12 +1377,59 @@ def story_game_summary_to_out(
     latest_message_preview: str | None = None,
     turn_count: int = 0,
 ) -> StoryGameSummaryOut:
-    cover_image_url = resolve_media_display_url(
+    cover_image_url = _resolve_story_game_summary_cover_url(game)
+    # The key is the column values the summary is built from, so any change to the row (including
+    # counter bumps issued as plain UPDATEs) produces a new entry. Inline data: covers are keyed by
+    # their short display URL instead of the raw payload.
+    cache_key: tuple[Any, ...] | None = None
+    if game.id is not None:
+        cache_key = (
+            cover_image_url,
+            *(getattr(game, field_name, None) for field_name in _STORY_GAME_SUMMARY_SOURCE_FIELDS),
+        )
+        with _STORY_GAME_SUMMARY_CACHE_LOCK:
+            summary = _STORY_GAME_SUMMARY_CACHE.get(cache_key)
+            if summary is not None:
+                _STORY_GAME_SUMMARY_CACHE.move_to_end(cache_key)
+        if summary is not None:
+            return summary.model_copy(
+                update={
+                    "latest_message_preview": sanitize_likely_utf8_mojibake(latest_message_preview) or None,
+                    "turn_count": max(int(turn_count or 0), 0),
+                }
+            )
+
+    summary = _build_story_game_summary_out(
+        game,
+        cover_image_url=cover_image_url,
+        latest_message_preview=latest_message_preview,
+        turn_count=turn_count,
+    )
+    if cache_key is not None:
+        with _STORY_GAME_SUMMARY_CACHE_LOCK:
+            _STORY_GAME_SUMMARY_CACHE[cache_key] = summary
+            while len(_STORY_GAME_SUMMARY_CACHE) > STORY_GAME_SUMMARY_CACHE_MAX_SIZE:
+                _STORY_GAME_SUMMARY_CACHE.popitem(last=False)
+        return summary.model_copy()
+    return summary
+
+
+def _resolve_story_game_summary_cover_url(game: StoryGame) -> str | None:
+    return resolve_media_display_url(
         getattr(game, "cover_image_url", None),
         kind="story-game-cover",
         entity_id=int(game.id),
         version=getattr(game, "updated_at", None),
     )
+
+
+def _build_story_game_summary_out(
+    game: StoryGame,
+    *,
+    cover_image_url: str | None,
+    latest_message_preview: str | None,
+    turn_count: int,
+) -> StoryGameSummaryOut:
     current_weather = resolve_story_environment_current_weather_for_output(game)
     normalized_story_model = coerce_story_llm_model(getattr(game, "story_llm_model", None))
     environment_time_enabled = normalize_story_environment_time_enabled(
@@ -1820,15 +1994,23 @@ def ensure_story_game_public_card_snapshots(db: Session, game: StoryGame) -> boo
             and len(plot_cards_snapshot) == 0
             and len(filtered_world_cards_snapshot) == 0
         ):
-            has_live_instruction_cards = len(list_story_instruction_cards(db, game.id)) > 0
-            has_live_plot_cards = len(list_story_plot_cards(db, game.id)) > 0
+            # Existence probes only; the full card lists are loaded by the refresh when it is needed.
+            live_world_cards_filter = StoryWorldCard.game_id == game.id
             if is_public_world:
-                has_live_world_cards = any(
-                    _normalize_story_world_card_kind(getattr(card, "kind", None)) != STORY_WORLD_CARD_KIND_MAIN_HERO
-                    for card in list_story_world_cards(db, game.id)
+                live_world_cards_filter = and_(
+                    live_world_cards_filter,
+                    or_(
+                        StoryWorldCard.kind.is_(None),
+                        func.lower(func.trim(StoryWorldCard.kind)) != STORY_WORLD_CARD_KIND_MAIN_HERO,
+                    ),
                 )
-            else:
-                has_live_world_cards = len(list_story_world_cards(db, game.id)) > 0
+            has_live_instruction_cards, has_live_plot_cards, has_live_world_cards = db.execute(
+                select(
+                    select(StoryInstructionCard.id).where(StoryInstructionCard.game_id == game.id).exists(),
+                    select(StoryPlotCard.id).where(StoryPlotCard.game_id == game.id).exists(),
+                    select(StoryWorldCard.id).where(live_world_cards_filter).exists(),
+                )
+            ).one()
             if has_live_instruction_cards or has_live_plot_cards or has_live_world_cards:
                 refresh_story_game_public_card_snapshots(db, game)
                 return True
@@ -1837,6 +2019,54 @@ def ensure_story_game_public_card_snapshots(db: Session, game: StoryGame) -> boo
     return True
 
 
+def _insert_story_cloned_card_rows(db: Session, model: type, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    # One executemany per table instead of a RETURNING round trip for every cloned card.
+    db.execute(sa_insert(model), rows)
+
+
+def _build_story_cloned_world_card_row(
+    db: Session,
+    card: StoryWorldCard | StoryWorldCardOut,
+    *,
+    target_game_id: int,
+    card_kind: str,
+    triggers: str,
+) -> dict[str, Any]:
+    return {
+        "game_id": target_game_id,
+        "title": card.title,
+        "content": card.content,
+        "race": normalize_story_character_race(getattr(card, "race", "")),
+        "clothing": normalize_story_character_clothing(getattr(card, "clothing", "")),
+        "inventory": normalize_story_character_inventory(getattr(card, "inventory", "")),
+        "health_status": normalize_story_character_health_status(getattr(card, "health_status", "")),
+        "triggers": triggers,
+        "name_color": normalize_story_character_text_color(getattr(card, "name_color", "")),
+        "speech_color": normalize_story_character_text_color(getattr(card, "speech_color", "")),
+        "bubble_color": normalize_story_character_text_color(getattr(card, "bubble_color", "")),
+        "thought_bubble_color": normalize_story_character_text_color(getattr(card, "thought_bubble_color", "")),
+        "kind": card_kind,
+        "detail_type": " ".join(str(getattr(card, "detail_type", "") or "").replace("\r\n", " ").split()).strip(),
+        "avatar_url": normalize_story_character_avatar_url(card.avatar_url, db=db),
+        "avatar_original_url": (
+            normalize_story_character_avatar_original_url(
+                getattr(card, "avatar_original_url", None),
+                db=db,
+            )
+            if getattr(card, "avatar_url", None)
+            else None
+        ),
+        "avatar_scale": normalize_story_avatar_scale(card.avatar_scale),
+        "character_id": None,
+        "memory_turns": _normalize_story_world_card_memory_turns_for_storage(card.memory_turns, kind=card_kind),
+        "is_locked": bool(card.is_locked),
+        "ai_edit_enabled": bool(card.ai_edit_enabled),
+        "source": _normalize_story_world_card_source(card.source),
+    }
+
+
 def clone_story_world_cards_to_game(
     db: Session,
     *,
@@ -1852,154 +2082,111 @@ def clone_story_world_cards_to_game(
 ) -> None:
     if copy_instructions:
         if source_instruction_cards_out is None:
-            source_instruction_cards = list_story_instruction_cards(db, source_world_id)
-            for card in source_instruction_cards:
-                cloned_instruction = StoryInstructionCard(
-                    game_id=target_game_id,
-                    title=card.title,
-                    content=card.content,
-                    is_active=bool(getattr(card, "is_active", True)),
+            # Instruction cards are copied verbatim, so the rows never need to leave the database.
+            db.execute(
+                sa_insert(StoryInstructionCard).from_select(
+                    ["game_id", "title", "content", "is_active"],
+                    select(
+                        literal(target_game_id),
+                        StoryInstructionCard.title,
+                        StoryInstructionCard.content,
+                        StoryInstructionCard.is_active,
+                    )
+                    .where(StoryInstructionCard.game_id == source_world_id)
+                    .order_by(StoryInstructionCard.id.asc()),
                 )
-                db.add(cloned_instruction)
+            )
         else:
-            for card in source_instruction_cards_out:
-                cloned_instruction = StoryInstructionCard(
-                    game_id=target_game_id,
-                    title=card.title,
-                    content=card.content,
-                    is_active=bool(getattr(card, "is_active", True)),
-                )
-                db.add(cloned_instruction)
+            _insert_story_cloned_card_rows(
+                db,
+                StoryInstructionCard,
+                [
+                    {
+                        "game_id": target_game_id,
+                        "title": card.title,
+                        "content": card.content,
+                        "is_active": bool(getattr(card, "is_active", True)),
+                    }
+                    for card in source_instruction_cards_out
+                ],
+            )
 
     if copy_plot:
+        plot_card_rows: list[dict[str, Any]] = []
         if source_plot_cards_out is None:
-            source_plot_cards = list_story_plot_cards(db, source_world_id)
-            for card in source_plot_cards:
-                cloned_plot = StoryPlotCard(
-                    game_id=target_game_id,
-                    title=card.title,
-                    content=card.content,
-                    triggers=serialize_story_plot_card_triggers(
-                        normalize_story_plot_card_triggers(
-                            deserialize_story_plot_card_triggers(str(getattr(card, "triggers", "") or "")),
-                            fallback_title=card.title,
-                        )
-                    ),
-                    memory_turns=normalize_story_plot_card_memory_turns_for_storage(
-                        getattr(card, "memory_turns", None),
-                        explicit=False,
-                        current_value=getattr(card, "memory_turns", None),
-                    ),
-                    ai_edit_enabled=bool(getattr(card, "ai_edit_enabled", True)),
-                    is_enabled=_coerce_story_plot_card_enabled(getattr(card, "is_enabled", True)),
-                    source=normalize_story_plot_card_source(getattr(card, "source", "")),
+            for card in list_story_plot_cards(db, source_world_id):
+                plot_card_rows.append(
+                    {
+                        "game_id": target_game_id,
+                        "title": card.title,
+                        "content": card.content,
+                        "triggers": serialize_story_plot_card_triggers(
+                            normalize_story_plot_card_triggers(
+                                deserialize_story_plot_card_triggers(str(getattr(card, "triggers", "") or "")),
+                                fallback_title=card.title,
+                            )
+                        ),
+                        "memory_turns": normalize_story_plot_card_memory_turns_for_storage(
+                            getattr(card, "memory_turns", None),
+                            explicit=False,
+                            current_value=getattr(card, "memory_turns", None),
+                        ),
+                        "ai_edit_enabled": bool(getattr(card, "ai_edit_enabled", True)),
+                        "is_enabled": _coerce_story_plot_card_enabled(getattr(card, "is_enabled", True)),
+                        "source": normalize_story_plot_card_source(getattr(card, "source", "")),
+                    }
                 )
-                db.add(cloned_plot)
         else:
             for card in source_plot_cards_out:
-                cloned_plot = StoryPlotCard(
-                    game_id=target_game_id,
-                    title=card.title,
-                    content=card.content,
-                    triggers=serialize_story_plot_card_triggers(
-                        normalize_story_plot_card_triggers(
-                            list(card.triggers),
-                            fallback_title=card.title,
-                        )
-                    ),
-                    memory_turns=normalize_story_plot_card_memory_turns_for_storage(
-                        card.memory_turns,
-                        explicit=True,
-                        current_value=None,
-                    ),
-                    ai_edit_enabled=bool(card.ai_edit_enabled),
-                    is_enabled=_coerce_story_plot_card_enabled(card.is_enabled),
-                    source=normalize_story_plot_card_source(card.source),
+                plot_card_rows.append(
+                    {
+                        "game_id": target_game_id,
+                        "title": card.title,
+                        "content": card.content,
+                        "triggers": serialize_story_plot_card_triggers(
+                            normalize_story_plot_card_triggers(
+                                list(card.triggers),
+                                fallback_title=card.title,
+                            )
+                        ),
+                        "memory_turns": normalize_story_plot_card_memory_turns_for_storage(
+                            card.memory_turns,
+                            explicit=True,
+                            current_value=None,
+                        ),
+                        "ai_edit_enabled": bool(card.ai_edit_enabled),
+                        "is_enabled": _coerce_story_plot_card_enabled(card.is_enabled),
+                        "source": normalize_story_plot_card_source(card.source),
+                    }
                 )
-                db.add(cloned_plot)
-
-    if source_world_cards_out is None:
-        source_world_cards = list_story_world_cards(db, source_world_id)
-        for card in source_world_cards:
-            card_kind = _normalize_story_world_card_kind(card.kind)
-            if card_kind == STORY_WORLD_CARD_KIND_MAIN_HERO and not copy_main_hero:
-                continue
-            if card_kind != STORY_WORLD_CARD_KIND_MAIN_HERO and not copy_world:
-                continue
-            cloned_world_card = StoryWorldCard(
-                game_id=target_game_id,
-                title=card.title,
-                content=card.content,
-                race=normalize_story_character_race(getattr(card, "race", "")),
-                clothing=normalize_story_character_clothing(getattr(card, "clothing", "")),
-                inventory=normalize_story_character_inventory(getattr(card, "inventory", "")),
-                health_status=normalize_story_character_health_status(getattr(card, "health_status", "")),
-                triggers=card.triggers,
-                name_color=normalize_story_character_text_color(getattr(card, "name_color", "")),
-                speech_color=normalize_story_character_text_color(getattr(card, "speech_color", "")),
-                bubble_color=normalize_story_character_text_color(getattr(card, "bubble_color", "")),
-                thought_bubble_color=normalize_story_character_text_color(getattr(card, "thought_bubble_color", "")),
-                kind=card_kind,
-                detail_type=" ".join(str(getattr(card, "detail_type", "") or "").replace("\r\n", " ").split()).strip(),
-                avatar_url=normalize_story_character_avatar_url(card.avatar_url, db=db),
-                avatar_original_url=(
-                    normalize_story_character_avatar_original_url(
-                        getattr(card, "avatar_original_url", None),
-                        db=db,
-                    )
-                    if getattr(card, "avatar_url", None)
-                    else None
-                ),
-                avatar_scale=normalize_story_avatar_scale(card.avatar_scale),
-                character_id=None,
-                memory_turns=_normalize_story_world_card_memory_turns_for_storage(card.memory_turns, kind=card_kind),
-                is_locked=bool(card.is_locked),
-                ai_edit_enabled=bool(card.ai_edit_enabled),
-                source=_normalize_story_world_card_source(card.source),
-            )
-            db.add(cloned_world_card)
-        return
+        _insert_story_cloned_card_rows(db, StoryPlotCard, plot_card_rows)
 
-    for card in source_world_cards_out:
+    world_card_rows: list[dict[str, Any]] = []
+    source_world_cards = (
+        list_story_world_cards(db, source_world_id) if source_world_cards_out is None else source_world_cards_out
+    )
+    for card in source_world_cards:
         card_kind = _normalize_story_world_card_kind(card.kind)
         if card_kind == STORY_WORLD_CARD_KIND_MAIN_HERO and not copy_main_hero:
             continue
         if card_kind != STORY_WORLD_CARD_KIND_MAIN_HERO and not copy_world:
             continue
-        cloned_world_card = StoryWorldCard(
-            game_id=target_game_id,
-            title=card.title,
-            content=card.content,
-            race=normalize_story_character_race(getattr(card, "race", "")),
-            clothing=normalize_story_character_clothing(getattr(card, "clothing", "")),
-            inventory=normalize_story_character_inventory(getattr(card, "inventory", "")),
-            health_status=normalize_story_character_health_status(getattr(card, "health_status", "")),
-            triggers=serialize_story_world_card_triggers(
+        if source_world_cards_out is None:
+            triggers = card.triggers
+        else:
+            triggers = serialize_story_world_card_triggers(
                 normalize_story_world_card_triggers(
                     list(card.triggers),
                     fallback_title=card.title,
                 )
-            ),
-            name_color=normalize_story_character_text_color(getattr(card, "name_color", "")),
-            speech_color=normalize_story_character_text_color(getattr(card, "speech_color", "")),
-            bubble_color=normalize_story_character_text_color(getattr(card, "bubble_color", "")),
-            thought_bubble_color=normalize_story_character_text_color(getattr(card, "thought_bubble_color", "")),
-            kind=card_kind,
-            detail_type=" ".join(str(getattr(card, "detail_type", "") or "").replace("\r\n", " ").split()).strip(),
-            avatar_url=normalize_story_character_avatar_url(card.avatar_url, db=db),
-            avatar_original_url=(
-                normalize_story_character_avatar_original_url(
-                    getattr(card, "avatar_original_url", None),
-                    db=db,
-                )
-                if getattr(card, "avatar_url", None)
-                else None
-            ),
-            avatar_scale=normalize_story_avatar_scale(card.avatar_scale),
-            character_id=None,
-            memory_turns=_normalize_story_world_card_memory_turns_for_storage(card.memory_turns, kind=card_kind),
-            is_locked=bool(card.is_locked),
-            ai_edit_enabled=bool(card.ai_edit_enabled),
-            source=_normalize_story_world_card_source(card.source),
+            )
+        world_card_rows.append(
+            _build_story_cloned_world_card_row(
+                db,
+                card,
+                target_game_id=target_game_id,
+                card_kind=card_kind,
+                triggers=triggers,
+            )
         )
-        db.add(cloned_world_card)
+    _insert_story_cloned_card_rows(db, StoryWorldCard, world_card_rows)
@@ -39,7 +39,8 @@ def story_message_to_out(message: StoryMessage) -> StoryMessageOut:
         active_variant_index = max(0, min(active_variant_index, len(variant_history) - 1))
     else:
         active_variant_index = 0
-    return StoryMessageOut(
+    # Every field comes from typed ORM columns or the parsed variant log, so validation is skipped.
+    return StoryMessageOut.model_construct(
         id=message.id,
         game_id=message.game_id,
         role=message.role,
@@ -51,7 +52,7 @@ def story_message_to_out(message: StoryMessage) -> StoryMessageOut:
         created_at=message.created_at,
         updated_at=message.updated_at,
         variant_history=[
-            StoryMessageVariantOut(
+            StoryMessageVariantOut.model_construct(
                 content=sanitize_likely_utf8_mojibake(
                     strip_story_novel_scene_cast_metadata(variant["content"])
                     if is_assistant_message
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime, timezone
+from typing import Any
 
 from fastapi import HTTPException, status
-from sqlalchemy import or_, select
+from sqlalchemy import Row, and_, bindparam, lambda_stmt, or_, select
 from sqlalchemy.orm import Session, load_only
 
 from app.models import (
@@ -19,12 +21,26 @@ from app.models import (
     StoryPlotCardChangeEvent,
     StoryWorldCard,
     StoryWorldCardChangeEvent,
+    User,
 )
+from app.services.auth_identity import ensure_authorized_user, resolve_authorization_claims
 
 STORY_GAME_VISIBILITY_PUBLIC = "public"
 STORY_CARD_VISIBILITY_PUBLIC = "public"
 STORY_WORLD_CARD_KIND_MAIN_HERO = "main_hero"
 
+_USER_STORY_GAME_WORLD_CARD_STATEMENT = lambda_stmt(
+    lambda: select(StoryGame, StoryWorldCard)
+    .outerjoin(
+        StoryWorldCard,
+        and_(StoryWorldCard.id == bindparam("card_id"), StoryWorldCard.game_id == StoryGame.id),
+    )
+    .where(
+        StoryGame.id == bindparam("game_id"),
+        StoryGame.user_id == bindparam("user_id"),
+    )
+)
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -46,6 +62,49 @@ def get_user_story_game_or_404(db: Session, user_id: int, game_id: int) -> Story
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
 
 
+def get_current_user_story_game_or_404(
+    db: Session,
+    authorization: str | None,
+    game_id: int,
+) -> tuple[User, StoryGame]:
+    # Loads the user and the owned game in one round trip instead of two lookups.
+    user_id, token_email, token_issued_at = resolve_authorization_claims(authorization)
+    row = db.execute(
+        select(User, StoryGame)
+        .outerjoin(StoryGame, and_(StoryGame.id == game_id, StoryGame.user_id == User.id))
+        .where(User.id == user_id)
+    ).one_or_none()
+    user = ensure_authorized_user(
+        db,
+        row[0] if row is not None else None,
+        token_email=token_email,
+        token_issued_at=token_issued_at,
+    )
+    game = row[1] if row is not None else None
+    if game is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    return user, game
+
+
+def get_user_story_game_world_card_or_404(
+    db: Session,
+    user_id: int,
+    game_id: int,
+    card_id: int,
+) -> tuple[StoryGame, StoryWorldCard]:
+    # Ownership check and card lookup share one round trip; the outer join keeps the two 404s distinct.
+    row = db.execute(
+        _USER_STORY_GAME_WORLD_CARD_STATEMENT,
+        {"user_id": user_id, "game_id": game_id, "card_id": card_id},
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    game, world_card = row
+    if world_card is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="World card not found")
+    return game, world_card
+
+
 def get_public_story_world_or_404(db: Session, world_id: int) -> StoryGame:
     world = db.scalar(
         select(StoryGame).where(
@@ -93,6 +152,47 @@ def list_story_messages(db: Session, game_id: int) -> list[StoryMessage]:
     ).all()
 
 
+def load_story_turn_count_by_game_id(
+    db: Session,
+    *,
+    game_ids: list[int],
+) -> dict[int, int]:
+    if not game_ids:
+        return {}
+
+    # Long histories can hold many thousands of messages, so fetch them in bounded batches.
+    rows = db.execute(
+        select(StoryMessage.game_id, StoryMessage.role)
+        .where(
+            StoryMessage.game_id.in_(game_ids),
+            StoryMessage.undone_at.is_(None),
+        )
+        .order_by(StoryMessage.game_id.asc(), StoryMessage.id.asc())
+        .execution_options(yield_per=1_000)
+    )
+
+    turn_count_by_game_id: dict[int, int] = {}
+    current_game_id: int | None = None
+    has_pending_user_turn = False
+
+    for raw_game_id, raw_role in rows:
+        game_id = int(raw_game_id)
+        if current_game_id != game_id:
+            current_game_id = game_id
+            has_pending_user_turn = False
+            turn_count_by_game_id.setdefault(game_id, 0)
+
+        role = str(raw_role or "").strip().lower()
+        if role == "user":
+            has_pending_user_turn = True
+            continue
+        if role == "assistant" and has_pending_user_turn:
+            turn_count_by_game_id[game_id] = turn_count_by_game_id.get(game_id, 0) + 1
+            has_pending_user_turn = False
+
+    return turn_count_by_game_id
+
+
 def list_story_messages_window(
     db: Session,
     game_id: int,
@@ -304,6 +404,14 @@ def list_story_world_cards(db: Session, game_id: int) -> list[StoryWorldCard]:
     ).all()
 
 
+def list_story_world_card_rows(db: Session, game_id: int) -> Sequence[Row[Any]]:
+    return db.execute(
+        select(StoryWorldCard.__table__)
+        .where(StoryWorldCard.game_id == game_id)
+        .order_by(StoryWorldCard.id.asc())
+    ).all()
+
+
 def list_story_characters(
     db: Session,
     user_id: int,
@@ -382,8 +490,9 @@ def list_story_instruction_templates(
     limit: int | None = None,
     offset: int = 0,
     query: str = "",
-) -> list[StoryInstructionTemplate]:
-    statement = select(StoryInstructionTemplate).where(StoryInstructionTemplate.user_id == user_id)
+) -> Sequence[Row[Any]]:
+    # Plain column rows: the list is only serialized, so ORM instances and identity-map tracking are skipped.
+    statement = select(StoryInstructionTemplate.__table__).where(StoryInstructionTemplate.user_id == user_id)
     normalized_query = " ".join(str(query or "").split()).strip()
     if normalized_query:
         pattern = f"%{normalized_query}%"
@@ -402,7 +511,7 @@ def list_story_instruction_templates(
         statement = statement.offset(offset)
     if limit is not None:
         statement = statement.limit(limit)
-    return db.scalars(statement).all()
+    return db.execute(statement).all()
 
 
 def get_story_instruction_template_for_user_or_404(
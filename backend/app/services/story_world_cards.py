@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import json
 import re
 from typing import Any
@@ -109,7 +110,12 @@ def deserialize_story_world_card_triggers(raw_value: str | None) -> list[str]:
     raw = str(raw_value or "").strip()
     if not raw:
         return []
+    return list(_deserialize_story_world_card_triggers_text(raw))
 
+
+# Stored trigger JSON rarely changes between polls and prompt builds, so parsing is memoized per raw value.
+@lru_cache(maxsize=4096)
+def _deserialize_story_world_card_triggers_text(raw: str) -> tuple[str, ...]:
     parsed: Any
     try:
         parsed = json.loads(raw)
@@ -117,7 +123,7 @@ def deserialize_story_world_card_triggers(raw_value: str | None) -> list[str]:
         parsed = [part.strip() for part in raw.split(",")]
 
     if not isinstance(parsed, list):
-        return []
+        return ()
 
     normalized: list[str] = []
     seen: set[str] = set()
@@ -137,7 +143,7 @@ def deserialize_story_world_card_triggers(raw_value: str | None) -> list[str]:
             seen.add(trigger_key)
             normalized.append(trigger)
 
-    return normalized[:40]
+    return tuple(normalized[:40])
 
 
 def normalize_story_world_card_source(value: str | None) -> str:
@@ -148,7 +154,14 @@ def normalize_story_world_card_source(value: str | None) -> str:
 
 
 def normalize_story_world_card_kind(value: str | None) -> str:
-    normalized = value.strip().lower() if isinstance(value, str) else ""
+    if not isinstance(value, str):
+        return STORY_WORLD_CARD_KIND_WORLD
+    return _normalize_story_world_card_kind_text(value)
+
+
+@lru_cache(maxsize=256)
+def _normalize_story_world_card_kind_text(value: str) -> str:
+    normalized = value.strip().lower()
     if normalized in STORY_WORLD_CARD_KINDS:
         return normalized
     return STORY_WORLD_CARD_KIND_WORLD
@@ -267,7 +280,8 @@ def story_world_card_to_out(card: StoryWorldCard) -> StoryWorldCardOut:
         if getattr(card, "avatar_url", None)
         else None
     )
-    return StoryWorldCardOut(
+    # Every field is already normalized to its schema type above, so validation is skipped.
+    return StoryWorldCardOut.model_construct(
         id=card.id,
         game_id=card.game_id,
         title=normalize_story_world_card_title(card.title),
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, insert, select, update as sa_update
+from sqlalchemy.orm import sessionmaker
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.database import Base  # noqa: E402
+from app.models import (  # noqa: E402
+    StoryCommunityInstructionTemplateRating,
+    StoryCommunityWorldRating,
+    StoryGame,
+    StoryInstructionTemplate,
+    User,
+)
+from app.services.concurrency import (  # noqa: E402
+    USER_RATING_UPSERT_MAX_ATTEMPTS,
+    apply_story_instruction_template_rating_upsert,
+    apply_story_world_rating_upsert,
+    upsert_story_instruction_template_rating,
+    upsert_story_world_rating,
+)
+
+
+class CommunityRatingUpsertTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{Path(self.temp_dir.name) / 'ratings.db'}", future=True)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine, future=True, expire_on_commit=False)
+        with self.Session() as db:
+            user = User(email="rater@example.test")
+            author = User(email="author@example.test")
+            db.add_all([user, author])
+            db.flush()
+            world = StoryGame(user_id=author.id, title="World", visibility="public")
+            template = StoryInstructionTemplate(user_id=author.id, title="Template", content="Content")
+            db.add_all([world, template])
+            db.commit()
+            self.user_id, self.world_id, self.template_id = user.id, world.id, template.id
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def _rate_world(self, rating_value: int) -> None:
+        with self.Session() as db:
+            previous_rating = upsert_story_world_rating(
+                db,
+                world_id=self.world_id,
+                user_id=self.user_id,
+                rating_value=rating_value,
+            )
+            apply_story_world_rating_upsert(db, self.world_id, rating_value, previous_rating)
+            db.commit()
+
+    def _world_counters(self) -> tuple[int, int]:
+        with self.Session() as db:
+            world = db.get(StoryGame, self.world_id)
+            return int(world.community_rating_sum), int(world.community_rating_count)
+
+    def test_re_rating_world_changes_sum_by_delta_only(self) -> None:
+        self._rate_world(4)
+        self._rate_world(2)
+        self._rate_world(2)
+
+        self.assertEqual(self._world_counters(), (2, 1))
+
+    def test_re_rating_template_changes_sum_by_delta_only(self) -> None:
+        for rating_value in (5, 3):
+            with self.Session() as db:
+                previous_rating = upsert_story_instruction_template_rating(
+                    db,
+                    template_id=self.template_id,
+                    user_id=self.user_id,
+                    rating_value=rating_value,
+                )
+                apply_story_instruction_template_rating_upsert(db, self.template_id, rating_value, previous_rating)
+                db.commit()
+
+        with self.Session() as db:
+            template = db.get(StoryInstructionTemplate, self.template_id)
+            self.assertEqual((template.community_rating_sum, template.community_rating_count), (3, 1))
+            rating = db.scalar(
+                select(StoryCommunityInstructionTemplateRating.rating).where(
+                    StoryCommunityInstructionTemplateRating.template_id == self.template_id,
+                )
+            )
+            self.assertEqual(rating, 3)
+
+    def test_same_value_template_re_rate_leaves_row_and_counters_untouched(self) -> None:
+        def rate_template() -> None:
+            with self.Session() as db:
+                previous_rating = upsert_story_instruction_template_rating(
+                    db,
+                    template_id=self.template_id,
+                    user_id=self.user_id,
+                    rating_value=4,
+                )
+                apply_story_instruction_template_rating_upsert(db, self.template_id, 4, previous_rating)
+                db.commit()
+
+        def template_state() -> tuple[object, int, int]:
+            with self.Session() as db:
+                template = db.get(StoryInstructionTemplate, self.template_id)
+                rating_updated_at = db.scalar(
+                    select(StoryCommunityInstructionTemplateRating.updated_at).where(
+                        StoryCommunityInstructionTemplateRating.template_id == self.template_id,
+                    )
+                )
+                return rating_updated_at, template.community_rating_sum, template.community_rating_count
+
+        rate_template()
+        with self.engine.begin() as connection:
+            connection.execute(
+                sa_update(StoryCommunityInstructionTemplateRating).values(updated_at=datetime(2020, 1, 1))
+            )
+        state_before = template_state()
+
+        rate_template()
+
+        self.assertEqual(template_state(), state_before)
+        self.assertEqual(state_before[1:], (4, 1))
+
+    def test_rating_inserted_concurrently_is_reported_as_previous_value(self) -> None:
+        competing_inserts: list[int] = []
+
+        def insert_competing_rating(conn, cursor, statement, parameters, context, executemany) -> None:
+            if competing_inserts or not statement.startswith("INSERT INTO story_community_world_ratings"):
+                return
+            competing_inserts.append(1)
+            with self.engine.begin() as other_connection:
+                other_connection.execute(
+                    insert(StoryCommunityWorldRating).values(world_id=self.world_id, user_id=self.user_id, rating=1)
+                )
+
+        event.listen(self.engine, "before_cursor_execute", insert_competing_rating)
+        with self.Session() as db:
+            previous_rating = upsert_story_world_rating(
+                db,
+                world_id=self.world_id,
+                user_id=self.user_id,
+                rating_value=5,
+            )
+
+        self.assertEqual(previous_rating, 1)
+
+    def test_rating_upsert_gives_up_when_the_conflicting_row_stays_invisible(self) -> None:
+        with self.Session() as db, mock.patch.object(db, "scalar", return_value=None) as scalar:
+            with self.assertRaises(HTTPException) as raised:
+                upsert_story_world_rating(db, world_id=self.world_id, user_id=self.user_id, rating_value=5)
+
+        self.assertEqual(raised.exception.status_code, 409)
+        self.assertEqual(scalar.call_count, 2 * USER_RATING_UPSERT_MAX_ATTEMPTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+import re
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.database import Base  # noqa: E402
+from app.models import StoryGame, User  # noqa: E402
+from app.services import db_bootstrap  # noqa: E402
+
+
+class CommunityUpsertIndexDedupeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{Path(self.temp_dir.name) / 'dedupe.db'}", future=True)
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            # Rebuild the tables as they were before the (world_id, user_id) unique constraint existed.
+            for table_name in ("story_community_world_ratings", "story_community_world_launches"):
+                create_sql = connection.execute(
+                    text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": table_name},
+                ).scalar_one()
+                connection.execute(text(f"DROP TABLE {table_name}"))
+                connection.execute(text(re.sub(r",\s*CONSTRAINT uq_\w+ UNIQUE \([^)]*\)", "", create_sql)))
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def test_dedupe_recomputes_parent_world_aggregates(self) -> None:
+        with Session(self.engine) as db:
+            rater = User(email="rater@example.test")
+            other_rater = User(email="other@example.test")
+            db.add_all([rater, other_rater])
+            db.flush()
+            world = StoryGame(
+                user_id=rater.id,
+                title="World",
+                community_rating_sum=9,
+                community_rating_count=3,
+                community_launches=5,
+            )
+            db.add(world)
+            db.commit()
+            world_id, rater_id, other_rater_id = world.id, rater.id, other_rater.id
+
+        with self.engine.begin() as connection:
+            connection.execute(
+                text(
+                    "INSERT INTO story_community_world_ratings (world_id, user_id, rating) "
+                    "VALUES (:world_id, :rater_id, 4), (:world_id, :rater_id, 2), (:world_id, :other_rater_id, 3)"
+                ),
+                {"world_id": world_id, "rater_id": rater_id, "other_rater_id": other_rater_id},
+            )
+            connection.execute(
+                text(
+                    "INSERT INTO story_community_world_launches (world_id, user_id) "
+                    "VALUES (:world_id, :rater_id), (:world_id, :rater_id), (:world_id, :rater_id), "
+                    "(:world_id, :other_rater_id)"
+                ),
+                {"world_id": world_id, "rater_id": rater_id, "other_rater_id": other_rater_id},
+            )
+
+        with mock.patch.object(db_bootstrap, "engine", self.engine), self.assertLogs(db_bootstrap.logger, "WARNING"):
+            db_bootstrap._ensure_story_community_upsert_unique_indexes_exist()
+
+        with Session(self.engine) as db:
+            world = db.get(StoryGame, world_id)
+            self.assertEqual(
+                (world.community_rating_sum, world.community_rating_count, world.community_launches),
+                (5, 2, 3),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from app.database import Base  # noqa: E402
+from app.models import StoryGame, User  # noqa: E402
+from app.services import story_games  # noqa: E402
+
+
+class _RecordingGame:
+    def __init__(self, game: StoryGame) -> None:
+        self._game = game
+        self.read_fields: set[str] = set()
+
+    def __getattr__(self, name: str):
+        self.read_fields.add(name)
+        return getattr(self._game, name)
+
+
+class StoryGameSummaryCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        with story_games._STORY_GAME_SUMMARY_CACHE_LOCK:
+            story_games._STORY_GAME_SUMMARY_CACHE.clear()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{Path(self.temp_dir.name) / 'summaries.db'}", future=True)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine, future=True, expire_on_commit=False)
+        with self.Session() as db:
+            user = User(email="author@example.test")
+            db.add(user)
+            db.flush()
+            game = StoryGame(user_id=user.id, title="Before", cover_image_url="data:image/png;base64,AAAA")
+            db.add(game)
+            db.commit()
+            self.game_id = game.id
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def test_cache_key_covers_every_field_the_builder_reads(self) -> None:
+        with self.Session() as db:
+            recording_game = _RecordingGame(db.get(StoryGame, self.game_id))
+            cover_image_url = story_games._resolve_story_game_summary_cover_url(recording_game)
+            story_games._build_story_game_summary_out(
+                recording_game,
+                cover_image_url=cover_image_url,
+                latest_message_preview=None,
+                turn_count=0,
+            )
+
+        # cover_image_url is keyed through its resolved display URL instead of the raw column.
+        keyed_fields = {*story_games._STORY_GAME_SUMMARY_SOURCE_FIELDS, "cover_image_url"}
+        self.assertEqual(recording_game.read_fields - keyed_fields, set())
+
+    def test_edit_within_the_same_updated_at_is_not_served_stale(self) -> None:
+        with self.Session() as db:
+            game = db.get(StoryGame, self.game_id)
+            self.assertEqual(story_games.story_game_summary_to_out(game).title, "Before")
+            unchanged_updated_at = game.updated_at
+            game.title = "After"
+            db.commit()
+            game.updated_at = unchanged_updated_at
+
+            self.assertEqual(story_games.story_game_summary_to_out(game).title, "After")
+
+
+if __name__ == "__main__":
+    unittest.main()
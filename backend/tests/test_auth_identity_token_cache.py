@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+import sys
+import unittest
+from unittest.mock import patch
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.database import Base  # noqa: E402
+from app.models import User  # noqa: E402
+from app.security import create_access_token  # noqa: E402
+from app.services import auth_identity  # noqa: E402
+
+
+class AccessTokenClaimsCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        auth_identity._ACCESS_TOKEN_CLAIMS_CACHE.clear()
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = Session(bind=self.engine, future=True)
+        self.user = User(email="token-cache-test@example.com", role="user")
+        self.db.add(self.user)
+        self.db.commit()
+        self.db.refresh(self.user)
+
+    def tearDown(self) -> None:
+        auth_identity._ACCESS_TOKEN_CLAIMS_CACHE.clear()
+        self.db.close()
+        self.engine.dispose()
+
+    def _authorization(self, *, expires_delta: timedelta | None = None) -> str:
+        token = create_access_token(
+            str(self.user.id),
+            claims={"email": self.user.email},
+            expires_delta=expires_delta,
+        )
+        return f"Bearer {token}"
+
+    def test_repeated_requests_decode_token_once(self) -> None:
+        authorization = self._authorization()
+        with patch(
+            "app.services.auth_identity.safe_decode_access_token",
+            wraps=auth_identity.safe_decode_access_token,
+        ) as decode_mock:
+            first_user = auth_identity.get_current_user(self.db, authorization)
+            second_user = auth_identity.get_current_user(self.db, authorization)
+
+        self.assertEqual(decode_mock.call_count, 1)
+        self.assertEqual(first_user.id, self.user.id)
+        self.assertEqual(second_user.id, self.user.id)
+
+    def test_expired_token_is_not_cached(self) -> None:
+        authorization = self._authorization(expires_delta=timedelta(seconds=-5))
+        with self.assertRaises(HTTPException) as error:
+            auth_identity.get_current_user(self.db, authorization)
+
+        self.assertEqual(error.exception.status_code, 401)
+        self.assertEqual(len(auth_identity._ACCESS_TOKEN_CLAIMS_CACHE), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+import unittest
+
+from pydantic import BaseModel, TypeAdapter
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.json_streaming import (  # noqa: E402
+    FastJSONResponse,
+    json_model_list_response,
+    json_model_response,
+)
+
+
+class _Item(BaseModel):
+    id: int
+    title: str
+
+
+class JsonStreamingTests(unittest.TestCase):
+    def test_json_model_list_response_serializes_whole_array_with_length(self) -> None:
+        items = [_Item(id=1, title="Мир"), _Item(id=2, title="World")]
+
+        response = json_model_list_response(TypeAdapter(list[_Item]), items)
+
+        self.assertEqual(
+            json.loads(response.body.decode("utf-8")),
+            [{"id": 1, "title": "Мир"}, {"id": 2, "title": "World"}],
+        )
+        self.assertEqual(response.headers["content-length"], str(len(response.body)))
+        self.assertEqual(json_model_list_response(TypeAdapter(list[_Item]), []).body, b"[]")
+
+    def test_json_model_response_serializes_model_with_headers(self) -> None:
+        response = json_model_response(_Item(id=3, title="Мир"), headers={"Vary": "Authorization"})
+
+        self.assertEqual(json.loads(response.body.decode("utf-8")), {"id": 3, "title": "Мир"})
+        self.assertEqual(response.media_type, "application/json")
+        self.assertEqual(response.headers["vary"], "Authorization")
+
+    def test_fast_json_response_matches_stdlib_encoding(self) -> None:
+        content = {"title": "Мир", "genres": ["Фэнтези"], "rating": 4.5, "cover": None, "public": True}
+
+        response = FastJSONResponse(content)
+
+        self.assertEqual(
+            response.body,
+            json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
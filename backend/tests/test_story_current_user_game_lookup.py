@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import unittest
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.database import Base  # noqa: E402
+from app.models import StoryGame, User  # noqa: E402
+from app.security import create_access_token  # noqa: E402
+from app.services import auth_identity  # noqa: E402
+from app.services.story_queries import get_current_user_story_game_or_404  # noqa: E402
+
+
+class CurrentUserStoryGameLookupTests(unittest.TestCase):
+    def setUp(self) -> None:
+        auth_identity._ACCESS_TOKEN_CLAIMS_CACHE.clear()
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = Session(bind=self.engine, future=True)
+        self.user = User(email="owner@example.com", role="user")
+        self.other_user = User(email="other@example.com", role="user")
+        self.db.add_all([self.user, self.other_user])
+        self.db.flush()
+        self.game = StoryGame(user_id=self.user.id, title="Owned")
+        self.other_game = StoryGame(user_id=self.other_user.id, title="Foreign")
+        self.db.add_all([self.game, self.other_game])
+        self.db.commit()
+        self.authorization = "Bearer " + create_access_token(
+            str(self.user.id),
+            claims={"email": self.user.email},
+        )
+
+    def tearDown(self) -> None:
+        auth_identity._ACCESS_TOKEN_CLAIMS_CACHE.clear()
+        self.db.close()
+        self.engine.dispose()
+
+    def test_loads_user_and_owned_game_in_one_query(self) -> None:
+        user_id, game_id = self.user.id, self.game.id
+        self.db.expunge_all()
+        statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        user, game = get_current_user_story_game_or_404(self.db, self.authorization, game_id)
+
+        self.assertEqual(user.id, user_id)
+        self.assertEqual(game.id, game_id)
+        self.assertEqual(len(statements), 1)
+
+    def test_foreign_or_missing_game_is_not_found(self) -> None:
+        for game_id in (self.other_game.id, 999_999):
+            with self.assertRaises(HTTPException) as error:
+                get_current_user_story_game_or_404(self.db, self.authorization, game_id)
+            self.assertEqual(error.exception.status_code, 404)
+
+    def test_missing_token_is_unauthorized(self) -> None:
+        with self.assertRaises(HTTPException) as error:
+            get_current_user_story_game_or_404(self.db, None, self.game.id)
+        self.assertEqual(error.exception.status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
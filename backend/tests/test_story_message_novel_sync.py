@@ -88,9 +88,9 @@ class StoryMessageNovelBeatSyncTests(unittest.TestCase):
         return user, game, character, message
 
     @staticmethod
-    def _route_patches(user):
+    def _route_patches(user, game):
         return (
-            patch.object(story_messages_router, "get_current_user", return_value=user),
+            patch.object(story_messages_router, "get_current_user_story_game_or_404", return_value=(user, game)),
             patch.object(
                 story_messages_router,
                 "_acquire_story_operation_lease_or_409",
@@ -111,7 +111,7 @@ class StoryMessageNovelBeatSyncTests(unittest.TestCase):
     def test_assistant_edit_reparses_visual_novel_beats(self) -> None:
         with self.Session() as db:
             user, game, character, message = self._seed_turn(db)
-            auth_patch, lock_patch, memory_patch = self._route_patches(user)
+            auth_patch, lock_patch, memory_patch = self._route_patches(user, game)
             with auth_patch, lock_patch, memory_patch:
                 story_messages_router.update_story_message(
                     game_id=game.id,
@@ -145,7 +145,7 @@ class StoryMessageNovelBeatSyncTests(unittest.TestCase):
                 ensure_ascii=False,
             )
             db.commit()
-            auth_patch, lock_patch, memory_patch = self._route_patches(user)
+            auth_patch, lock_patch, memory_patch = self._route_patches(user, game)
             with auth_patch, lock_patch, memory_patch:
                 story_messages_router.select_story_message_variant(
                     game_id=game.id,
@@ -164,7 +164,7 @@ class StoryMessageNovelBeatSyncTests(unittest.TestCase):
     def test_rpg_assistant_edit_keeps_cleanup_behavior(self) -> None:
         with self.Session() as db:
             user, game, _, message = self._seed_turn(db, game_mode="rpg")
-            auth_patch, lock_patch, memory_patch = self._route_patches(user)
+            auth_patch, lock_patch, memory_patch = self._route_patches(user, game)
             with auth_patch, lock_patch, memory_patch:
                 story_messages_router.update_story_message(
                     game_id=game.id,